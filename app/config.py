@@ -6,14 +6,121 @@ load_dotenv(dotenv_path=env_path)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MODEL_NAME = os.getenv("MODEL_NAME")
 
+# LLM 비동기 클라이언트 커넥션 풀 설정
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "200"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "50"))
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "30"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+
+# LLM 응답 캐시 설정 (저온도 호출에 한해 호출 단위로 활성화)
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.3"))
+
+# 답변 분석 실행 계획 설정
+WIKIPEDIA_LOOKUP_WORKERS = int(os.getenv("WIKIPEDIA_LOOKUP_WORKERS", "8"))
+WIKIPEDIA_CONTEXT_TIMEOUT_SECONDS = float(os.getenv("WIKIPEDIA_CONTEXT_TIMEOUT_SECONDS", "3"))
+ANALYSIS_SPECULATIVE_MODE = os.getenv("ANALYSIS_SPECULATIVE_MODE", "false").lower() == "true"
+ANALYSIS_SPECULATIVE_DELAY_SECONDS = float(os.getenv("ANALYSIS_SPECULATIVE_DELAY_SECONDS", "1"))
+
+# 위키피디아 캐시 설정 (WIKIPEDIA_CACHE_DB_PATH 지정 시 SQLite에 영속화되어 워커 간 공유)
+WIKIPEDIA_CACHE_MAX_ENTRIES = int(os.getenv("WIKIPEDIA_CACHE_MAX_ENTRIES", "5000"))
+WIKIPEDIA_CACHE_TTL_SECONDS = float(os.getenv("WIKIPEDIA_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+WIKIPEDIA_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv("WIKIPEDIA_NEGATIVE_CACHE_TTL_SECONDS", "600"))
+WIKIPEDIA_CACHE_DB_PATH = os.getenv("WIKIPEDIA_CACHE_DB_PATH")
+# 로컬 덤프로 생성한 오프라인 요약 인덱스 (python -m app.core.wikipedia_index 로 생성)
+WIKIPEDIA_INDEX_PATH = os.getenv("WIKIPEDIA_INDEX_PATH")
+
+# PII NER 모델 설정
+ENABLE_NER = os.getenv("ENABLE_NER", "true").lower() == "true"
+NER_MODEL_NAME = os.getenv("NER_MODEL_NAME", "FacebookAI/xlm-roberta-large-finetuned-conll03-english")
+NER_BACKEND = os.getenv("NER_BACKEND", "torch")  # torch / torch-int8 / onnx (onnx는 optimum[onnxruntime] 필요)
+# 선택한 백엔드의 선택 의존성이 없을 때 torch로 대체할지 여부 (false면 로드 실패로 처리)
+NER_BACKEND_FALLBACK = os.getenv("NER_BACKEND_FALLBACK", "true").lower() == "true"
+NER_ONNX_CACHE_DIR = os.getenv("NER_ONNX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "jemyeonso", "onnx"))
+# transformer: 전체 텍스트를 트랜스포머 NER / hybrid: Kiwi 형태소 분석으로 1차 탐지 후 불확실 구간만 트랜스포머 NER
+# (hybrid는 실제 이력서 기준 정밀도 측정 전까지 기본값으로 쓰지 않음)
+NER_STRATEGY = os.getenv("NER_STRATEGY", "transformer")
+# 동시 요청 NER 마이크로 배칭 (최대 배치 크기 / 첫 요청 이후 최대 대기 시간)
+NER_BATCH_MAX_SIZE = int(os.getenv("NER_BATCH_MAX_SIZE", "16"))
+NER_BATCH_MAX_WAIT_MS = float(os.getenv("NER_BATCH_MAX_WAIT_MS", "10"))
+# 모델 입력 한도(512 토큰)를 넘는 텍스트의 청크 분할 (특수 토큰 여유분 제외)
+NER_CHUNK_MAX_TOKENS = int(os.getenv("NER_CHUNK_MAX_TOKENS", "480"))
+NER_CHUNK_OVERLAP_TOKENS = int(os.getenv("NER_CHUNK_OVERLAP_TOKENS", "64"))
+NER_CHUNK_BATCH_SIZE = int(os.getenv("NER_CHUNK_BATCH_SIZE", "8"))
+# 사전 기반 PII 탐지 (<라벨>.txt 파일, 예: school.txt)
+PII_DICTIONARY_DIR = os.getenv("PII_DICTIONARY_DIR", os.path.join(os.path.dirname(__file__), "resume", "dictionaries"))
+NER_WARMUP = os.getenv("NER_WARMUP", "background")  # background: 기동 직후 백그라운드 로드 / lazy: 최초 사용 시 로드
+# 면접 API 전용 워커 (이력서/PII 라우터와 NER 모델을 로드하지 않음)
+INTERVIEW_ONLY = os.getenv("INTERVIEW_ONLY", "false").lower() == "true"
+
+# 이력서 PDF 다운로드 설정
+PDF_DOWNLOAD_MAX_BYTES = int(os.getenv("PDF_DOWNLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+PDF_DOWNLOAD_CONNECT_TIMEOUT_SECONDS = float(os.getenv("PDF_DOWNLOAD_CONNECT_TIMEOUT_SECONDS", "5"))
+PDF_DOWNLOAD_READ_TIMEOUT_SECONDS = float(os.getenv("PDF_DOWNLOAD_READ_TIMEOUT_SECONDS", "15"))
+PDF_DOWNLOAD_TOTAL_TIMEOUT_SECONDS = float(os.getenv("PDF_DOWNLOAD_TOTAL_TIMEOUT_SECONDS", "60"))
+PDF_DOWNLOAD_MAX_CONNECTIONS = int(os.getenv("PDF_DOWNLOAD_MAX_CONNECTIONS", "50"))
+# 이 크기를 넘는 PDF만 디스크 임시 파일로 내려쓰고, 그 이하는 메모리에서 바로 파싱
+PDF_SPOOL_MAX_MEMORY_BYTES = int(os.getenv("PDF_SPOOL_MAX_MEMORY_BYTES", str(8 * 1024 * 1024)))
+# PDF 텍스트 추출기 (pdfium: 빠른 기본 추출 후 품질이 낮은 페이지만 pdfplumber로 재추출 / pdfplumber: 전체 레이아웃 분석)
+PDF_EXTRACTOR = os.getenv("PDF_EXTRACTOR", "pdfium")
+# 페이지 수가 임계값 이상인 PDF는 프로세스 풀에서 페이지 구간별로 병렬 추출 (PDF_PARSE_WORKERS=0 이면 비활성화)
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+# 이력서 처리 백그라운드 작업 (동시 실행 수 / 최대 대기 작업 수 / 완료된 작업 상태 보관 시간)
+# 작업 상태는 워커 프로세스별 메모리에 있으므로, 여러 워커로 운영하면 작업 ID 접두어 기준 sticky 라우팅 필요
+RESUME_JOB_CONCURRENCY = int(os.getenv("RESUME_JOB_CONCURRENCY", "2"))
+RESUME_JOB_MAX_PENDING = int(os.getenv("RESUME_JOB_MAX_PENDING", "100"))
+RESUME_JOB_RESULT_TTL_SECONDS = float(os.getenv("RESUME_JOB_RESULT_TTL_SECONDS", "3600"))
+
+# 이력서 처리 결과 캐시 (PDF/추출 텍스트 SHA-256 기준, 같은 파일 재업로드 시 추출/NER 생략)
+RESUME_RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_RESULT_CACHE_MAX_ENTRIES", "1024"))
+RESUME_RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESUME_RESULT_CACHE_TTL_SECONDS", str(24 * 3600)))
+RESUME_RESULT_CACHE_MAX_BYTES = int(os.getenv("RESUME_RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# PII 감사 로그 배치 전송 (로컬 스풀에 모았다가 주기/크기 기준으로 gzip JSONL 객체 하나로 S3 업로드)
+PII_LOG_SPOOL_DIR = os.getenv("PII_LOG_SPOOL_DIR", os.path.join(os.path.expanduser("~"), ".cache", "jemyeonso", "pii-log-spool"))
+PII_LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("PII_LOG_FLUSH_INTERVAL_SECONDS", "60"))
+PII_LOG_BATCH_MAX_RECORDS = int(os.getenv("PII_LOG_BATCH_MAX_RECORDS", "500"))
+PII_LOG_BATCH_MAX_BYTES = int(os.getenv("PII_LOG_BATCH_MAX_BYTES", str(4 * 1024 * 1024)))
+PII_LOG_SPOOL_FSYNC = os.getenv("PII_LOG_SPOOL_FSYNC", "true").lower() == "true"
+PII_LOG_KEY_PREFIX = os.getenv("PII_LOG_KEY_PREFIX", "pii-logs/batches")
+
 # 데이터베이스 연결 설정
 URL = os.getenv("DB_URL")
+# 비동기 DB 커넥션 풀 (최소/최대 크기 / 커넥션 획득 대기 시간 / 이 시간 이상 유휴였던 커넥션은 ping 후 사용)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "5"))
+DB_POOL_HEALTH_CHECK_IDLE_SECONDS = float(os.getenv("DB_POOL_HEALTH_CHECK_IDLE_SECONDS", "30"))
+DB_CONNECT_TIMEOUT_SECONDS = float(os.getenv("DB_CONNECT_TIMEOUT_SECONDS", "5"))
+# 이력서 텍스트 캐시 (document_id 기준, 면접 질문 생성 시 DB 조회 생략 / 마스킹 본문 갱신·질문 캐시 삭제 시 무효화)
+RESUME_TEXT_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_TEXT_CACHE_MAX_ENTRIES", "1024"))
+RESUME_TEXT_CACHE_TTL_SECONDS = float(os.getenv("RESUME_TEXT_CACHE_TTL_SECONDS", "1800"))
+RESUME_TEXT_CACHE_MAX_BYTES = int(os.getenv("RESUME_TEXT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# 무효화는 프로세스 내 캐시에만 적용되므로, 이 시간이 지난 항목은 updated_at만 조회해 다른 워커(INTERVIEW_ONLY 등)에서의
+# 갱신 여부를 확인 (워커 간 최대 지연 시간, 0이면 캐시 적중 때마다 확인)
+RESUME_TEXT_CACHE_REVALIDATE_SECONDS = float(os.getenv("RESUME_TEXT_CACHE_REVALIDATE_SECONDS", "30"))
 
 # AWS S3 연결 설정
 REGION = os.getenv("AWS_REGION_STATIC")
 ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
 S3_BUCKET = os.getenv("S3_BUCKET_NAME")
 SECRET_KEY = os.getenv("AWS_SECRET_KEY")
+# 공유 S3 클라이언트 (커넥션 풀 크기 / 재시도 횟수 / 타임아웃 / TCP keepalive)
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))
+S3_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", "3"))
+S3_CONNECT_TIMEOUT_SECONDS = float(os.getenv("S3_CONNECT_TIMEOUT_SECONDS", "5"))
+S3_READ_TIMEOUT_SECONDS = float(os.getenv("S3_READ_TIMEOUT_SECONDS", "30"))
+S3_TCP_KEEPALIVE = os.getenv("S3_TCP_KEEPALIVE", "true").lower() == "true"
+# S3 멀티파트 업로드 (임계 크기 / 파트 크기 / 파트 동시 전송 수)
+S3_MULTIPART_THRESHOLD_BYTES = int(os.getenv("S3_MULTIPART_THRESHOLD_BYTES", str(8 * 1024 * 1024)))
+S3_MULTIPART_CHUNK_BYTES = int(os.getenv("S3_MULTIPART_CHUNK_BYTES", str(8 * 1024 * 1024)))
+S3_UPLOAD_MAX_CONCURRENCY = int(os.getenv("S3_UPLOAD_MAX_CONCURRENCY", "4"))
 
 # 필수 환경 변수 검증
 if not OPENAI_API_KEY:
@@ -0,0 +1,231 @@
+"""
+mysql.connector.aio 기반 비동기 MySQL 커넥션 풀
+
+- 최소/최대 크기, 커넥션 획득 타임아웃, 최대 크기 도달 시 대기열 (PoolError 대신 대기 후 PoolTimeoutError)
+- 일정 시간 이상 유휴였던 커넥션은 빌려주기 전에 ping으로 상태 확인, 끊긴 커넥션은 폐기 후 새로 연결
+- 대기 시간과 사용률 지표 제공 (GET /health/db)
+
+세션 변수를 쓰지 않으므로 반납 시 세션 초기화(pool_reset_session)는 생략해 왕복 1회를 줄입니다.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, Optional, Tuple
+from app.config import (
+    DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_ACQUIRE_TIMEOUT_SECONDS, DB_POOL_HEALTH_CHECK_IDLE_SECONDS,
+    DB_CONNECT_TIMEOUT_SECONDS
+)
+from app.core.mysql_database import mysql_config
+
+
+class PoolTimeoutError(Exception):
+    """획득 타임아웃 안에 커넥션을 얻지 못함"""
+
+
+async def _default_connect(**config):
+    from mysql.connector.aio import connect
+    return await connect(**config)
+
+
+class AsyncMySQLPool:
+    def __init__(self, config: Dict, min_size: int = DB_POOL_MIN_SIZE, max_size: int = DB_POOL_MAX_SIZE,
+                 acquire_timeout: float = DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+                 health_check_idle_seconds: float = DB_POOL_HEALTH_CHECK_IDLE_SECONDS,
+                 connect: Optional[Callable] = None):
+        self._config = config
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_idle_seconds = health_check_idle_seconds
+        self._connect = connect or _default_connect
+        self._idle: Deque[Tuple[object, float]] = deque()
+        self._size = 0  # 열려 있거나 연결 중인 커넥션 수
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        # 지표
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._waiting = 0
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._created = 0
+        self._discarded = 0
+
+    def _condition(self) -> asyncio.Condition:
+        # 커넥션과 Condition은 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 클라이언트 등) 상태를 새로 시작
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+            self._idle.clear()
+            self._size = self._in_use = self._waiting = 0
+        return self._cond
+
+    async def _open(self):
+        conn = await self._connect(**self._config, connect_timeout=int(DB_CONNECT_TIMEOUT_SECONDS))
+        self._created += 1
+        return conn
+
+    async def _close_quietly(self, conn) -> None:
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+    async def _is_healthy(self, conn, last_used: float) -> bool:
+        if time.monotonic() - last_used < self.health_check_idle_seconds:
+            return True
+        try:
+            await conn.ping()
+            return True
+        except Exception:
+            return False
+
+    async def start(self) -> None:
+        """최소 크기만큼 미리 연결 (실패해도 요청 시 다시 연결 시도)"""
+        self._closed = False
+        cond = self._condition()
+        while self._size < self.min_size:
+            self._size += 1
+            try:
+                conn = await self._open()
+            except BaseException as e:
+                self._size -= 1
+                if not isinstance(e, Exception):
+                    raise
+                print(f"❌ 비동기 DB 커넥션 풀 초기화 실패: {e}")
+                return
+            self._idle.append((conn, time.monotonic()))
+            await self._notify_waiter(cond)
+
+    async def _get(self):
+        cond = self._condition()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.acquire_timeout
+        while True:
+            async with cond:
+                if self._closed:
+                    raise PoolTimeoutError("커넥션 풀이 닫혔습니다")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(f"DB 커넥션 획득 시간 초과 ({self.acquire_timeout}s)")
+                    self._waiting += 1
+                    try:
+                        await asyncio.wait_for(cond.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._waiting -= 1
+
+                if self._idle:
+                    # 가장 최근에 반납된 커넥션부터 사용 (오래 유휴인 커넥션은 서버 쪽에서 끊겼을 가능성이 높음)
+                    conn, last_used = self._idle.pop()
+                else:
+                    conn, last_used = None, 0.0
+                    self._size += 1
+
+            if conn is None:
+                try:
+                    return await self._open()
+                except BaseException:
+                    # 연결 실패나 취소 시 예약한 자리를 await 전에 반납해 크기 집계가 새지 않도록 함
+                    self._size -= 1
+                    await self._notify_waiter(cond)
+                    raise
+
+            try:
+                healthy = await self._is_healthy(conn, last_used)
+            except BaseException:
+                # 상태 확인 중 취소된 커넥션은 상태를 알 수 없으므로 폐기
+                await self._discard(conn)
+                raise
+            if healthy:
+                return conn
+            await self._discard(conn)
+
+    async def _notify_waiter(self, cond: asyncio.Condition) -> None:
+        async with cond:
+            cond.notify()
+
+    async def _discard(self, conn) -> None:
+        # 자리 반납은 await 전에 처리 (닫는 도중 취소되어도 크기 집계 유지)
+        cond = self._condition()
+        self._size -= 1
+        self._discarded += 1
+        await self._notify_waiter(cond)
+        await self._close_quietly(conn)
+
+    async def _release(self, conn, broken: bool) -> None:
+        cond = self._condition()
+        if broken or self._closed:
+            await self._discard(conn)
+            return
+        self._idle.append((conn, time.monotonic()))
+        await self._notify_waiter(cond)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """커넥션을 빌려 쓰고 반납 (타임아웃 안에 얻지 못하면 PoolTimeoutError)"""
+        started = time.monotonic()
+        conn = await self._get()
+        waited = time.monotonic() - started
+        self._acquisitions += 1
+        self._total_wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        self._in_use += 1
+        self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+        # 정상 종료가 아니면(예외, 요청 취소 포함) 쿼리 도중일 수 있어 상태를 알 수 없으므로 재사용하지 않음
+        broken = True
+        try:
+            yield conn
+            broken = False
+        finally:
+            self._in_use -= 1
+            await self._release(conn, broken)
+
+    async def close(self) -> None:
+        """유휴 커넥션을 모두 닫고 이후 획득 요청을 거부"""
+        self._closed = True
+        if self._cond is None or self._loop is not asyncio.get_running_loop():
+            return
+        async with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            await self._close_quietly(conn)
+
+    def get_stats(self) -> Dict:
+        return {
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'size': self._size,
+            'idle': len(self._idle),
+            'in_use': self._in_use,
+            'peak_in_use': self._peak_in_use,
+            'utilization': round(self._in_use / self.max_size, 4) if self.max_size else 0.0,
+            'waiting': self._waiting,
+            'acquisitions': self._acquisitions,
+            'timeouts': self._timeouts,
+            'avg_wait_ms': round(self._total_wait_seconds / self._acquisitions * 1000, 3) if self._acquisitions else 0.0,
+            'max_wait_ms': round(self._max_wait_seconds * 1000, 3),
+            'connections_created': self._created,
+            'connections_discarded': self._discarded
+        }
+
+
+# 전역 비동기 커넥션 풀 (싱글톤, 커넥션은 첫 사용 또는 앱 시작 시 생성)
+async_pool = AsyncMySQLPool(mysql_config)
+
+
+async def close_async_pool():
+    """앱 종료 시 커넥션 정리"""
+    await async_pool.close()
@@ -1,9 +1,192 @@
-from openai import OpenAI
-from app.config import OPENAI_API_KEY, MODEL_NAME
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Awaitable, Callable, Dict, Optional
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
+from app.config import (
+    OPENAI_API_KEY, MODEL_NAME,
+    LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE_CONNECTIONS, LLM_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_TIMEOUT_SECONDS, LLM_CONNECT_TIMEOUT_SECONDS,
+    LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_BYTES, LLM_CACHE_MAX_TEMPERATURE
+)
+from app.core.ttl_cache import TTLCache
+
+LLM_ERROR_MESSAGE = "질문 생성 중 오류가 발생했습니다."
 
 client = OpenAI(api_key=OPENAI_API_KEY)
 
-def call_llm(prompt: str, temperature: float = 0.7, max_tokens: int = 512, system_role: str = "당신은 면접관입니다.") -> str:
+# 이벤트 루프에서 공유하는 비동기 클라이언트 (httpx 커넥션 풀 재사용)
+async_client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS
+        ),
+        timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS)
+    )
+)
+
+
+def make_request_key(prompt: str, temperature: float, max_tokens: int, system_role: str) -> str:
+    """모델, 시스템 역할, 프롬프트, temperature, max_tokens를 SHA-256으로 해싱"""
+    payload = json.dumps(
+        [MODEL_NAME, system_role, prompt, temperature, max_tokens],
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """결정적(저온도) 프롬프트에 대한 LLM 응답 캐시 (요청 내용 해시 기반)"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+                 max_bytes: int = LLM_CACHE_MAX_BYTES, max_temperature: float = LLM_CACHE_MAX_TEMPERATURE):
+        self._cache = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            sizeof=lambda value: len(value.encode("utf-8"))
+        )
+        self._max_temperature = max_temperature
+
+    def is_cacheable(self, temperature: float) -> bool:
+        return temperature <= self._max_temperature
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, response: str) -> None:
+        # 오류 응답은 캐싱하지 않음
+        if response and response != LLM_ERROR_MESSAGE:
+            self._cache.set(key, response)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get_stats(self) -> Dict:
+        stats = self._cache.get_stats()
+        stats['max_temperature'] = self._max_temperature
+        return stats
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """동일 키로 동시에 들어온 요청을 하나의 업스트림 호출로 합치는 관리자 (동기/비동기 겸용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], str]) -> str:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def ado(self, key: str, coro_fn: Callable[[], Awaitable[str]]) -> str:
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            # 업스트림 호출은 별도 태스크로 실행 → 한 호출자가 취소되어도 나머지는 결과를 받음
+            task = asyncio.ensure_future(coro_fn())
+            self._tasks[key] = task
+
+            def _release(done_task: asyncio.Task) -> None:
+                if self._tasks.get(key) is done_task:
+                    del self._tasks[key]
+
+            task.add_done_callback(_release)
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict:
+        return {
+            'inflight_requests': len(self._calls) + len(self._tasks),
+            'coalesced_requests': self._coalesced
+        }
+
+
+# 전역 응답 캐시 / 요청 병합 인스턴스 (싱글톤)
+llm_response_cache = LLMResponseCache()
+llm_single_flight = SingleFlight()
+
+
+def get_llm_cache_stats() -> Dict:
+    stats = llm_response_cache.get_stats()
+    stats.update(llm_single_flight.get_stats())
+    return stats
+
+
+def _build_messages(prompt: str, system_role: str) -> list:
+    return [
+        {"role": "system", "content": system_role},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _request_llm(prompt: str, temperature: float, max_tokens: int, system_role: str) -> str:
+    try:
+        response = client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=_build_messages(prompt, system_role),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print("❌ LLM 호출 실패:", e)
+        return LLM_ERROR_MESSAGE
+
+
+async def _arequest_llm(prompt: str, temperature: float, max_tokens: int, system_role: str) -> str:
+    try:
+        response = await async_client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=_build_messages(prompt, system_role),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print("❌ LLM 호출 실패:", e)
+        return LLM_ERROR_MESSAGE
+
+
+def call_llm(prompt: str, temperature: float = 0.7, max_tokens: int = 512, system_role: str = "당신은 면접관입니다.",
+             use_cache: bool = False, coalesce: bool = True) -> str:
     """
     LLM을 호출하여 응답을 반환합니다.
 
@@ -12,21 +195,66 @@ def call_llm(prompt: str, temperature: float = 0.7, max_tokens: int = 512, syste
         temperature (float): 출력 다양성 조절 (0.0 ~ 1.5)
         max_tokens (int): 최대 출력 토큰 수
         system_role (str): 시스템 역할 (기본: 면접관)
+        use_cache (bool): 응답 캐시 사용 여부 (LLM_CACHE_MAX_TEMPERATURE 이하에서만 적용)
+        coalesce (bool): 동일한 요청이 동시에 진행 중이면 그 결과를 공유
 
     Returns:
         str: 모델이 생성한 응답 문자열
     """
-    try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": system_role},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print("❌ LLM 호출 실패:", e)
-        return "질문 생성 중 오류가 발생했습니다."
+    cache_enabled = use_cache and llm_response_cache.is_cacheable(temperature)
+    if not (cache_enabled or coalesce):
+        return _request_llm(prompt, temperature, max_tokens, system_role)
+
+    key = make_request_key(prompt, temperature, max_tokens, system_role)
+    if cache_enabled:
+        cached_response = llm_response_cache.get(key)
+        if cached_response is not None:
+            return cached_response
+
+    def fetch() -> str:
+        result = _request_llm(prompt, temperature, max_tokens, system_role)
+        if cache_enabled:
+            llm_response_cache.set(key, result)
+        return result
+
+    return llm_single_flight.do(key, fetch) if coalesce else fetch()
+
+
+async def acall_llm(prompt: str, temperature: float = 0.7, max_tokens: int = 512, system_role: str = "당신은 면접관입니다.",
+                    use_cache: bool = False, coalesce: bool = True) -> str:
+    """
+    call_llm의 비동기 버전. 스레드풀 워커를 점유하지 않고 이벤트 루프에서 LLM을 호출합니다.
+
+    Args:
+        prompt (str): 사용자 입력 프롬프트
+        temperature (float): 출력 다양성 조절 (0.0 ~ 1.5)
+        max_tokens (int): 최대 출력 토큰 수
+        system_role (str): 시스템 역할 (기본: 면접관)
+        use_cache (bool): 응답 캐시 사용 여부 (LLM_CACHE_MAX_TEMPERATURE 이하에서만 적용)
+        coalesce (bool): 동일한 요청이 동시에 진행 중이면 그 결과를 공유
+
+    Returns:
+        str: 모델이 생성한 응답 문자열
+    """
+    cache_enabled = use_cache and llm_response_cache.is_cacheable(temperature)
+    if not (cache_enabled or coalesce):
+        return await _arequest_llm(prompt, temperature, max_tokens, system_role)
+
+    key = make_request_key(prompt, temperature, max_tokens, system_role)
+    if cache_enabled:
+        cached_response = llm_response_cache.get(key)
+        if cached_response is not None:
+            return cached_response
+
+    async def fetch() -> str:
+        result = await _arequest_llm(prompt, temperature, max_tokens, system_role)
+        if cache_enabled:
+            llm_response_cache.set(key, result)
+        return result
+
+    return await llm_single_flight.ado(key, fetch) if coalesce else await fetch()
+
+
+async def close_llm_clients():
+    """앱 종료 시 공유 커넥션 풀 정리"""
+    await async_client.close()
@@ -1,7 +1,61 @@
-from app.core.mysql_database import get_connection
-from typing import Optional
+import threading
+import time
+from app.core.async_mysql import async_pool
+from app.core.ttl_cache import TTLCache
+from app.config import (
+    RESUME_TEXT_CACHE_MAX_ENTRIES, RESUME_TEXT_CACHE_TTL_SECONDS, RESUME_TEXT_CACHE_MAX_BYTES,
+    RESUME_TEXT_CACHE_REVALIDATE_SECONDS
+)
+from typing import Dict, Optional, Tuple
 
-def update_redacted_resume_content(document_id: int, redacted_text: str) -> bool:
+RESUME_TEXT_QUERY = "SELECT content, updated_at FROM documents WHERE id = %s AND type = 'resume'"
+RESUME_UPDATED_AT_QUERY = "SELECT updated_at FROM documents WHERE id = %s AND type = 'resume'"
+
+# 이력서 텍스트 read-through 캐시 (면접 세션 동안 같은 이력서를 반복 조회하므로 DB 조회를 생략)
+# 항목: (본문, updated_at, 마지막 확인 시각)
+resume_text_cache = TTLCache(
+    max_entries=RESUME_TEXT_CACHE_MAX_ENTRIES,
+    ttl_seconds=RESUME_TEXT_CACHE_TTL_SECONDS,
+    max_bytes=RESUME_TEXT_CACHE_MAX_BYTES,
+    sizeof=lambda entry: len(entry[0].encode("utf-8"))
+)
+# 무효화 세대: 조회 시작 후 무효화가 있었으면 조회 결과(이전 본문)를 캐시에 다시 넣지 않음
+_resume_text_generation = 0
+_resume_text_generation_lock = threading.Lock()
+
+def _resume_cache_key(document_id) -> str:
+    # 질문 생성은 문자열, 이력서 처리는 정수 ID를 쓰므로 문자열로 통일
+    return str(document_id)
+
+def invalidate_resume_text(document_id) -> bool:
+    """캐시된 이력서 텍스트 삭제 (삭제된 항목이 있으면 True)"""
+    global _resume_text_generation
+    with _resume_text_generation_lock:
+        _resume_text_generation += 1
+    return resume_text_cache.delete(_resume_cache_key(document_id))
+
+def _cached_resume_text(document_id) -> Tuple[Optional[str], Optional[Tuple]]:
+    # (바로 쓸 수 있는 본문, updated_at 확인이 필요한 항목) 반환
+    entry = resume_text_cache.get(_resume_cache_key(document_id))
+    if entry is None:
+        return None, None
+    if time.monotonic() - entry[2] < RESUME_TEXT_CACHE_REVALIDATE_SECONDS:
+        return entry[0], None
+    return None, entry
+
+def _store_resume_text(document_id, text: Optional[str], updated_at, generation: int) -> None:
+    # 아직 업로드되지 않은 이력서(None)는 캐시하지 않음
+    if text is None:
+        return
+    with _resume_text_generation_lock:
+        if generation == _resume_text_generation:
+            resume_text_cache.set(_resume_cache_key(document_id), (text, updated_at, time.monotonic()))
+
+def get_resume_text_cache_stats() -> Dict:
+    return resume_text_cache.get_stats()
+
+# 비동기 커넥션 풀 사용 (스레드풀과 고정 크기 풀의 PoolError 없이 대기열에서 커넥션을 기다림)
+async def aupdate_redacted_resume_content(document_id: int, redacted_text: str) -> bool:
     """
     기존 documents 테이블에서 content를 redacted_text로 업데이트합니다.
 
@@ -17,36 +71,43 @@ def update_redacted_resume_content(document_id: int, redacted_text: str) -> bool
         SET content = %s, updated_at = NOW()
         WHERE id = %s AND type = 'resume'
     """
-    params = (redacted_text, document_id)
-
-    conn = get_connection()
-    if not conn:
-        return False
     try:
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        conn.commit()
+        async with async_pool.acquire() as conn:
+            try:
+                async with await conn.cursor() as cursor:
+                    await cursor.execute(query, (redacted_text, document_id))
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        invalidate_resume_text(document_id)
         return True
     except Exception as e:
         print("❌ content 업데이트 실패:", e)
-        conn.rollback()
         return False
-    finally:
-        cursor.close()
-        conn.close()
-
-def get_resume_text(document_id: str) -> Optional[str]:
-    query = "SELECT content FROM documents WHERE id = %s AND type = 'resume'"
-    conn = get_connection()
-    if not conn:
-        return None
+
+async def aget_resume_text(document_id: str) -> Optional[str]:
+    """이력서 본문 조회 (캐시 적중 시 DB 조회 생략, 없는 이력서는 None)"""
+    text, stale = _cached_resume_text(document_id)
+    if text is not None:
+        return text
+
+    generation = _resume_text_generation
     try:
-        with conn.cursor() as cursor:
-            cursor.execute(query, (document_id,))
-            row = cursor.fetchone()
-            return row[0] if row else None
+        async with async_pool.acquire() as conn:
+            async with await conn.cursor() as cursor:
+                if stale is not None:
+                    await cursor.execute(RESUME_UPDATED_AT_QUERY, (document_id,))
+                    row = await cursor.fetchone()
+                    if row and row[0] == stale[1]:
+                        _store_resume_text(document_id, stale[0], stale[1], generation)
+                        return stale[0]
+                await cursor.execute(RESUME_TEXT_QUERY, (document_id,))
+                row = await cursor.fetchone()
     except Exception as e:
         print("❌ 이력서 조회 실패:", e)
         return None
-    finally:
-        conn.close()
+
+    text, updated_at = row if row else (None, None)
+    _store_resume_text(document_id, text, updated_at, generation)
+    return text
@@ -1,4 +1,5 @@
 import re
+from dataclasses import dataclass
 from typing import Dict, List
 
 PII_PATTERNS = {
@@ -17,11 +18,57 @@ PII_PATTERNS = {
     "health_insurance": r"\b\d{6}[-]?\d{7}|\d{10,13}\b"
 }
 
-def detect_regex_pii(text: str) -> Dict[str, List[str]]:
+# 같은 위치에서 여러 패턴이 일치하면 앞선 항목이 우선 (예: 주민번호 > 건강보험번호, 휴대폰 > 건강보험번호)
+# 항목을 첫 글자 종류별로 묶어, 각 위치에서 전방탐색 한 번으로 해당 묶음의 패턴만 시도
+# 이메일은 숫자로 시작할 수 있으므로 가장 먼저 시도 (01012345678@naver.com 이 휴대폰으로 잘리지 않도록)
+PII_SCAN_GROUPS = (
+    ("[A-Za-z0-9._%+-]", ("email",)),
+    ("[0-9+]", ("ssn", "driver_license", "card", "phone", "health_insurance")),
+    ("[A-Za-z]", ("passport", "url")),
+    ("[가-힣]", ("birth", "name", "road_address", "jibeon_address", "school")),
+)
+PII_SCAN_ORDER = tuple(label for _, labels in PII_SCAN_GROUPS for label in labels)
+
+# 전체 매치 대신 내부 그룹을 값으로 사용하는 항목
+_VALUE_GROUPS = {"birth": 1}
+
+_COMPILED_PATTERNS = {label: re.compile(pattern) for label, pattern in PII_PATTERNS.items()}
+# 모든 항목을 이름 있는 그룹의 대안으로 묶어 한 번의 스캔으로 탐지
+_COMBINED_PATTERN = re.compile("|".join(
+    f"(?={first_chars})(?:" + "|".join(f"(?P<{label}>{PII_PATTERNS[label]})" for label in labels) + ")"
+    for first_chars, labels in PII_SCAN_GROUPS
+))
+
+
+@dataclass(frozen=True)
+class PIISpan:
+    label: str
+    value: str
+    start: int
+    end: int
+
 
+def scan_pii(text: str) -> List[PIISpan]:
+    """텍스트를 한 번 스캔하여 겹치지 않는 PII 스팬을 위치 순으로 반환"""
+    spans = []
+    for match in _COMBINED_PATTERN.finditer(text):
+        label = match.lastgroup
+        group = _VALUE_GROUPS.get(label)
+        if group is None:
+            spans.append(PIISpan(label, match.group(label), match.start(label), match.end(label)))
+            continue
+
+        inner = _COMPILED_PATTERNS[label].match(text, match.start(label), match.end(label))
+        spans.append(PIISpan(label, inner.group(group), inner.start(group), inner.end(group)))
+    return spans
+
+
+def group_pii_spans(spans: List[PIISpan]) -> Dict[str, List[str]]:
     detected = {}
-    for label, pattern in PII_PATTERNS.items():
-        matches = re.findall(pattern, text)
-        if matches:
-            detected[label] = list(set(matches))  # 중복 제거
-    return detected
+    for span in spans:
+        detected.setdefault(span.label, {})[span.value] = None  # 중복 제거 (첫 등장 순서 유지)
+    return {label: list(values) for label, values in detected.items()}
+
+
+def detect_regex_pii(text: str) -> Dict[str, List[str]]:
+    return group_pii_spans(scan_pii(text))
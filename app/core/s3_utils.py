@@ -1,14 +1,60 @@
 import mimetypes
-import boto3
-from app.config import REGION, ACCESS_KEY, SECRET_KEY, S3_BUCKET
-
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id= ACCESS_KEY,
-    aws_secret_access_key=SECRET_KEY,
-    region_name=REGION
+import threading
+from functools import lru_cache
+from app.config import (
+    REGION, ACCESS_KEY, SECRET_KEY, S3_BUCKET,
+    S3_MULTIPART_THRESHOLD_BYTES, S3_MULTIPART_CHUNK_BYTES, S3_UPLOAD_MAX_CONCURRENCY,
+    S3_MAX_POOL_CONNECTIONS, S3_MAX_ATTEMPTS, S3_CONNECT_TIMEOUT_SECONDS, S3_READ_TIMEOUT_SECONDS, S3_TCP_KEEPALIVE
 )
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    앱 전체에서 공유하는 S3 클라이언트 (최초 사용 시 생성)
+
+    boto3 클라이언트는 스레드 안전하므로 하나의 자격 증명 조회와 커넥션 풀을 모든 모듈이 재사용합니다.
+    boto3 import와 서비스 모델 로드도 실제로 S3를 쓸 때까지 미뤄 앱 import 시간을 줄입니다.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+                from botocore.config import Config
+
+                session = boto3.session.Session(
+                    aws_access_key_id=ACCESS_KEY,
+                    aws_secret_access_key=SECRET_KEY,
+                    region_name=REGION
+                )
+                _s3_client = session.client("s3", config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "standard"},
+                    connect_timeout=S3_CONNECT_TIMEOUT_SECONDS,
+                    read_timeout=S3_READ_TIMEOUT_SECONDS,
+                    tcp_keepalive=S3_TCP_KEEPALIVE
+                ))
+    return _s3_client
+
+
+@lru_cache(maxsize=None)
+def get_transfer_config():
+    """멀티파트 업로드 설정 (업로드당 메모리는 파트 크기 × 동시 전송 수로 고정)"""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize=S3_MULTIPART_CHUNK_BYTES,
+        # 파트 동시 전송 스레드가 공유 커넥션 풀을 넘지 않도록 제한
+        max_concurrency=min(S3_UPLOAD_MAX_CONCURRENCY, S3_MAX_POOL_CONNECTIONS)
+    )
+
+def _guess_content_type(object_key: str) -> str:
+    content_type, _ = mimetypes.guess_type(object_key)
+    return content_type or "application/octet-stream"  # fallback
+
 def upload_file_to_s3(file_bytes: bytes, object_key: str, content_type: str = None) -> bool:
     """
     S3 버킷에 파일 업로드 (PDF, JSON 등 제한 없음)
@@ -19,12 +65,10 @@ def upload_file_to_s3(file_bytes: bytes, object_key: str, content_type: str = No
     :return: 업로드 성공 여부
     """
     if content_type is None:
-        content_type, _ = mimetypes.guess_type(object_key)
-        if content_type is None:
-            content_type = "application/octet-stream"  # fallback
+        content_type = _guess_content_type(object_key)
 
     try:
-        s3.put_object(
+        get_s3_client().put_object(
             Bucket=S3_BUCKET,
             Key=object_key,
             Body=file_bytes,
@@ -36,9 +80,35 @@ def upload_file_to_s3(file_bytes: bytes, object_key: str, content_type: str = No
         print(f"❌ S3 업로드 실패: {e}")
         return False
 
+def upload_fileobj_to_s3(file_obj, object_key: str, content_type: str = None) -> bool:
+    """
+    파일 객체를 청크 단위로 읽어 S3에 스트리밍 업로드 (임계 크기 이상은 멀티파트 업로드, 블로킹 호출)
+
+    :param file_obj: 읽기 가능한 바이너리 파일 객체 (예: UploadFile.file)
+    :param object_key: S3 내 저장 경로
+    :param content_type: MIME 타입 — 생략 시 자동 추정
+    :return: 업로드 성공 여부
+    """
+    if content_type is None:
+        content_type = _guess_content_type(object_key)
+
+    try:
+        get_s3_client().upload_fileobj(
+            Fileobj=file_obj,
+            Bucket=S3_BUCKET,
+            Key=object_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=get_transfer_config()
+        )
+        print(f"✅ S3 업로드 성공: s3://{S3_BUCKET}/{object_key}")
+        return True
+    except Exception as e:
+        print(f"❌ S3 업로드 실패: {e}")
+        return False
+
 def test_s3_connection() -> bool:
     try:
-        s3.list_buckets()
+        get_s3_client().list_buckets()
         return True
     except Exception as e:
         print("❌ S3 연결 실패:", e)
@@ -46,7 +116,7 @@ def test_s3_connection() -> bool:
 
 def test_bucket_access(bucket_name: str) -> bool:
     try:
-        s3.head_bucket(Bucket=bucket_name)
+        get_s3_client().head_bucket(Bucket=bucket_name)
         return True
     except Exception as e:
         print(f"❌ 버킷 접근 실패 ({bucket_name}):", e)
@@ -0,0 +1,109 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """LRU + TTL 기반 메모리 캐시 (스레드 안전, 선택적 메모리 상한)"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600,
+                 max_bytes: Optional[int] = None, sizeof: Callable[[Any], int] = sys.getsizeof):
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self._total_bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값 조회 (만료된 항목은 삭제 후 miss 처리)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if time.monotonic() > expires_at:
+                self._remove(key)
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """값 저장 (항목 수/메모리 상한 초과 시 가장 오래 사용되지 않은 항목부터 제거)"""
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        size = self._sizeof(value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + ttl, size)
+            self._total_bytes += size
+
+            while self._data and (
+                len(self._data) > self._max_entries
+                or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+            ):
+                oldest_key = next(iter(self._data))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+                return True
+            return False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._total_bytes = 0
+
+    def cleanup_expired(self) -> int:
+        """만료된 항목 정리"""
+        with self._lock:
+            now = time.monotonic()
+            expired_keys = [key for key, (_, expires_at, _) in self._data.items() if now > expires_at]
+            for key in expired_keys:
+                self._remove(key)
+            return len(expired_keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and time.monotonic() <= entry[1]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._data),
+                'max_entries': self._max_entries,
+                'total_bytes': self._total_bytes,
+                'max_bytes': self._max_bytes,
+                'ttl_seconds': self._ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': self._evictions
+            }
@@ -0,0 +1,230 @@
+"""
+로컬 위키피디아 요약(abstract) 덤프로부터 mmap 기반 제목/리다이렉트 → 요약 인덱스를 생성하고 조회합니다.
+
+빌드:
+    python -m app.core.wikipedia_index kowiki-latest-abstract.xml.gz wikipedia.idx --redirects redirects.tsv
+
+redirects.tsv 는 "원본 제목<TAB>대상 제목" 형식의 한 줄 한 리다이렉트 파일입니다.
+"""
+import argparse
+import difflib
+import gzip
+import mmap
+import re
+import struct
+import unicodedata
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+INDEX_MAGIC = b"WKIDX\x00\x01\x00"
+_HEADER = struct.Struct("<8sIQQQ")   # magic, key_count, table_offset, keys_offset, records_offset
+_TABLE_ENTRY = struct.Struct("<QIQ")  # key_pos, key_len, record_pos
+_RECORD_HEADER = struct.Struct("<III")  # title_len, url_len, summary_len
+
+SUMMARY_MAX_LENGTH = 500
+FUZZY_NEIGHBORHOOD = 32
+FUZZY_CUTOFF = 0.8
+
+_IGNORED_CHARS = re.compile(r"[\s_\-·]+")
+
+
+def normalize_title(title: str) -> str:
+    """대소문자, 공백/밑줄/하이픈, 유니코드 정규화 차이를 무시하는 조회 키"""
+    normalized = unicodedata.normalize("NFKC", title).casefold()
+    return _IGNORED_CHARS.sub("", normalized)
+
+
+def truncate_summary(summary_text: str) -> str:
+    """요약문을 최대 500자로 자르되, 가능하면 문장 단위로 자름"""
+    if len(summary_text) > SUMMARY_MAX_LENGTH:
+        truncated = summary_text[:SUMMARY_MAX_LENGTH]
+        last_period = truncated.rfind('.')
+        if last_period > 200:  # Ensure we have substantial content
+            return truncated[:last_period + 1]
+        return truncated + "..."
+    return summary_text
+
+
+def _open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_abstract_dump(dump_path: str) -> Iterator[Tuple[str, str, str]]:
+    """abstract 덤프(<doc><title/><url/><abstract/></doc>)에서 (제목, URL, 요약)을 순회"""
+    with _open_text(dump_path) as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag != "doc":
+                continue
+
+            url = (elem.findtext("url") or "").strip()
+            abstract = (elem.findtext("abstract") or "").strip()
+            # 덤프의 <title>에는 "Wikipedia: " 류의 접두어가 붙으므로 URL 경로에서 제목을 복원
+            title = unquote(url.rsplit("/", 1)[-1]).replace("_", " ") if url else (elem.findtext("title") or "")
+            elem.clear()
+
+            if title and abstract:
+                yield title.strip(), url, abstract
+
+
+def iter_redirects(redirects_path: str) -> Iterator[Tuple[str, str]]:
+    with open(redirects_path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) == 2 and parts[0] and parts[1]:
+                yield parts[0], parts[1]
+
+
+def build_index(dump_path: str, output_path: str, redirects_path: Optional[str] = None) -> int:
+    """덤프에서 인덱스 파일을 생성하고 등록된 키 수를 반환"""
+    records: List[Tuple[str, str, str]] = []
+    key_to_record: Dict[str, int] = {}
+
+    for title, url, abstract in iter_abstract_dump(dump_path):
+        key = normalize_title(title)
+        if key and key not in key_to_record:
+            key_to_record[key] = len(records)
+            records.append((title, url, truncate_summary(abstract)))
+
+    if redirects_path:
+        for source, target in iter_redirects(redirects_path):
+            source_key, target_key = normalize_title(source), normalize_title(target)
+            # 실제 문서 제목이 리다이렉트보다 우선
+            if source_key and source_key not in key_to_record and target_key in key_to_record:
+                key_to_record[source_key] = key_to_record[target_key]
+
+    record_blob = bytearray()
+    record_positions = []
+    for title, url, summary in records:
+        record_positions.append(len(record_blob))
+        encoded = [value.encode("utf-8") for value in (title, url, summary)]
+        record_blob += _RECORD_HEADER.pack(*(len(value) for value in encoded))
+        record_blob += b"".join(encoded)
+
+    sorted_keys = sorted(key_to_record, key=lambda k: k.encode("utf-8"))
+    key_blob = bytearray()
+    table = bytearray()
+    for key in sorted_keys:
+        encoded_key = key.encode("utf-8")
+        table += _TABLE_ENTRY.pack(len(key_blob), len(encoded_key), record_positions[key_to_record[key]])
+        key_blob += encoded_key
+
+    table_offset = _HEADER.size
+    keys_offset = table_offset + len(table)
+    records_offset = keys_offset + len(key_blob)
+
+    with open(output_path, "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, len(sorted_keys), table_offset, keys_offset, records_offset))
+        f.write(table)
+        f.write(key_blob)
+        f.write(record_blob)
+
+    return len(sorted_keys)
+
+
+class WikipediaIndex:
+    """mmap으로 여는 읽기 전용 요약 인덱스 (프로세스 간 페이지 캐시 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._table_offset, self._keys_offset, self._records_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"Invalid Wikipedia index file: {path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int) -> Tuple[int, int, int]:
+        return _TABLE_ENTRY.unpack_from(self._mm, self._table_offset + i * _TABLE_ENTRY.size)
+
+    def _key_at(self, i: int) -> bytes:
+        key_pos, key_len, _ = self._entry(i)
+        start = self._keys_offset + key_pos
+        return self._mm[start:start + key_len]
+
+    def _record_at(self, i: int) -> Dict[str, str]:
+        _, _, record_pos = self._entry(i)
+        start = self._records_offset + record_pos
+        title_len, url_len, summary_len = _RECORD_HEADER.unpack_from(self._mm, start)
+        start += _RECORD_HEADER.size
+        title = self._mm[start:start + title_len].decode("utf-8")
+        start += title_len
+        url = self._mm[start:start + url_len].decode("utf-8")
+        start += url_len
+        summary = self._mm[start:start + summary_len].decode("utf-8")
+        return {"title": title, "extract": summary, "url": url}
+
+    def _bisect(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lookup(self, title: str) -> Optional[Dict[str, str]]:
+        """정규화된 제목/리다이렉트 정확 일치 조회"""
+        key = normalize_title(title).encode("utf-8")
+        if not key or not self._count:
+            return None
+        i = self._bisect(key)
+        if i < self._count and self._key_at(i) == key:
+            return self._record_at(i)
+        return None
+
+    def fuzzy_lookup(self, query: str, cutoff: float = FUZZY_CUTOFF) -> Optional[Dict[str, str]]:
+        """정렬 순서상 인접한 키들 중 유사도가 가장 높은 문서를 반환"""
+        exact = self.lookup(query)
+        if exact or not self._count:
+            return exact
+
+        key = normalize_title(query)
+        if not key:
+            return None
+        pos = self._bisect(key.encode("utf-8"))
+        start, end = max(0, pos - FUZZY_NEIGHBORHOOD), min(self._count, pos + FUZZY_NEIGHBORHOOD)
+        candidates = {self._key_at(i).decode("utf-8"): i for i in range(start, end)}
+
+        matches = difflib.get_close_matches(key, list(candidates), n=1, cutoff=cutoff)
+        if not matches:
+            return None
+        return self._record_at(candidates[matches[0]])
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+
+def open_index(path: Optional[str]) -> Optional[WikipediaIndex]:
+    if not path:
+        return None
+    try:
+        index = WikipediaIndex(path)
+        print(f"✅ Wikipedia offline index loaded: {path} ({len(index)} keys)")
+        return index
+    except (OSError, ValueError, struct.error) as e:
+        print(f"❌ Failed to load Wikipedia offline index ({path}): {e}")
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="위키피디아 abstract 덤프로 오프라인 요약 인덱스 생성")
+    parser.add_argument("dump_path", help="*-abstract.xml 또는 *-abstract.xml.gz 경로")
+    parser.add_argument("output_path", help="생성할 인덱스 파일 경로")
+    parser.add_argument("--redirects", dest="redirects_path", help="원본<TAB>대상 형식의 리다이렉트 목록")
+    args = parser.parse_args(argv)
+
+    count = build_index(args.dump_path, args.output_path, args.redirects_path)
+    print(f"✅ {count}개 키로 인덱스 생성 완료: {args.output_path}")
+
+
+if __name__ == "__main__":
+    main()
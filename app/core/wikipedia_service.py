@@ -1,14 +1,172 @@
+import json
+import sqlite3
+import threading
+import time
 import wikipedia
 import wikipediaapi
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 import logging
+from app.core.ttl_cache import TTLCache
+from app.core.wikipedia_index import WikipediaIndex, open_index, truncate_summary
+from app.config import (
+    WIKIPEDIA_CACHE_MAX_ENTRIES, WIKIPEDIA_CACHE_TTL_SECONDS,
+    WIKIPEDIA_NEGATIVE_CACHE_TTL_SECONDS, WIKIPEDIA_CACHE_DB_PATH, WIKIPEDIA_INDEX_PATH
+)
 
 logging.getLogger("wikipedia").setLevel(logging.WARNING)
 
+_MISSING = object()
+
+
+class SQLiteCacheStore:
+    """위키피디아 조회 결과를 디스크에 저장하는 SQLite 캐시 (재시작 후에도 유지, 워커 간 공유)"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS wikipedia_cache (
+                    namespace TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    cache_key TEXT NOT NULL,
+                    value TEXT,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, language, cache_key)
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, namespace: str, language: str, key: str) -> Any:
+        """(값, 남은 TTL) 반환. 없거나 만료되었으면 _MISSING"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM wikipedia_cache WHERE namespace = ? AND language = ? AND cache_key = ?",
+                    (namespace, language, key)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Wikipedia cache store read error: {e}")
+            return _MISSING
+
+        if row is None:
+            return _MISSING
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return _MISSING
+        return json.loads(row[0]), remaining
+
+    def set(self, namespace: str, language: str, key: str, value: Any, ttl_seconds: float) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO wikipedia_cache (namespace, language, cache_key, value, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (namespace, language, key, json.dumps(value, ensure_ascii=False), time.time() + ttl_seconds)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Wikipedia cache store write error: {e}")
+
+    def clear(self, namespace: str, language: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM wikipedia_cache WHERE namespace = ? AND language = ?",
+                    (namespace, language)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Wikipedia cache store clear error: {e}")
+
+    def purge_expired(self) -> int:
+        try:
+            with self._lock:
+                cursor = self._conn.execute("DELETE FROM wikipedia_cache WHERE expires_at < ?", (time.time(),))
+                self._conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Wikipedia cache store purge error: {e}")
+            return 0
+
+
+class WikipediaCache:
+    """LRU + TTL 메모리 캐시. 부정 결과(None)는 짧은 TTL을 적용하고, 선택적으로 SQLite 저장소를 함께 사용"""
+
+    def __init__(self, namespace: str, language: str, max_entries: int = WIKIPEDIA_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = WIKIPEDIA_CACHE_TTL_SECONDS,
+                 negative_ttl_seconds: float = WIKIPEDIA_NEGATIVE_CACHE_TTL_SECONDS,
+                 store: Optional[SQLiteCacheStore] = None):
+        self.namespace = namespace
+        self.language = language
+        self._memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._store = store
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if self._store is not None:
+            stored = self._store.get(self.namespace, self.language, key)
+            if stored is not _MISSING:
+                value, remaining = stored
+                self._memory.set(key, value, ttl_seconds=remaining)
+                return value
+
+        return default
+
+    def set(self, key: str, value: Any) -> None:
+        ttl = self._negative_ttl_seconds if value is None else self._ttl_seconds
+        self._memory.set(key, value, ttl_seconds=ttl)
+        if self._store is not None:
+            self._store.set(self.namespace, self.language, key, value, ttl)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def clear(self, persistent: bool = True) -> None:
+        self._memory.clear()
+        if persistent and self._store is not None:
+            self._store.clear(self.namespace, self.language)
+
+    def get_stats(self) -> Dict:
+        return self._memory.get_stats()
+
+
+_cache_stores: Dict[str, SQLiteCacheStore] = {}
+_cache_stores_lock = threading.Lock()
+
+
+def _get_cache_store(path: Optional[str]) -> Optional[SQLiteCacheStore]:
+    if not path:
+        return None
+    with _cache_stores_lock:
+        if path not in _cache_stores:
+            try:
+                _cache_stores[path] = SQLiteCacheStore(path)
+            except sqlite3.Error as e:
+                print(f"Wikipedia cache store init failed ({path}): {e}")
+                return None
+        return _cache_stores[path]
+
 
 class WikipediaService:
-    def __init__(self, language: str = "ko"):
+    def __init__(self, language: str = "ko", cache_db_path: Optional[str] = None,
+                 index: Optional[WikipediaIndex] = None):
         self.language = language
+        # 오프라인 인덱스가 있으면 우선 조회하고, 없을 때만 라이브 API 호출
+        self._index = index
         
         wikipedia.set_lang(language)
         
@@ -17,12 +175,20 @@ class WikipediaService:
             user_agent='InterviewBot/1.0 (https://example.com/contact)'
         )
         
-        self._concept_cache: Dict[str, Optional[Dict]] = {}
-        self._search_cache: Dict[str, Optional[str]] = {}
+        self._store = _get_cache_store(cache_db_path)
+        self._concept_cache = WikipediaCache("concept", language, store=self._store)
+        self._search_cache = WikipediaCache("search", language, store=self._store)
 
     def get_concept_summary(self, concept: str) -> Optional[Dict]:
-        if concept in self._concept_cache:
-            return self._concept_cache[concept]
+        cached = self._concept_cache.get(concept)
+        if cached is not _MISSING:
+            return cached
+
+        if self._index is not None:
+            indexed = self._index.fuzzy_lookup(concept)
+            if indexed:
+                self._concept_cache[concept] = indexed
+                return indexed
         
         try:
             page = self.wiki_api.page(concept)
@@ -34,14 +200,7 @@ class WikipediaService:
                     
             if page.exists():
                 # Extract summary (first paragraph or up to 500 characters)
-                summary_text = page.summary
-                if len(summary_text) > 500:
-                    truncated = summary_text[:500]
-                    last_period = truncated.rfind('.')
-                    if last_period > 200:  # Ensure we have substantial content
-                        summary_text = truncated[:last_period + 1]
-                    else:
-                        summary_text = truncated + "..."
+                summary_text = truncate_summary(page.summary)
                 
                 result = {
                     "title": page.title,
@@ -56,13 +215,20 @@ class WikipediaService:
                 return None
                 
         except Exception as e:
+            # 일시적인 API/네트워크 오류는 캐시하지 않음 (다음 요청에서 다시 조회)
             print(f"Wikipedia API error for concept '{concept}': {e}")
-            self._concept_cache[concept] = None
             return None
 
     def search_concept(self, query: str) -> Optional[str]:
-        if query in self._search_cache:
-            return self._search_cache[query]
+        cached = self._search_cache.get(query)
+        if cached is not _MISSING:
+            return cached
+
+        if self._index is not None:
+            indexed = self._index.fuzzy_lookup(query)
+            if indexed:
+                self._search_cache[query] = indexed["title"]
+                return indexed["title"]
         
         try:
             search_results = wikipedia.search(query, results=1)
@@ -76,8 +242,8 @@ class WikipediaService:
                 return None
                 
         except Exception as e:
+            # 일시적인 API/네트워크 오류는 캐시하지 않음 (다음 요청에서 다시 조회)
             print(f"Wikipedia search error for query '{query}': {e}")
-            self._search_cache[query] = None
             return None
     
     def get_page_content(self, title: str) -> Optional[str]:
@@ -152,10 +318,14 @@ class WikipediaService:
         self._concept_cache.clear()
         self._search_cache.clear()
     
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         return {
             "concept_cache_size": len(self._concept_cache),
-            "search_cache_size": len(self._search_cache)
+            "search_cache_size": len(self._search_cache),
+            "concept_cache": self._concept_cache.get_stats(),
+            "search_cache": self._search_cache.get_stats(),
+            "persistent": self._store is not None,
+            "offline_index": self._index.path if self._index is not None else None
         }
 
     def set_language(self, language: str) -> None:
@@ -168,7 +338,12 @@ class WikipediaService:
             user_agent='InterviewBot/1.0 (https://example.com/contact)'
         )
         
-        self.clear_cache()
+        # 오프라인 인덱스는 생성 당시 언어 전용이므로 해제
+        self._index = None
+
+        # 영속 저장소는 언어별로 키가 분리되어 있으므로 메모리 캐시만 새로 구성
+        self._concept_cache = WikipediaCache("concept", language, store=self._store)
+        self._search_cache = WikipediaCache("search", language, store=self._store)
 
     def get_supported_languages(self) -> List[str]:
         try:
@@ -176,3 +351,20 @@ class WikipediaService:
         except Exception as e:
             print(f"Error getting supported languages: {e}")
             return ["en", "ko", "ja", "de", "fr", "es", "it", "ru", "zh"]  # Common fallback
+
+
+_shared_service: Optional[WikipediaService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_wikipedia_service() -> WikipediaService:
+    """프로세스 전역에서 공유하는 WikipediaService (캐시와 API 클라이언트 재사용)"""
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = WikipediaService(
+                    cache_db_path=WIKIPEDIA_CACHE_DB_PATH,
+                    index=open_index(WIKIPEDIA_INDEX_PATH)
+                )
+    return _shared_service
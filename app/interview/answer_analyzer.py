@@ -1,14 +1,24 @@
+import asyncio
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional
 from app.interview.prompt_loader import load_prompt
-from app.core.llm_utils import call_llm
-from app.core.wikipedia_service import WikipediaService
+from app.core.llm_utils import acall_llm
+from app.core.wikipedia_service import WikipediaService, get_wikipedia_service
+from app.config import (
+    WIKIPEDIA_LOOKUP_WORKERS, WIKIPEDIA_CONTEXT_TIMEOUT_SECONDS,
+    ANALYSIS_SPECULATIVE_MODE, ANALYSIS_SPECULATIVE_DELAY_SECONDS
+)
 
 MAX_CONCEPTS_TO_PROCESS = 3
 WIKIPEDIA_EXTRACT_TRUNCATE_LENGTH = 300
 
+# 개념별 위키피디아 조회를 병렬로 실행하는 공유 스레드풀
+_wikipedia_executor = ThreadPoolExecutor(max_workers=WIKIPEDIA_LOOKUP_WORKERS, thread_name_prefix="wikipedia-lookup")
 
-def extract_technical_concepts(answer: str, jobtype: str) -> list:
+
+async def extract_technical_concepts(answer: str, jobtype: str) -> list:
     try:
         prompt_template = load_prompt("concept_extraction.txt")
         prompt = prompt_template.format(answer=answer, job_type=jobtype)
@@ -18,11 +28,12 @@ def extract_technical_concepts(answer: str, jobtype: str) -> list:
         return []
 
     try:
-        response = call_llm(
+        response = await acall_llm(
             prompt=prompt,
             temperature=0.1,
             max_tokens=200,
-            system_role="당신은 기술 면접 전문가입니다. 답변에서 검증 가능한 기술 개념을 정확히 추출합니다."
+            system_role="당신은 기술 면접 전문가입니다. 답변에서 검증 가능한 기술 개념을 정확히 추출합니다.",
+            use_cache=True
         )
         concepts = json.loads(response.strip())
         return concepts if isinstance(concepts, list) else []
@@ -30,20 +41,34 @@ def extract_technical_concepts(answer: str, jobtype: str) -> list:
         return []
 
 
-def get_wikipedia_context(concepts: list) -> str:
+def _lookup_concept(wikipedia_service: WikipediaService, concept: str) -> Optional[dict]:
+    wiki_data = wikipedia_service.get_concept_summary(concept)
+    if not wiki_data:
+        search_title = wikipedia_service.search_concept(concept)
+        if search_title:
+            wiki_data = wikipedia_service.get_concept_summary(search_title)
+    return wiki_data
+
+
+def get_wikipedia_context(concepts: list, timeout: float = WIKIPEDIA_CONTEXT_TIMEOUT_SECONDS) -> str:
     if not concepts:
         return ""
 
-    wikipedia_service = WikipediaService()
+    wikipedia_service = get_wikipedia_service()
     fact_context = "\n\n**기술적 정확성 검증을 위한 참고 정보:**\n"
 
-    for concept in concepts[:MAX_CONCEPTS_TO_PROCESS]:
-        wiki_data = wikipedia_service.get_concept_summary(concept)
-        if not wiki_data:
-            search_title = wikipedia_service.search_concept(concept)
-            if search_title:
-                wiki_data = wikipedia_service.get_concept_summary(search_title)
+    # 개념별 조회를 병렬로 실행하고, 요청 단위 마감 시간 안에 끝난 결과만 사용
+    target_concepts = concepts[:MAX_CONCEPTS_TO_PROCESS]
+    futures = [_wikipedia_executor.submit(_lookup_concept, wikipedia_service, concept) for concept in target_concepts]
+    done, not_done = wait(futures, timeout=timeout)
+    for future in not_done:
+        future.cancel()
 
+    for concept, future in zip(target_concepts, futures):
+        if future not in done or future.exception() is not None:
+            continue
+
+        wiki_data = future.result()
         if wiki_data and wiki_data.get("extract"):
             extract = wiki_data["extract"][:WIKIPEDIA_EXTRACT_TRUNCATE_LENGTH]
             fact_context += f"- **{concept}**: {extract}...\n"
@@ -52,25 +77,14 @@ def get_wikipedia_context(concepts: list) -> str:
     return fact_context
 
 
-def analyze_answer(question: str, answer: str, jobtype: str, level: str, category: str) -> dict:
-    technical_concepts = extract_technical_concepts(answer, jobtype)
-    wikipedia_context = get_wikipedia_context(technical_concepts)
-
-    prompt_template = load_prompt("analysis.txt")
-    formatted_prompt = prompt_template.format(
-        question=question.strip(),
-        text=answer.strip(),
-        jobtype=jobtype,
-        level=level,
-        category=category
-    )
-    prompt = formatted_prompt + wikipedia_context
+async def _run_analysis(prompt: str) -> Optional[dict]:
     try:
-        llm_response = call_llm(
+        llm_response = await acall_llm(
             prompt=prompt,
             temperature=0.3,
             max_tokens=512,
-            system_role="당신은 경험이 풍부한 면접관입니다. 지원자의 답변을 분석하고, 면접자의 입장에서 구체적인 피드백을 제공합니다."
+            system_role="당신은 경험이 풍부한 면접관입니다. 지원자의 답변을 분석하고, 면접자의 입장에서 구체적인 피드백을 제공합니다.",
+            use_cache=True
         )
     except (ConnectionError, TimeoutError, ValueError) as e:
         print("❌ LLM 호출 실패:", e)
@@ -88,3 +102,53 @@ def analyze_answer(question: str, answer: str, jobtype: str, level: str, categor
 
     print("❌ JSON 응답 없음")
     return None
+
+
+def _discard_result(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+async def _analyze_speculatively(formatted_prompt: str, context_task: asyncio.Task) -> Optional[dict]:
+    """참고 정보 조회가 지연되면 참고 정보 없는 분석을 먼저 시작하고, 먼저 끝나는 쪽을 사용"""
+    done, _ = await asyncio.wait({context_task}, timeout=ANALYSIS_SPECULATIVE_DELAY_SECONDS)
+    if done:
+        return await _run_analysis(formatted_prompt + context_task.result())
+
+    speculative_task = asyncio.create_task(_run_analysis(formatted_prompt))
+    done, _ = await asyncio.wait({context_task, speculative_task}, return_when=asyncio.FIRST_COMPLETED)
+
+    if speculative_task in done and speculative_task.result() is not None:
+        # 참고 정보 조회 결과는 쓰지 않으므로 취소하고, 이미 끝난 경우에도 예외를 회수해 경고가 남지 않게 함
+        context_task.cancel()
+        context_task.add_done_callback(_discard_result)
+        return speculative_task.result()
+
+    speculative_task.cancel()
+    wikipedia_context = await context_task
+    return await _run_analysis(formatted_prompt + wikipedia_context)
+
+
+async def analyze_answer(question: str, answer: str, jobtype: str, level: str, category: str,
+                         speculative: Optional[bool] = None) -> dict:
+    technical_concepts = await extract_technical_concepts(answer, jobtype)
+
+    prompt_template = load_prompt("analysis.txt")
+    formatted_prompt = prompt_template.format(
+        question=question.strip(),
+        text=answer.strip(),
+        jobtype=jobtype,
+        level=level,
+        category=category
+    )
+
+    # 위키피디아 조회는 블로킹 HTTP 호출이므로 이벤트 루프 밖에서 실행
+    context_task = asyncio.create_task(asyncio.to_thread(get_wikipedia_context, technical_concepts))
+
+    if speculative is None:
+        speculative = ANALYSIS_SPECULATIVE_MODE
+    if speculative and technical_concepts:
+        return await _analyze_speculatively(formatted_prompt, context_task)
+
+    wikipedia_context = await context_task
+    return await _run_analysis(formatted_prompt + wikipedia_context)
@@ -1,8 +1,8 @@
 import os
 from pathlib import Path
 from typing import Dict, Optional
-import boto3
 from app.config import REGION, ACCESS_KEY, SECRET_KEY, S3_BUCKET
+from app.core.s3_utils import get_s3_client
 
 
 class PromptCache:
@@ -24,21 +24,19 @@ _prompt_cache = PromptCache()
 
 class PromptLoader:
     def __init__(self):
-        self.s3_client = None
-        self._initialize_s3()
+        self._s3_enabled = bool(ACCESS_KEY and SECRET_KEY and REGION and S3_BUCKET)
 
-    def _initialize_s3(self):
+    @property
+    def s3_client(self):
+        # 로컬 프롬프트가 없을 때만 공유 S3 클라이언트를 가져옴
+        if not self._s3_enabled:
+            return None
         try:
-            if ACCESS_KEY and SECRET_KEY and REGION and S3_BUCKET:
-                self.s3_client = boto3.client(
-                    "s3",
-                    aws_access_key_id=ACCESS_KEY,
-                    aws_secret_access_key=SECRET_KEY,
-                    region_name=REGION
-                )
+            return get_s3_client()
         except Exception as e:
             print(f"Warning: S3 client initialization failed: {e}")
-            self.s3_client = None
+            self._s3_enabled = False
+            return None
 
     def _load_from_local(self, filename: str) -> Optional[str]:
         try:
@@ -52,11 +50,12 @@ class PromptLoader:
 
     def _load_from_s3(self, filename: str) -> Optional[str]:
         """Load prompt from S3"""
-        if not self.s3_client:
+        s3_client = self.s3_client
+        if not s3_client:
             return None
 
         try:
-            response = self.s3_client.get_object(
+            response = s3_client.get_object(
                 Bucket=S3_BUCKET,
                 Key=f"prompts/{filename}"
             )
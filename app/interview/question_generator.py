@@ -2,8 +2,8 @@ import random
 from typing import Optional, Literal
 from app.schemas.interview import QuestionData
 from app.interview.prompt_loader import load_prompt
-from app.core.llm_utils import call_llm
-from app.core.mysql_utils import get_resume_text
+from app.core.llm_utils import acall_llm
+from app.core.mysql_utils import aget_resume_text
 from app.core.question_cache import question_cache
 
 QuestionType = Literal["일반질문", "꼬리질문"]
@@ -34,9 +34,9 @@ def generate_questions(previous_questions: list[str]) -> str:
 위 질문들과 겹치지 않는 새로운 관점의 질문을 생성하세요.
 """
 
-def generate_question(question_level: str, job_type: str, question_category: str, 
-                     previous_question: Optional[str], previous_answer: Optional[str], 
-                     document_id: Optional[str]) -> QuestionData:
+async def generate_question(question_level: str, job_type: str, question_category: str,
+                           previous_question: Optional[str], previous_answer: Optional[str],
+                           document_id: Optional[str]) -> QuestionData:
     """면접 질문 생성 (중복 방지 로직 포함)"""
     
     question_type = decide_question_type(previous_question, previous_answer)
@@ -53,7 +53,7 @@ def generate_question(question_level: str, job_type: str, question_category: str
         )
         
         # 이력서 내용 조회
-        resume_text = get_resume_text(document_id)
+        resume_text = await aget_resume_text(document_id)
         if not resume_text:
             raise ValueError("이력서 내용을 찾을 수 없습니다.")
         
@@ -80,7 +80,7 @@ def generate_question(question_level: str, job_type: str, question_category: str
         )
 
     try:
-        response = call_llm(
+        response = await acall_llm(
             prompt,
             temperature=0.8 if question_type == "일반질문" else 0.8,
             max_tokens=512
@@ -1,7 +1,10 @@
 from fastapi import FastAPI
-from app.router import health, interview, resume, s3_connection, pii_check
+from app.router import health, interview, s3_connection
 from app.core.question_cache import question_cache
+from app.core.llm_utils import close_llm_clients
+from app.core.async_mysql import async_pool, close_async_pool
 from app.interview.prompt_loader import preload_prompts
+from app.config import INTERVIEW_ONLY, NER_WARMUP
 from contextlib import asynccontextmanager
 
 @asynccontextmanager
@@ -12,11 +15,34 @@ async def lifespan(app: FastAPI):
     print("Prompts preloaded")
     await question_cache.start_background_cleanup()
     print("Cache cleanup task started")
+    await async_pool.start()
+    if not INTERVIEW_ONLY and NER_WARMUP == "background":
+        # 모델 로드가 끝날 때까지 /health/ready 는 503을 반환
+        from app.resume.pii_detector import start_ner_warmup
+        start_ner_warmup()
+        print("NER warmup started")
+    if not INTERVIEW_ONLY:
+        from app.resume.pii_log_shipper import pii_log_shipper
+        await pii_log_shipper.start()
     print("Application startup complete")
     yield
     
     print("🔽 Shutting down application...")
     await question_cache.stop_background_cleanup()
+    await close_llm_clients()
+    await close_async_pool()
+    if not INTERVIEW_ONLY:
+        from app.resume.pii_detector import ner_batcher
+        from app.resume.downloader import close_download_client
+        from app.resume.parser import shutdown_pdf_pool
+        from app.resume.jobs import resume_job_queue
+        from app.resume.pii_log_shipper import pii_log_shipper
+        await resume_job_queue.stop()
+        await ner_batcher.stop()
+        # 작업 워커를 멈춘 뒤 스풀에 남은 로그 전송
+        await pii_log_shipper.stop()
+        await close_download_client()
+        shutdown_pdf_pool()
     print("✅ Application shutdown complete")
 
 app = FastAPI(
@@ -27,9 +53,12 @@ app = FastAPI(
 )
 
 app.include_router(interview.router, prefix="/api/ai")
-app.include_router(resume.router, prefix="/api/ai")
 app.include_router(s3_connection.router)
-app.include_router(pii_check.router, prefix="/api/ai")
+if not INTERVIEW_ONLY:
+    # 면접 전용 워커는 이력서/PII 모듈(NER 의존성)을 import 하지 않음
+    from app.router import resume, pii_check
+    app.include_router(resume.router, prefix="/api/ai")
+    app.include_router(pii_check.router, prefix="/api/ai")
 app.include_router(health.router)
 
 if __name__ == "__main__":
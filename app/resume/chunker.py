@@ -0,0 +1,114 @@
+"""
+NER 입력 길이(512 토큰)를 넘는 긴 이력서를 토큰 단위 슬라이딩 윈도우로 분할하고,
+청크별 엔티티를 원문 좌표로 되돌려 겹침 구간의 중복을 제거합니다.
+
+청크 경계는 가능한 한 줄/문장 끝에 맞추고, 인접 청크는 overlap_tokens 만큼 겹치므로
+경계에 걸친 엔티티도 어느 한 청크에서는 온전히 탐지됩니다.
+"""
+import bisect
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from app.config import NER_CHUNK_MAX_TOKENS, NER_CHUNK_OVERLAP_TOKENS
+
+# 줄바꿈 직후 또는 문장부호 + 공백 직후를 경계 후보로 사용
+_BOUNDARY_PATTERN = re.compile(r"\n+|(?<=[.!?。])\s+")
+# 토크나이저가 없을 때의 근사 토큰 (단어/기호 단위)
+_APPROX_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class TextChunk:
+    text: str
+    start: int  # 원문에서의 시작 문자 위치
+
+
+def _token_starts(text: str, tokenizer=None) -> List[int]:
+    if tokenizer is None:
+        return [m.start() for m in _APPROX_TOKEN_PATTERN.finditer(text)]
+    encoding = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+    return [start for start, end in encoding["offset_mapping"] if end > start]
+
+
+def _boundaries(text: str) -> List[int]:
+    return [m.end() for m in _BOUNDARY_PATTERN.finditer(text) if m.end() < len(text)]
+
+
+def chunk_text(text: str, tokenizer=None, max_tokens: int = NER_CHUNK_MAX_TOKENS,
+               overlap_tokens: int = NER_CHUNK_OVERLAP_TOKENS) -> List[TextChunk]:
+    """텍스트를 max_tokens 이하의 겹치는 청크로 분할 (토큰화는 원문 전체에 대해 한 번만 수행)"""
+    token_starts = _token_starts(text, tokenizer)
+    if len(token_starts) <= max_tokens:
+        return [TextChunk(text=text, start=0)] if text.strip() else []
+
+    overlap_tokens = min(overlap_tokens, max_tokens // 2)
+    # 경계 문자 위치 → 그 위치에서 시작하는 토큰 인덱스
+    boundary_tokens = sorted({bisect.bisect_left(token_starts, pos) for pos in _boundaries(text)})
+    token_count = len(token_starts)
+
+    chunks = []
+    start_token = 0
+    while True:
+        end_token = start_token + max_tokens
+        if end_token >= token_count:
+            chunks.append(TextChunk(text=text[token_starts[start_token]:], start=token_starts[start_token]))
+            break
+
+        # 창 안의 마지막 경계에서 자르되, 다음 청크가 앞으로 나아갈 수 있을 만큼 뒤쪽이어야 함
+        i = bisect.bisect_right(boundary_tokens, end_token) - 1
+        if i >= 0 and boundary_tokens[i] > start_token + overlap_tokens:
+            end_token = boundary_tokens[i]
+
+        char_start, char_end = token_starts[start_token], token_starts[end_token]
+        chunks.append(TextChunk(text=text[char_start:char_end], start=char_start))
+
+        # 다음 청크는 overlap 구간 안의 첫 경계에서 시작 (없으면 토큰 단위로 겹침)
+        next_start = end_token - overlap_tokens
+        j = bisect.bisect_left(boundary_tokens, next_start)
+        if j < len(boundary_tokens) and boundary_tokens[j] < end_token:
+            next_start = boundary_tokens[j]
+        start_token = max(next_start, start_token + 1)
+
+    return chunks
+
+
+def _overlaps(a: Dict, b: Dict) -> bool:
+    return a["start"] < b["end"] and b["start"] < a["end"]
+
+
+def merge_chunk_entities(chunks: List[TextChunk], chunk_entities: List[List[Dict]]) -> List[Dict]:
+    """청크별 엔티티를 원문 좌표로 옮기고, 겹치는 엔티티는 하나만 남김
+
+    같은 라벨끼리 겹치면 더 긴 스팬(청크 경계에서 잘리지 않은 쪽)을, 라벨이 다르면 점수가 높은 쪽을 유지합니다.
+    """
+    shifted = []
+    for chunk, entities in zip(chunks, chunk_entities):
+        for ent in entities:
+            if ent.get("start") is None or ent.get("end") is None:
+                shifted.append(dict(ent))
+                continue
+            shifted.append({**ent, "start": ent["start"] + chunk.start, "end": ent["end"] + chunk.start})
+
+    positioned = sorted((e for e in shifted if e.get("start") is not None),
+                        key=lambda e: (e["start"], -e["end"]))
+    merged: List[Dict] = []
+    for ent in positioned:
+        last: Optional[Dict] = merged[-1] if merged else None
+        if last is None or not _overlaps(last, ent):
+            merged.append(ent)
+            continue
+
+        if last["entity_group"] == ent["entity_group"]:
+            keep_new = (ent["end"] - ent["start"], ent.get("score", 0)) > (last["end"] - last["start"], last.get("score", 0))
+        else:
+            keep_new = ent.get("score", 0) > last.get("score", 0)
+        if keep_new:
+            merged[-1] = ent
+
+    # 위치 정보가 없는 엔티티는 (라벨, 단어) 기준으로만 중복 제거
+    seen = {(e["entity_group"], e["word"]) for e in merged}
+    for ent in shifted:
+        if ent.get("start") is None and (ent["entity_group"], ent["word"]) not in seen:
+            seen.add((ent["entity_group"], ent["word"]))
+            merged.append(ent)
+    return merged
@@ -0,0 +1,94 @@
+"""
+이력서 PDF 비동기 스트리밍 다운로드
+
+- 워커 전체에서 공유하는 httpx 커넥션 풀 재사용
+- 연결/읽기/전체 타임아웃과 최대 크기 제한
+- 응답 앞부분의 %PDF- 시그니처 확인 (S3는 binary/octet-stream으로 응답하는 경우가 많아 Content-Type만으로 판단하지 않음)
+"""
+import asyncio
+import tempfile
+import httpx
+from app.config import (
+    PDF_DOWNLOAD_MAX_BYTES, PDF_DOWNLOAD_CONNECT_TIMEOUT_SECONDS, PDF_DOWNLOAD_READ_TIMEOUT_SECONDS,
+    PDF_DOWNLOAD_TOTAL_TIMEOUT_SECONDS, PDF_DOWNLOAD_MAX_CONNECTIONS, PDF_SPOOL_MAX_MEMORY_BYTES
+)
+
+PDF_SIGNATURE = b"%PDF-"
+# PDF 명세상 헤더는 파일 앞 1024바이트 안에 위치
+PDF_SIGNATURE_WINDOW = 1024
+ALLOWED_CONTENT_TYPES = ("application/pdf", "application/octet-stream", "binary/octet-stream", "application/x-pdf")
+
+
+class PDFDownloadError(Exception):
+    """PDF 다운로드 실패 (잘못된 URL, 타임아웃, 크기 초과, PDF가 아닌 응답 등)"""
+
+
+download_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=PDF_DOWNLOAD_MAX_CONNECTIONS),
+    timeout=httpx.Timeout(PDF_DOWNLOAD_READ_TIMEOUT_SECONDS, connect=PDF_DOWNLOAD_CONNECT_TIMEOUT_SECONDS),
+    follow_redirects=True
+)
+
+
+def _check_content_type(content_type: str) -> None:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in ALLOWED_CONTENT_TYPES:
+        raise PDFDownloadError(f"PDF가 아닌 응답입니다 (Content-Type: {media_type})")
+
+
+async def _stream_pdf(url: str, max_bytes: int, sink) -> int:
+    async with download_client.stream("GET", url) as response:
+        if response.status_code >= 400:
+            raise PDFDownloadError(f"HTTP {response.status_code}")
+        _check_content_type(response.headers.get("content-type", ""))
+
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise PDFDownloadError(f"파일 크기 제한 초과 ({content_length} > {max_bytes} bytes)")
+
+        size = 0
+        head = b""
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise PDFDownloadError(f"파일 크기 제한 초과 (> {max_bytes} bytes)")
+
+            # 시그니처 확인 전까지만 앞부분을 모아 두고, 확인되면 바로 중단 여부 결정
+            if len(head) < PDF_SIGNATURE_WINDOW:
+                head += chunk[:PDF_SIGNATURE_WINDOW - len(head)]
+                if PDF_SIGNATURE not in head and len(head) >= PDF_SIGNATURE_WINDOW:
+                    raise PDFDownloadError("PDF 파일 형식이 아닙니다")
+            sink(chunk)
+
+        if PDF_SIGNATURE not in head:
+            raise PDFDownloadError("PDF 파일 형식이 아닙니다")
+        return size
+
+
+async def download_pdf(url: str, max_bytes: int = PDF_DOWNLOAD_MAX_BYTES,
+                       timeout: float = PDF_DOWNLOAD_TOTAL_TIMEOUT_SECONDS,
+                       spool_max_memory: int = PDF_SPOOL_MAX_MEMORY_BYTES) -> tempfile.SpooledTemporaryFile:
+    """URL의 PDF를 스트리밍으로 내려받아 처음 위치로 되감은 파일 객체로 반환 (실패 시 PDFDownloadError)
+
+    spool_max_memory 이하는 메모리에만 보관하고, 넘는 경우에만 디스크 임시 파일로 내려씁니다.
+    호출자가 사용 후 close() 해야 합니다.
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=spool_max_memory, suffix=".pdf")
+    try:
+        await asyncio.wait_for(_stream_pdf(url, max_bytes, buffer.write), timeout=timeout)
+    except asyncio.TimeoutError:
+        buffer.close()
+        raise PDFDownloadError(f"다운로드 시간 초과 ({timeout}s)")
+    except (httpx.HTTPError, httpx.InvalidURL) as e:
+        buffer.close()
+        raise PDFDownloadError(str(e) or e.__class__.__name__)
+    except BaseException:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
+
+
+async def close_download_client():
+    """앱 종료 시 공유 커넥션 풀 정리"""
+    await download_client.aclose()
@@ -0,0 +1,180 @@
+"""
+Aho-Corasick 기반 다중 문자열 매처
+
+문서에서 한 번 탐지된 엔티티 문자열(이름 등)과 사전(학교 약칭 등)의 모든 등장 위치를
+패턴 수와 무관하게 텍스트 한 번의 선형 스캔으로 찾습니다.
+사전은 dictionaries/<label>.txt (한 줄에 한 항목, # 주석) 형식이며 프로세스당 한 번만 빌드됩니다.
+"""
+import os
+import threading
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from app.config import PII_DICTIONARY_DIR
+
+Match = Tuple[int, int, str]  # (start, end, label)
+
+
+# 한글 항목 뒤에 붙어도 같은 단어로 보는 말 (조사, "서울대학교"의 학교 등)
+# 조사 뒤에 한글이 더 이어지면 다른 단어로 판단 (예: 세종대로, 세종대왕, 고려대장경)
+HANGUL_ATTACHED_SUFFIXES = ("학교", "대학원")
+HANGUL_PARTICLES = (
+    "에서", "으로", "까지", "부터", "이나", "이랑", "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도",
+    "만", "나", "랑"
+)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+def _hangul_word_ends(text: str, end: int) -> bool:
+    # 한글 항목 뒤가 공백/문장부호/텍스트 끝이거나, 단어를 끝내는 조사 또는 허용된 접미사인지 확인
+    if end >= len(text) or not _is_hangul(text[end]):
+        return True
+    if text.startswith(HANGUL_ATTACHED_SUFFIXES, end):
+        return True
+    for particle in HANGUL_PARTICLES:
+        after = end + len(particle)
+        if text.startswith(particle, end) and (after >= len(text) or not _is_hangul(text[after])):
+            return True
+    return False
+
+
+class EntityMatcher:
+    def __init__(self, word_boundary: bool = False):
+        # 노드별 전이 / 실패 링크 / (길이, 라벨) 출력 / 출력이 있는 가장 가까운 접미사 노드
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[Tuple[int, str]]] = [None]
+        self._output_link: List[int] = [0]
+        self._built = False
+        # 항목이 더 긴 단어의 일부로 매칭되지 않도록 경계 확인 (예: LOGISTICS 안의 GIST, 세종대로 안의 세종대)
+        self.word_boundary = word_boundary
+        self.size = 0
+
+    def add(self, word: str, label: str) -> None:
+        if not word:
+            return
+        node = 0
+        for ch in word:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._output_link.append(0)
+            node = next_node
+        if self._output[node] is None:
+            self.size += 1
+        self._output[node] = (len(word), label)
+        self._built = False
+
+    def build(self) -> "EntityMatcher":
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                target = self._fail[child]
+                self._output_link[child] = target if self._output[target] is not None else self._output_link[target]
+                queue.append(child)
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """겹치는 것을 포함한 모든 매치를 끝 위치 순으로 반환"""
+        if not self._built:
+            self.build()
+        goto, fail, output, output_link = self._goto, self._fail, self._output, self._output_link
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            match_node = node if output[node] is not None else output_link[node]
+            while match_node:
+                length, label = output[match_node]
+                yield i + 1 - length, i + 1, label
+                match_node = output_link[match_node]
+
+    def _on_boundary(self, text: str, start: int, end: int) -> bool:
+        if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        if _is_hangul(text[end - 1]) and not _hangul_word_ends(text, end):
+            return False
+        return True
+
+    def find_all(self, text: str) -> List[Match]:
+        """겹치지 않는 매치를 왼쪽 우선, 같은 시작점이면 가장 긴 것 우선으로 반환"""
+        matches = self.iter_matches(text)
+        if self.word_boundary:
+            matches = (m for m in matches if self._on_boundary(text, m[0], m[1]))
+
+        selected: List[Match] = []
+        last_end = 0
+        for start, end, label in sorted(matches, key=lambda m: (m[0], -m[1])):
+            if start >= last_end:
+                selected.append((start, end, label))
+                last_end = end
+        return selected
+
+
+def build_entity_matcher(words_by_label: Dict[str, Iterable[str]], rank=None) -> EntityMatcher:
+    """문서에서 탐지된 라벨별 문자열로 매처를 생성 (같은 문자열은 rank가 낮은 라벨 우선)"""
+    word_labels: Dict[str, str] = {}
+    for label, words in words_by_label.items():
+        for word in words:
+            word = word.strip()
+            if not word:
+                continue
+            current = word_labels.get(word)
+            if current is None or (rank is not None and rank(label) < rank(current)):
+                word_labels[word] = label
+
+    matcher = EntityMatcher()
+    for word, label in word_labels.items():
+        matcher.add(word, label)
+    return matcher.build()
+
+
+def load_dictionaries(dictionary_dir: Optional[str]) -> Dict[str, List[str]]:
+    if not dictionary_dir or not os.path.isdir(dictionary_dir):
+        return {}
+    dictionaries = {}
+    for filename in sorted(os.listdir(dictionary_dir)):
+        if not filename.endswith(".txt"):
+            continue
+        with open(os.path.join(dictionary_dir, filename), encoding="utf-8") as f:
+            entries = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+        dictionaries[filename[:-len(".txt")]] = entries
+    return dictionaries
+
+
+_dictionary_matcher: Optional[EntityMatcher] = None
+_dictionary_lock = threading.Lock()
+
+
+def get_dictionary_matcher() -> EntityMatcher:
+    """큐레이션된 사전으로 만든 공유 매처 (최초 호출 시 한 번 빌드)"""
+    global _dictionary_matcher
+    if _dictionary_matcher is None:
+        with _dictionary_lock:
+            if _dictionary_matcher is None:
+                matcher = EntityMatcher(word_boundary=True)
+                for label, entries in load_dictionaries(PII_DICTIONARY_DIR).items():
+                    for entry in entries:
+                        matcher.add(entry, label)
+                _dictionary_matcher = matcher.build()
+    return _dictionary_matcher
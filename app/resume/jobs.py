@@ -0,0 +1,198 @@
+"""
+이력서 처리 백그라운드 작업 큐 (프로세스 내 asyncio 큐, 외부 브로커 불필요)
+
+POST /file/jobs 는 작업을 큐에 넣고 바로 202를 반환하며, 동시 실행 수가 제한된 워커가
+파이프라인을 실행합니다. 작업 상태와 단계별 진행 상황은 GET /file/jobs/{job_id} 로 조회합니다.
+
+작업 상태는 작업을 등록한 워커 프로세스 메모리에만 있으므로 재시작 시 사라지고,
+다른 워커 프로세스에서는 조회할 수 없습니다. 여러 워커(uvicorn --workers N, 여러 컨테이너)로
+운영할 때는 단일 워커로 실행하거나 작업 ID의 워커 접두어 기준으로 같은 워커에 라우팅(sticky)해야 합니다.
+작업 ID는 "<워커 ID>-<작업 번호>" 형식이며, 다른 워커의 작업 ID를 조회하면 JobOnOtherWorkerError 입니다.
+"""
+import asyncio
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.config import RESUME_JOB_CONCURRENCY, RESUME_JOB_MAX_PENDING, RESUME_JOB_RESULT_TTL_SECONDS
+from app.schemas.resume import ResumeProcessRequest
+from app.resume.pipeline import PIPELINE_STAGES, ResumeProcessingError, process_resume_document
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업 수가 상한에 도달"""
+
+
+class JobOnOtherWorkerError(Exception):
+    """다른 워커 프로세스(또는 재시작 전 프로세스)에서 등록된 작업 ID"""
+
+
+_JOB_ID_PATTERN = re.compile(r"^([0-9a-f]{8})-[0-9a-f]{32}$")
+
+
+@dataclass
+class ResumeJob:
+    job_id: str
+    request: ResumeProcessRequest
+    status: str = "queued"  # queued / running / succeeded / failed
+    stage: Optional[str] = None
+    # 단계별 상태: pending / running / done / skipped / failed
+    stages: Dict[str, str] = field(default_factory=lambda: {stage: "pending" for stage in PIPELINE_STAGES})
+    error: Optional[str] = None
+    error_code: Optional[int] = None
+    cache_hit: Optional[str] = None  # "pdf" / "text" (이전 처리 결과 재사용 시)
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # 만료 판단용 (단조 시계)
+    finished_monotonic: Optional[float] = None
+
+    def enter_stage(self, stage: str, skipped: bool = False) -> None:
+        if self.stage is not None and self.stages[self.stage] == "running":
+            self.stages[self.stage] = "done"
+        self.stage = stage
+        # 캐시 적중으로 생략한 단계는 skipped
+        self.stages[stage] = "skipped" if skipped else "running"
+
+    def to_dict(self) -> Dict:
+        return {
+            "jobId": self.job_id,
+            "documentId": self.request.documentId,
+            "status": self.status,
+            "stage": self.stage,
+            "stages": dict(self.stages),
+            "error": self.error,
+            "errorCode": self.error_code,
+            "cacheHit": self.cache_hit,
+            "createdAt": self.created_at.isoformat(),
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class ResumeJobQueue:
+    def __init__(self, concurrency: int = RESUME_JOB_CONCURRENCY, max_pending: int = RESUME_JOB_MAX_PENDING,
+                 result_ttl_seconds: float = RESUME_JOB_RESULT_TTL_SECONDS):
+        self.concurrency = max(1, concurrency)
+        self.max_pending = max_pending
+        self.result_ttl_seconds = result_ttl_seconds
+        # 작업 ID 접두어 (이 워커가 등록한 작업인지 구분)
+        self.worker_id = uuid.uuid4().hex[:8]
+        self._jobs: Dict[str, ResumeJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._succeeded = 0
+        self._failed = 0
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        # 이벤트 루프가 바뀐 경우(테스트 클라이언트 등) 큐와 워커를 새로 생성
+        loop = asyncio.get_running_loop()
+        alive = [worker for worker in self._workers if not worker.done() and worker.get_loop() is loop]
+        if self._queue is None or len(alive) < self.concurrency:
+            if not alive:
+                self._queue = asyncio.Queue()
+            for _ in range(self.concurrency - len(alive)):
+                alive.append(loop.create_task(self._run(self._queue)))
+            self._workers = alive
+        return self._queue
+
+    def _prune_finished(self) -> None:
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_monotonic is not None and now - job.finished_monotonic > self.result_ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def pending_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == "queued")
+
+    async def submit(self, request: ResumeProcessRequest) -> ResumeJob:
+        """작업을 큐에 넣고 즉시 반환 (대기 작업이 상한이면 JobQueueFullError)"""
+        self._prune_finished()
+        if self.pending_count() >= self.max_pending:
+            raise JobQueueFullError(f"대기 중인 작업이 너무 많습니다 ({self.max_pending})")
+
+        queue = self._ensure_workers()
+        job = ResumeJob(job_id=f"{self.worker_id}-{uuid.uuid4().hex}", request=request)
+        self._jobs[job.job_id] = job
+        queue.put_nowait(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ResumeJob]:
+        """작업 조회 (없거나 만료되었으면 None, 다른 워커의 작업 ID면 JobOnOtherWorkerError)"""
+        self._prune_finished()
+        job = self._jobs.get(job_id)
+        if job is None:
+            match = _JOB_ID_PATTERN.match(job_id)
+            if match and match.group(1) != self.worker_id:
+                raise JobOnOtherWorkerError(
+                    f"작업 {job_id} 는 다른 워커 프로세스({match.group(1)})에서 등록되었거나 재시작으로 사라졌습니다"
+                )
+        return job
+
+    async def _execute(self, job: ResumeJob) -> None:
+        job.status = "running"
+        job.started_at = datetime.now()
+        try:
+            job.cache_hit = await process_resume_document(job.request, on_stage=job.enter_stage)
+        except ResumeProcessingError as e:
+            job.status, job.error, job.error_code = "failed", e.detail, e.status_code
+        except Exception as e:
+            job.status, job.error, job.error_code = "failed", str(e) or e.__class__.__name__, 500
+        else:
+            job.status = "succeeded"
+
+        if job.stage is not None and job.stages[job.stage] == "running":
+            job.stages[job.stage] = "done" if job.status == "succeeded" else "failed"
+        if job.status == "succeeded":
+            self._succeeded += 1
+        else:
+            self._failed += 1
+            print(f"❌ 이력서 처리 작업 실패 (job={job.job_id}, stage={job.stage}): {job.error}")
+        job.finished_at = datetime.now()
+        job.finished_monotonic = time.monotonic()
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """현재 큐에 들어온 작업이 모두 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        loop = asyncio.get_running_loop()
+        workers = [worker for worker in self._workers if not worker.done() and worker.get_loop() is loop]
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._workers = []
+
+    def get_stats(self) -> Dict:
+        running = sum(1 for job in self._jobs.values() if job.status == "running")
+        return {
+            'worker_id': self.worker_id,
+            'concurrency': self.concurrency,
+            'max_pending': self.max_pending,
+            'pending': self.pending_count(),
+            'running': running,
+            'succeeded': self._succeeded,
+            'failed': self._failed
+        }
+
+
+# 전역 작업 큐 인스턴스 (싱글톤)
+resume_job_queue = ResumeJobQueue()
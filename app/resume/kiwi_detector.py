@@ -0,0 +1,159 @@
+"""
+Kiwi 형태소 분석 기반 한국어 이름/지명 탐지기 (트랜스포머 NER 앞단의 저비용 1차 탐지)
+
+고유명사(NNP) 중
+- 흔한 성씨로 시작하는 2~4글자 한글이 "성명/이름" 항목 바로 뒤에 있으면 → 이름
+- 광역 지자체명이거나 행정구역/도로명 접미사로 끝나는 한글 → 지명
+으로 분류합니다. 성씨 규칙만 맞는 고유명사(예: 김철수, 한국, 구글)는 이름으로 확정하지 않고
+대문자로 시작하는 연속된 영문 단어(예: Michael Johnson)와 함께 불확실 구간으로 표시하여, 해당 구간만 트랜스포머 NER로 보냅니다.
+자주 나오는 기관/기업명(한국, 구글, 서울대, 신한은행 등)은 후보에서 제외합니다.
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+KOREAN_SURNAMES = set(
+    "김이박최정강조윤장임한오서신권황안송류유전홍고문양손배백허남심노하곽성차주우구민진나지엄채원천방공현함변염"
+    "여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예경봉사부가복태목형피두감음빈동온호범좌팽승간상시갈단견당화창옹순빙종풍"
+)
+COMPOUND_SURNAMES = ("남궁", "황보", "제갈", "선우", "서문", "독고", "사공")
+PROVINCES = {
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주"
+}
+LOCATION_SUFFIXES = ("특별시", "광역시", "특별자치시", "특별자치도", "시", "도", "군", "구", "동", "읍", "면", "리", "로", "길")
+# 성씨 글자로 시작하지만 인명이 아닌 고유명사 (이력서에 자주 나오는 국가/기업명)
+NON_PERSON_PROPER_NOUNS = {
+    "한국", "대한민국", "구글", "코리아", "현대", "기아", "신세계", "한화", "금호", "두산", "한겨레",
+    "인텔", "오라클", "유니티"
+}
+# 학교/기업/언론사 등 기관명 접미사 (예: 서울대, 신한은행, 조선일보)
+ORGANIZATION_SUFFIXES = (
+    "대", "은행", "일보", "신문", "경제", "전자", "그룹", "공사", "증권", "보험", "카드", "건설", "병원",
+    "재단", "협회", "마켓"
+)
+
+_HANGUL_WORD = re.compile(r"[가-힣]+")
+# 같은 줄에서 고유명사 바로 앞에 오는 이름 항목 (예: "성 명 이수민", "이름: 김민준")
+_NAME_CONTEXT = re.compile(r"(?:성\s*명|성\s*함|이\s*름|name)\s*[:：]?\s*$", re.IGNORECASE)
+NAME_CONTEXT_WINDOW = 16
+
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class KiwiEntity:
+    label: str  # "name" / "location"
+    word: str
+    start: int
+    end: int
+
+
+@dataclass
+class KiwiDetection:
+    entities: List[KiwiEntity] = field(default_factory=list)
+    uncertain: List[Span] = field(default_factory=list)  # 트랜스포머 NER가 필요한 문자 구간
+
+
+def _looks_like_name(word: str) -> bool:
+    if word.startswith(COMPOUND_SURNAMES):
+        return 3 <= len(word) <= 4
+    return 2 <= len(word) <= 4 and word[0] in KOREAN_SURNAMES
+
+
+def _looks_like_location(word: str) -> bool:
+    return word in PROVINCES or (len(word) >= 2 and word.endswith(LOCATION_SUFFIXES))
+
+
+def _looks_like_organization(word: str) -> bool:
+    return word in NON_PERSON_PROPER_NOUNS or (len(word) >= 3 and word.endswith(ORGANIZATION_SUFFIXES))
+
+
+def has_name_context(text: str, start: int) -> bool:
+    """start 위치 바로 앞(같은 줄)에 "성명/이름" 항목이 있는지"""
+    window = text[max(0, start - NAME_CONTEXT_WINDOW):start].rsplit("\n", 1)[-1]
+    return bool(_NAME_CONTEXT.search(window))
+
+
+def classify_proper_noun(word: str, name_context: bool = False) -> Optional[str]:
+    """고유명사를 name / location / uncertain 으로 분류 (해당 없으면 None)
+
+    성씨 규칙만으로는 이름으로 확정하지 않고, 이름 항목 뒤(name_context)가 아니면 uncertain 으로 분류합니다.
+    """
+    if not _HANGUL_WORD.fullmatch(word):
+        return None
+    if word in PROVINCES:
+        return "location"
+    is_name = _looks_like_name(word)
+    if is_name and name_context:
+        return "name"
+    if is_name and _looks_like_organization(word):
+        return None
+    if is_name:
+        return "uncertain"
+    if _looks_like_location(word):
+        return "location"
+    return None
+
+
+def _is_capitalized(word: str) -> bool:
+    # 약어(KAIST, API)는 인명/지명 후보에서 제외
+    return word[:1].isupper() and not word.isupper()
+
+
+class KiwiDetector:
+    def __init__(self, kiwi=None):
+        if kiwi is None:
+            from kiwipiepy import Kiwi
+            kiwi = Kiwi()
+        self._kiwi = kiwi
+
+    def detect(self, text: str) -> KiwiDetection:
+        detection = KiwiDetection()
+        latin_run: List = []
+
+        def flush_latin_run():
+            # 대문자로 시작하는 영문 단어로 시작하는 2단어 이상 연속 구간 (예: Michael Johnson, Lee sumin)
+            if len(latin_run) >= 2 and _is_capitalized(latin_run[0].form):
+                detection.uncertain.append((latin_run[0].start, latin_run[-1].start + latin_run[-1].len))
+            latin_run.clear()
+
+        for token in self._kiwi.tokenize(text):
+            if token.tag == "SL":
+                latin_run.append(token)
+                continue
+            flush_latin_run()
+
+            if token.tag != "NNP":
+                continue
+            label = classify_proper_noun(token.form, has_name_context(text, token.start))
+            span = (token.start, token.start + token.len)
+            if label == "uncertain":
+                detection.uncertain.append(span)
+            elif label is not None:
+                detection.entities.append(KiwiEntity(label, token.form, *span))
+        flush_latin_run()
+        return detection
+
+
+_kiwi_detector: Optional[KiwiDetector] = None
+_kiwi_status = "not_loaded"
+_kiwi_lock = threading.Lock()
+
+
+def get_kiwi_detector() -> Optional[KiwiDetector]:
+    """Kiwi 탐지기를 최초 사용 시 로드 (kiwipiepy가 없거나 로드 실패 시 None)"""
+    global _kiwi_detector, _kiwi_status
+    if _kiwi_detector is not None or _kiwi_status == "failed":
+        return _kiwi_detector
+
+    with _kiwi_lock:
+        if _kiwi_detector is None and _kiwi_status != "failed":
+            try:
+                _kiwi_detector = KiwiDetector()
+                _kiwi_status = "ready"
+            except Exception as e:
+                print(f"❌ Failed to load Kiwi morphological analyzer: {e}")
+                _kiwi_status = "failed"
+    return _kiwi_detector
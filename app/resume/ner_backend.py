@@ -0,0 +1,96 @@
+"""
+PII 탐지용 NER 추론 백엔드
+
+- torch: 기존 fp32 PyTorch 파이프라인
+- torch-int8: Linear 레이어를 동적 int8 양자화한 PyTorch 모델 (추가 의존성 없음)
+- onnx: ONNX Runtime 모델 (선택 의존성 optimum[onnxruntime] 필요, 최초 1회 export 후 로컬 캐시)
+  설치: pip install "optimum[onnxruntime]"
+
+세 백엔드 모두 transformers 토큰 분류 파이프라인(aggregation_strategy="simple")으로 감싸므로
+후처리와 출력 형식({"entity_group", "word", "start", "end", "score"})이 동일합니다.
+선택 의존성이 없으면 NER_BACKEND_FALLBACK=true(기본)일 때 torch로 대체하고, 실제로 로드된 백엔드는
+get_loaded_backend()(/health/ready 의 nerBackend)로 확인합니다.
+"""
+import os
+from typing import Dict, Optional
+from app.config import NER_MODEL_NAME, NER_BACKEND, NER_BACKEND_FALLBACK, NER_ONNX_CACHE_DIR
+
+NER_BACKENDS = ("torch", "torch-int8", "onnx")
+NER_AGGREGATION_STRATEGY = "simple"
+
+# 마지막으로 로드한 백엔드 정보 (요청 백엔드, 실제 로드된 백엔드, 대체 사유)
+_loaded_backend: Optional[Dict] = None
+
+
+def _build_pipeline(model, tokenizer):
+    from transformers import pipeline
+    return pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy=NER_AGGREGATION_STRATEGY)
+
+
+def _load_torch(model_name: str):
+    from transformers import pipeline
+    return pipeline("ner", model=model_name, aggregation_strategy=NER_AGGREGATION_STRATEGY)
+
+
+def _load_torch_int8(model_name: str):
+    import torch
+    from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForTokenClassification.from_pretrained(model_name)
+    model.eval()
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return _build_pipeline(quantized, tokenizer)
+
+
+def onnx_cache_path(model_name: str, cache_dir: str = NER_ONNX_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, model_name.replace("/", "--"))
+
+
+def _load_onnx(model_name: str, cache_dir: str = NER_ONNX_CACHE_DIR):
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    from transformers import AutoTokenizer
+
+    export_dir = onnx_cache_path(model_name, cache_dir)
+    if os.path.exists(os.path.join(export_dir, "model.onnx")):
+        model = ORTModelForTokenClassification.from_pretrained(export_dir)
+        tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    else:
+        print(f"📦 Exporting NER model to ONNX: {export_dir}")
+        model = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model.save_pretrained(export_dir)
+        tokenizer.save_pretrained(export_dir)
+    return _build_pipeline(model, tokenizer)
+
+
+_LOADERS = {
+    "torch": _load_torch,
+    "torch-int8": _load_torch_int8,
+    "onnx": _load_onnx,
+}
+
+
+def load_ner_pipeline(backend: str = NER_BACKEND, model_name: str = NER_MODEL_NAME,
+                      fallback: bool = NER_BACKEND_FALLBACK):
+    """설정된 백엔드로 NER 파이프라인을 생성 (선택 의존성이 없으면 fallback=True일 때만 torch 백엔드로 대체)"""
+    global _loaded_backend
+    if backend not in _LOADERS:
+        raise ValueError(f"Unknown NER backend: {backend} (available: {', '.join(NER_BACKENDS)})")
+
+    try:
+        ner = _LOADERS[backend](model_name)
+        _loaded_backend = {"requested": backend, "loaded": backend, "fallback_reason": None}
+        return ner
+    except ImportError as e:
+        if backend == "torch" or not fallback:
+            raise ImportError(f"NER backend '{backend}' requires an optional dependency: {e}") from e
+        print(f"⚠️ NER backend '{backend}' unavailable ({e}), falling back to torch")
+        ner = _load_torch(model_name)
+        _loaded_backend = {"requested": backend, "loaded": "torch", "fallback_reason": str(e)}
+        return ner
+
+
+def get_loaded_backend() -> Optional[Dict]:
+    """실제로 로드된 백엔드 정보 (아직 로드 전이면 None)"""
+    return dict(_loaded_backend) if _loaded_backend else None
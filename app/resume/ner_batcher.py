@@ -0,0 +1,119 @@
+"""
+동시 요청의 NER 추론을 하나의 배치로 묶어 실행하는 마이크로 배처
+
+요청은 텍스트를 큐에 넣고 결과를 기다리며, 워커는 최대 배치 크기 또는 최대 대기 시간까지
+텍스트를 모아 한 번의 패딩된 배치로 추론한 뒤 결과를 각 요청에 되돌려 줍니다.
+추론은 전용 단일 스레드에서 실행되어 이벤트 루프를 막지 않고, 배치 간 CPU 경쟁도 없습니다.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from app.config import NER_BATCH_MAX_SIZE, NER_BATCH_MAX_WAIT_MS
+
+
+def run_ner_batch(ner, texts: List[str], batch_size: Optional[int] = None) -> List[List[Dict]]:
+    """텍스트 목록을 파이프라인 배치 추론으로 실행하고 입력별 엔티티 목록을 반환"""
+    if not texts:
+        return []
+    outputs = ner(texts, batch_size=batch_size or len(texts))
+    # 입력이 하나면 파이프라인이 엔티티 목록을 그대로 반환
+    if len(texts) == 1 and (not outputs or isinstance(outputs[0], dict)):
+        outputs = [outputs]
+    return outputs
+
+
+class NERBatcher:
+    def __init__(self, get_model: Callable, max_batch_size: int = NER_BATCH_MAX_SIZE,
+                 max_wait_ms: float = NER_BATCH_MAX_WAIT_MS):
+        self._get_model = get_model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ner-batch")
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches = 0
+        self._texts = 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, text: str) -> List[Dict]:
+        """텍스트 하나의 NER 엔티티 목록을 반환"""
+        return (await self.submit_many([text]))[0]
+
+    async def submit_many(self, texts: List[str]) -> List[List[Dict]]:
+        """여러 텍스트를 큐에 넣고, 입력 순서대로 엔티티 목록을 반환"""
+        if not texts:
+            return []
+        queue = self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        # 이미 취소된 요청은 추론에서 제외
+        return [(text, future) for text, future in batch if not future.done()]
+
+    def _infer(self, texts: List[str]) -> List[List[Dict]]:
+        ner = self._get_model()
+        if ner is None:
+            return [[] for _ in texts]
+        return run_ner_batch(ner, texts)
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(queue)
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                outputs = await loop.run_in_executor(self._executor, self._infer, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self._batches += 1
+            self._texts += len(texts)
+            for (_, future), entities in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(entities)
+
+    async def stop(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    def get_stats(self) -> Dict:
+        return {
+            'batches': self._batches,
+            'texts': self._texts,
+            'avg_batch_size': self._texts / self._batches if self._batches else 0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_seconds * 1000
+        }
@@ -1,19 +1,252 @@
+import io
 import os
+import re
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
 import pdfplumber
 from fastapi import UploadFile
 import tempfile
 import shutil
+from app.config import PDF_EXTRACTOR, PDF_PARSE_WORKERS, PDF_PARALLEL_MIN_PAGES, PDF_PAGES_PER_TASK
 
-# PDF에서 텍스트 추출하는 함수
-def extract_text_from_pdf(file_path):
+def _as_pdf_source(source):
+    # bytes / memoryview는 메모리 버퍼로 감싸고, 경로와 파일 객체는 그대로 사용
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _describe_source(source) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return str(source)
+    return f"<{type(source).__name__}>"
+
+
+@contextmanager
+def _shared_pdf_path(source):
+    # 워커 프로세스에는 PDF 경로만 전달 (페이지 구간 작업마다 PDF 전체를 pickle 해서 보내지 않도록)
+    # 경로가 아니면 임시 파일에 한 번만 써 두고, 워커는 같은 파일(페이지 캐시)을 읽음
+    if isinstance(source, (str, os.PathLike)):
+        yield os.fspath(source)
+        return
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                f.write(source)
+            else:
+                source.seek(0)
+                shutil.copyfileobj(source, f)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+class PDFExtractor:
+    """페이지 단위 텍스트 추출기 인터페이스"""
+    name = ""
+
+    def page_count(self, source) -> int:
+        raise NotImplementedError
+
+    def extract_pages(self, source, pages: Sequence[int]) -> List[str]:
+        """지정한 페이지 인덱스의 텍스트를 같은 순서로 반환"""
+        raise NotImplementedError
+
+
+class PdfplumberExtractor(PDFExtractor):
+    """pdfminer 문자 단위 레이아웃 분석 (느리지만 다단 레이아웃 순서에 강함)"""
+    name = "pdfplumber"
+
+    def page_count(self, source) -> int:
+        with pdfplumber.open(_as_pdf_source(source)) as pdf:
+            return len(pdf.pages)
+
+    def extract_pages(self, source, pages: Sequence[int]) -> List[str]:
+        with pdfplumber.open(_as_pdf_source(source)) as pdf:
+            return [pdf.pages[i].extract_text() or "" for i in pages]
+
+
+# PDFium은 스레드 안전하지 않으므로 프로세스 내 모든 pdfium 호출(문서 열기~닫기)을 하나의 락으로 직렬화
+# (동시 요청은 PDF_PARSE_WORKERS 프로세스 풀로 병렬화)
+_pdfium_lock = threading.Lock()
+
+
+class PdfiumExtractor(PDFExtractor):
+    """PDFium 텍스트 레이어 추출 (네이티브 구현, pypdfium2 4.x/5.x 공통 API만 사용)"""
+    name = "pdfium"
+
+    def _open(self, source):
+        import pypdfium2 as pdfium
+        return pdfium.PdfDocument(_as_pdf_source(source))
+
+    def page_count(self, source) -> int:
+        with _pdfium_lock:
+            document = self._open(source)
+            try:
+                return len(document)
+            finally:
+                document.close()
+
+    def extract_pages(self, source, pages: Sequence[int]) -> List[str]:
+        with _pdfium_lock:
+            document = self._open(source)
+            try:
+                texts = []
+                for i in pages:
+                    page = document.get_page(i)
+                    textpage = page.get_textpage()
+                    try:
+                        text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+                    texts.append(text.replace("\r\n", "\n").replace("\r", "\n").strip())
+                return texts
+            finally:
+                document.close()
+
+
+PDF_EXTRACTORS: Dict[str, PDFExtractor] = {
+    "pdfium": PdfiumExtractor(),
+    "pdfplumber": PdfplumberExtractor(),
+}
+FALLBACK_EXTRACTOR = PDF_EXTRACTORS["pdfplumber"]
+
+# 깨진 글리프/제어문자 비율, 한두 글자씩 끊긴 줄 비율이 이 값을 넘으면 품질이 낮은 페이지로 판단
+MAX_GARBLED_CHAR_RATIO = 0.05
+MAX_FRAGMENTED_LINE_RATIO = 0.5
+MIN_LINES_FOR_FRAGMENT_CHECK = 10
+_GARBLED_CHARS = re.compile(r"[\ufffd\ue000-\uf8ff\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def get_extractor(name: str) -> PDFExtractor:
+    if name not in PDF_EXTRACTORS:
+        raise ValueError(f"Unknown PDF_EXTRACTOR '{name}' (expected one of {', '.join(PDF_EXTRACTORS)})")
+    return PDF_EXTRACTORS[name]
+
+
+def is_low_quality_page(text: str) -> bool:
+    """빈 페이지, 깨진 문자, 단 순서가 뒤섞여 한두 글자씩 끊긴 출력을 감지"""
+    stripped = text.strip()
+    if not stripped:
+        return True
+    if len(_GARBLED_CHARS.findall(stripped)) / len(stripped) > MAX_GARBLED_CHAR_RATIO:
+        return True
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    if len(lines) >= MIN_LINES_FOR_FRAGMENT_CHECK:
+        fragmented = sum(1 for line in lines if len(line.strip()) <= 2)
+        if fragmented / len(lines) > MAX_FRAGMENTED_LINE_RATIO:
+            return True
+    return False
+
+
+def _extract_range(source, start: int, end: int, extractor_name: str) -> List[str]:
+    extractor = get_extractor(extractor_name)
+    texts = extractor.extract_pages(source, range(start, end))
+    if extractor is FALLBACK_EXTRACTOR:
+        return texts
+
+    retry = [start + i for i, text in enumerate(texts) if is_low_quality_page(text)]
+    if retry:
+        # 품질이 낮은 페이지만 pdfplumber로 다시 추출
+        for page_index, text in zip(retry, FALLBACK_EXTRACTOR.extract_pages(source, retry)):
+            texts[page_index - start] = text
+    return texts
+
+
+def _page_ranges(page_count: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + pages_per_task, page_count)) for start in range(0, page_count, pages_per_task)]
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int, extractor_name: str = PDF_EXTRACTOR) -> List[str]:
+    # 워커 프로세스에서 실행: [start, end) 페이지의 텍스트를 순서대로 반환
+    return _extract_range(pdf_path, start, end, extractor_name)
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def get_pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """요청 간 재사용하는 PDF 추출 프로세스 풀 (최초 사용 시 생성, PDF_PARSE_WORKERS=0 이면 None)"""
+    global _pdf_pool
+    if PDF_PARSE_WORKERS <= 0:
+        return None
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                # 스레드가 있는 서버 프로세스에서 fork 하지 않도록 spawn 사용
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=PDF_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pdf_pool
+
+
+def shutdown_pdf_pool():
+    """앱 종료 시 PDF 추출 워커 정리"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pages_parallel(pool: ProcessPoolExecutor, source, page_count: int, extractor_name: str) -> List[str]:
+    with _shared_pdf_path(source) as pdf_path:
+        futures = [
+            pool.submit(_extract_page_range, pdf_path, start, end, extractor_name)
+            for start, end in _page_ranges(page_count, PDF_PAGES_PER_TASK)
+        ]
+        try:
+            # 제출 순서대로 결과를 모아 페이지 순서 유지
+            return [text for future in futures for text in future.result()]
+        finally:
+            # 실패 시 임시 파일을 지우기 전에 아직 시작하지 않은 작업 취소
+            for future in futures:
+                future.cancel()
+
+
+def _extract_pages(source, extractor_name: str) -> List[str]:
+    extractor = get_extractor(extractor_name)
+    try:
+        page_count = extractor.page_count(source)
+    except Exception as e:
+        if extractor is FALLBACK_EXTRACTOR:
+            raise
+        # 빠른 추출기가 열지 못하는 손상된 PDF는 문서 전체를 pdfplumber로 처리
+        print(f"⚠️ {extractor.name} 로 PDF를 열지 못해 {FALLBACK_EXTRACTOR.name} 로 전환: {e}")
+        extractor_name = FALLBACK_EXTRACTOR.name
+        page_count = FALLBACK_EXTRACTOR.page_count(source)
+    pool = get_pdf_pool() if page_count >= PDF_PARALLEL_MIN_PAGES else None
+    if pool is None:
+        return _extract_range(source, 0, page_count, extractor_name)
+
+    try:
+        return _extract_pages_parallel(pool, source, page_count, extractor_name)
+    except BrokenProcessPool as e:
+        # 워커가 비정상 종료된 경우 풀을 다시 만들도록 버리고 현재 프로세스에서 추출
+        print(f"⚠️ PDF 추출 워커 풀 오류, 순차 추출로 전환: {e}")
+        shutdown_pdf_pool()
+        return _extract_range(source, 0, page_count, extractor_name)
+
+
+# PDF에서 텍스트 추출하는 함수 (파일 경로, bytes/memoryview, BytesIO 등 바이너리 파일 객체 지원)
+def extract_text_from_pdf(source, extractor: str = PDF_EXTRACTOR):
     try:
-        with pdfplumber.open(file_path) as pdf:
-            text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-            clean_text = text.strip()
+        text = "\n".join(_extract_pages(source, extractor))
+        clean_text = text.strip()
         if not clean_text:
-            print(f"PDF에서 텍스트가 추출되지 않았습니다: {file_path}")
+            print(f"PDF에서 텍스트가 추출되지 않았습니다: {_describe_source(source)}")
             return None  # 빈 PDF인 경우
         return clean_text
     except Exception as e:
         print(f"PDF 텍스트 추출 오류: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -1,7 +1,15 @@
-from transformers import pipeline
-from app.core.regex_utils import detect_regex_pii
-from typing import Dict
-import logging
+import asyncio
+import bisect
+import threading
+from app.core.regex_utils import PIISpan, scan_pii, group_pii_spans
+from app.config import ENABLE_NER, NER_CHUNK_BATCH_SIZE, NER_STRATEGY
+from app.resume.ner_backend import load_ner_pipeline
+from app.resume.ner_batcher import NERBatcher, run_ner_batch
+from app.resume.chunker import TextChunk, chunk_text, merge_chunk_entities
+from app.resume.redactor import RedactionSpan, find_word_spans, redact
+from app.resume.entity_matcher import get_dictionary_matcher
+from app.resume.kiwi_detector import get_kiwi_detector
+from typing import Dict, List, Optional, Tuple
 
 NER_LABEL_MAP = {
     "PER": "name",
@@ -9,29 +17,146 @@ NER_LABEL_MAP = {
     "ORG": "organization",
     "MISC": "misc"
 }
+KIWI_ENTITY_GROUPS = {"name": "PER", "location": "LOC"}
 
-try:
-    print("📦 Loading NER model for PII detection...")
-    ner = pipeline("ner", model="FacebookAI/xlm-roberta-large-finetuned-conll03-english", aggregation_strategy="simple")
-    print("✅ NER model loaded successfully")
-except Exception as e:
-    print(f"❌ Failed to load NER model: {e}")
-    ner = None
+# NER 모델 상태: disabled / not_loaded / loading / ready / failed
+_ner = None
+_ner_status = "not_loaded" if ENABLE_NER else "disabled"
+_ner_lock = threading.Lock()
 
-def detect_pii(text: str, debug: bool = False) -> Dict:
+
+def _load_ner():
+    # torch / transformers import는 실제 로드 시점까지 지연 (백엔드는 NER_BACKEND로 선택)
+    return load_ner_pipeline()
+
+
+def get_ner():
+    """NER 파이프라인을 최초 사용 시 로드 (로드 실패 또는 비활성화 시 None)"""
+    global _ner, _ner_status
+    if _ner is not None or _ner_status in ("disabled", "failed"):
+        return _ner
+
+    with _ner_lock:
+        if _ner is None and _ner_status not in ("disabled", "failed"):
+            _ner_status = "loading"
+            try:
+                print("📦 Loading NER model for PII detection...")
+                _ner = _load_ner()
+                _ner_status = "ready"
+                print("✅ NER model loaded successfully")
+            except Exception as e:
+                print(f"❌ Failed to load NER model: {e}")
+                _ner_status = "failed"
+    return _ner
+
+
+def get_ner_status() -> str:
+    return _ner_status
+
+
+def start_ner_warmup() -> Optional[threading.Thread]:
+    """요청 처리를 막지 않도록 백그라운드 스레드에서 NER 모델을 미리 로드"""
+    global _ner_status
+    with _ner_lock:
+        if _ner_status != "not_loaded":
+            return None
+        _ner_status = "loading"
+
+    def _warm_up():
+        if NER_STRATEGY == "hybrid":
+            get_kiwi_detector()
+        get_ner()
+
+    thread = threading.Thread(target=_warm_up, name="ner-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# 동시 요청의 NER 추론을 묶어 실행하는 공유 배처 (비동기 경로용)
+ner_batcher = NERBatcher(get_ner)
+
+
+def _chunk_for_ner(text: str) -> List[TextChunk]:
+    # 모델 토크나이저 기준으로 분할 (모델이 없으면 근사 토큰 기준)
+    ner = get_ner()
+    return chunk_text(text, getattr(ner, "tokenizer", None))
+
+
+def _plan_ner(text: str) -> Tuple[List[Dict], List[TextChunk]]:
+    """Kiwi 1차 탐지 엔티티와, 트랜스포머 NER로 보낼 청크(불확실 구간이 포함된 청크만)를 반환"""
+    chunks = _chunk_for_ner(text)
+    kiwi = get_kiwi_detector() if NER_STRATEGY == "hybrid" else None
+    if kiwi is None:
+        return [], chunks
+
+    detection = kiwi.detect(text)
+    entities = [
+        {"entity_group": KIWI_ENTITY_GROUPS[ent.label], "word": ent.word, "start": ent.start, "end": ent.end,
+         "score": 1.0, "source": "kiwi"}
+        for ent in detection.entities
+    ]
+    uncertain_chunks = [
+        chunk for chunk in chunks
+        if any(start < chunk.start + len(chunk.text) and chunk.start < end for start, end in detection.uncertain)
+    ]
+    return entities, uncertain_chunks
+
+
+def detect_pii(text: str, debug: bool = False, return_spans: bool = False) -> Dict:
+    kiwi_entities, chunks = _plan_ner(text)
+    ner = get_ner()
     if ner is None:
-        print("⚠️ NER model not available, using regex-only PII detection")
-        ner_entities = []
+        print("⚠️ NER model not available, skipping transformer NER")
+        chunk_entities = []
     else:
-        ner_entities = ner(text)
-    regex_result = detect_regex_pii(text)
+        chunk_entities = run_ner_batch(ner, [chunk.text for chunk in chunks], batch_size=NER_CHUNK_BATCH_SIZE)
+    ner_entities = kiwi_entities + merge_chunk_entities(chunks, chunk_entities)
+    return _build_pii_result(text, ner_entities, debug, return_spans)
+
+
+async def adetect_pii(text: str, debug: bool = False, return_spans: bool = False) -> Dict:
+    """detect_pii의 비동기 버전. 청크별 NER 추론은 다른 요청과 함께 마이크로 배치로 실행"""
+    # 형태소 분석/토큰화(및 최초 모델 로드)는 이벤트 루프 밖에서 실행
+    kiwi_entities, chunks = await asyncio.to_thread(_plan_ner, text)
+    chunk_entities = await ner_batcher.submit_many([chunk.text for chunk in chunks])
+    ner_entities = kiwi_entities + merge_chunk_entities(chunks, chunk_entities)
+    # 정규식/사전(Aho-Corasick) 스캔과 마스킹도 긴 이력서에서는 수십 ms가 걸리므로 이벤트 루프 밖에서 실행
+    return await asyncio.to_thread(_build_pii_result, text, ner_entities, debug, return_spans)
+
+
+def _inside_spans(start: int, end: int, spans: List[PIISpan], starts: List[int]) -> bool:
+    # spans는 위치 순으로 정렬되어 있고 서로 겹치지 않음 (starts는 각 스팬의 시작 위치)
+    index = bisect.bisect_right(starts, start) - 1
+    return index >= 0 and spans[index].end >= end
+
+
+def _build_pii_result(text: str, ner_entities: List[Dict], debug: bool = False, return_spans: bool = False) -> Dict:
+    regex_spans = scan_pii(text)
+    regex_result = group_pii_spans(regex_spans)
+
+    # 사전(학교 약칭 등) 매치는 규칙 기반 탐지 결과(regex_result)에 합산
+    # 정규식 스팬 안에 들어가는 매치는 제외 (한양대학교 안의 한양대를 따로 보고하지 않도록)
+    regex_starts = [span.start for span in regex_spans]
+    dictionary_spans = [
+        RedactionSpan(label, start, end, "dictionary")
+        for start, end, label in get_dictionary_matcher().find_all(text)
+        if not _inside_spans(start, end, regex_spans, regex_starts)
+    ]
+    for span in dictionary_spans:
+        values = regex_result.setdefault(span.label, [])
+        if text[span.start:span.end] not in values:
+            values.append(text[span.start:span.end])
 
     ner_result = {}
+    ner_spans = []
     for ent in ner_entities:
         raw_label = ent["entity_group"].upper()
         mapped_label = NER_LABEL_MAP.get(raw_label)
         if mapped_label in ["name", "location"]:  # 원하는 항목만 포함
-            ner_result.setdefault(mapped_label, []).append(ent["word"])
+            ner_result.setdefault(mapped_label, {})[ent["word"]] = None  # 중복 제거 (첫 등장 순서 유지)
+            if ent.get("start") is not None and ent.get("end") is not None:
+                ner_spans.append(RedactionSpan(mapped_label, ent["start"], ent["end"], ent.get("source", "ner")))
+    ner_result = {label: list(words) for label, words in ner_result.items()}
 
     if debug:
         print("\n📌 [NER 결과]")
@@ -42,26 +167,26 @@ def detect_pii(text: str, debug: bool = False) -> Dict:
         for label, items in regex_result.items():
             print(f"- {label}: {list(set(items))}")
 
-    masked_text = text
-
-    for label, matches in regex_result.items():
-        for match in set(matches):
-            match_str = "".join(match) if isinstance(match, tuple) else match
-            masked_text = masked_text.replace(match_str, f"[REDACTED_{label.upper()}]")
-
-    for label, words in ner_result.items():
-        for word in sorted(set(words), key=len, reverse=True):
-            masked_text = masked_text.replace(word, f"[REDACTED_{label.upper()}]")
+    # NER로 탐지된 단어는 탐지 위치뿐 아니라 텍스트 내 모든 등장 위치를 마스킹
+    spans = [RedactionSpan(span.label, span.start, span.end, "regex") for span in regex_spans]
+    spans += dictionary_spans + ner_spans + find_word_spans(text, ner_result)
+    masked_text, applied_spans = redact(text, spans)
 
     detected_labels = set(regex_result.keys()) | set(ner_result.keys())
 
-    return {
+    result = {
         "regex_result": regex_result,
         "ner_result": ner_result,
         "anonymized_text": masked_text,
         "detected_pii_fields": list(detected_labels),
         "deleted_fields": list(detected_labels)
     }
+    if return_spans:
+        result["redacted_spans"] = [
+            {"label": span.label, "start": span.start, "end": span.end, "source": span.source}
+            for span in applied_spans
+        ]
+    return result
 
 # 테스트용
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+"""
+PII 감사 로그 배치 전송기
+
+요청 경로에서는 로그 한 건을 로컬 스풀 파일(JSON Lines)에 추가만 하고,
+백그라운드 태스크가 주기적으로 또는 배치 크기 도달 시 스풀을 잘라 gzip 압축한 JSONL 객체 하나로 S3에 올립니다.
+
+- 스풀 파일은 워커 프로세스(pid)별로 분리되어 여러 uvicorn 워커가 같은 디렉터리를 써도 섞이지 않음
+- 업로드에 실패한 배치 파일은 지우지 않고 다음 주기에 재시도
+- 시작 시 종료된 프로세스가 남긴 스풀/배치 파일을 복구해 전송
+- 앱 종료 시 남은 로그를 모두 전송
+"""
+import asyncio
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from app.config import (
+    PII_LOG_SPOOL_DIR, PII_LOG_FLUSH_INTERVAL_SECONDS, PII_LOG_BATCH_MAX_RECORDS, PII_LOG_BATCH_MAX_BYTES,
+    PII_LOG_SPOOL_FSYNC, PII_LOG_KEY_PREFIX
+)
+from app.core.s3_utils import upload_file_to_s3
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class PIILogShipper:
+    def __init__(self, spool_dir: str = PII_LOG_SPOOL_DIR,
+                 flush_interval_seconds: float = PII_LOG_FLUSH_INTERVAL_SECONDS,
+                 max_batch_records: int = PII_LOG_BATCH_MAX_RECORDS,
+                 max_batch_bytes: int = PII_LOG_BATCH_MAX_BYTES,
+                 fsync: bool = PII_LOG_SPOOL_FSYNC,
+                 key_prefix: str = PII_LOG_KEY_PREFIX,
+                 upload: Optional[Callable[..., bool]] = None):
+        self.spool_dir = spool_dir
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_records = max_batch_records
+        self.max_batch_bytes = max_batch_bytes
+        self.fsync = fsync
+        self.key_prefix = key_prefix.rstrip("/")
+        self._upload = upload
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._upload_lock = threading.Lock()
+        self._spool_file = None
+        self._records = 0
+        self._bytes = 0
+        self._seq = 0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._shipped_records = 0
+        self._shipped_batches = 0
+        self._failed_uploads = 0
+
+    @property
+    def _current_path(self) -> str:
+        return os.path.join(self.spool_dir, f"current-{self._pid}.jsonl")
+
+    def record(self, payload: Dict) -> None:
+        """로그 한 건을 스풀에 추가 (배치 크기에 도달하면 잘라서 전송 대기열로 넘김)"""
+        line = (json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if self._spool_file is None:
+                os.makedirs(self.spool_dir, exist_ok=True)
+                self._spool_file = open(self._current_path, "ab")
+            self._spool_file.write(line)
+            self._spool_file.flush()
+            if self.fsync:
+                os.fsync(self._spool_file.fileno())
+            self._records += 1
+            self._bytes += len(line)
+            full = self._records >= self.max_batch_records or self._bytes >= self.max_batch_bytes
+            if full:
+                self._rotate_locked()
+
+        if full and self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 경우 다음 flush 때 전송
+                pass
+
+    def _rotate_locked(self) -> Optional[str]:
+        # 현재 스풀 파일을 배치 파일로 이름 변경 (원자적), 이후 기록은 새 스풀 파일로
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+        if not os.path.exists(self._current_path) or os.path.getsize(self._current_path) == 0:
+            return None
+        batch_path = self._new_batch_path()
+        os.replace(self._current_path, batch_path)
+        self._records = 0
+        self._bytes = 0
+        return batch_path
+
+    def _new_batch_path(self) -> str:
+        self._seq += 1
+        return os.path.join(self.spool_dir, f"batch-{self._pid}-{time.time_ns()}-{self._seq}.jsonl")
+
+    def _recover_orphans(self) -> None:
+        # 종료된 프로세스가 남긴 스풀/배치 파일을 이 프로세스의 배치 파일로 넘겨 전송
+        if not os.path.isdir(self.spool_dir):
+            return
+        for pattern in ("current-*.jsonl", "batch-*.jsonl"):
+            for path in glob.glob(os.path.join(self.spool_dir, pattern)):
+                try:
+                    pid = int(os.path.basename(path).split("-")[1].split(".")[0])
+                except (IndexError, ValueError):
+                    continue
+                if pid != self._pid and not _pid_alive(pid):
+                    try:
+                        os.replace(path, self._new_batch_path())
+                    except FileNotFoundError:
+                        # 동시에 시작한 다른 워커가 먼저 가져감
+                        continue
+
+    def _pending_batches(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.spool_dir, f"batch-{self._pid}-*.jsonl")))
+
+    def _object_key(self) -> str:
+        now = datetime.now(timezone.utc)
+        return f"{self.key_prefix}/{now:%Y/%m/%d}/{now:%H%M%S}-{self._pid}-{uuid.uuid4().hex[:8]}.jsonl.gz"
+
+    def _ship_batch(self, path: str) -> bool:
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data:
+            os.remove(path)
+            return True
+
+        upload = self._upload or upload_file_to_s3
+        if not upload(file_bytes=gzip.compress(data), object_key=self._object_key(), content_type="application/gzip"):
+            self._failed_uploads += 1
+            return False
+        os.remove(path)
+        self._shipped_batches += 1
+        self._shipped_records += data.count(b"\n")
+        return True
+
+    def flush(self, rotate: bool = True) -> int:
+        """스풀을 잘라 대기 중인 배치를 모두 전송하고, 전송한 배치 수를 반환 (블로킹)"""
+        with self._upload_lock:
+            if rotate:
+                with self._lock:
+                    self._rotate_locked()
+            shipped = 0
+            for path in self._pending_batches():
+                if not self._ship_batch(path):
+                    # 실패한 배치는 남겨 두고 다음 주기에 재시도
+                    break
+                shipped += 1
+            return shipped
+
+    async def _periodic_flush(self):
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                # 크기 초과로 깨어난 경우 이미 잘린 배치만 전송, 주기 도달 시에는 현재 스풀도 잘라서 전송
+                rotate = not self._wakeup.is_set()
+                self._wakeup.clear()
+                await asyncio.to_thread(self.flush, rotate)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"PII 로그 전송 중 오류: {e}")
+
+    async def start(self):
+        """백그라운드 전송 태스크 시작 (이전 프로세스가 남긴 로그 복구 포함)"""
+        if self._task is None or self._task.done():
+            with self._lock:
+                self._recover_orphans()
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._periodic_flush())
+            print(f"PII 로그 전송 태스크 시작 (주기: {self.flush_interval_seconds}초)")
+
+    async def stop(self):
+        """백그라운드 태스크를 멈추고 남은 로그를 모두 전송"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._loop = None
+        await asyncio.to_thread(self.flush)
+        print("🛑 PII 로그 전송 태스크 중단됨")
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'spooled_records': self._records,
+                'spooled_bytes': self._bytes,
+                'pending_batches': len(self._pending_batches()) if os.path.isdir(self.spool_dir) else 0,
+                'shipped_batches': self._shipped_batches,
+                'shipped_records': self._shipped_records,
+                'failed_uploads': self._failed_uploads
+            }
+
+
+# 전역 PII 로그 전송기 인스턴스 (싱글톤)
+pii_log_shipper = PIILogShipper()
@@ -0,0 +1,103 @@
+"""
+이력서 처리 파이프라인 (다운로드 → 텍스트 추출 → PII 제거 → DB 저장 → PII 로그 기록)
+
+동기 엔드포인트(/file)와 백그라운드 작업(/file/jobs)이 같은 단계를 공유합니다.
+블로킹 호출(PDF 파싱, 로그 스풀 기록)은 스레드에서, DB는 비동기 커넥션 풀로 실행해 이벤트 루프를 막지 않습니다.
+"""
+import asyncio
+from typing import Callable, Dict, Optional, Tuple
+from app.schemas.resume import ResumeProcessRequest
+from app.resume.parser import extract_text_from_pdf
+from app.resume.downloader import download_pdf, PDFDownloadError
+from app.resume.pii_detector import adetect_pii
+from app.resume.pii_logger import create_pii_log_payload
+from app.resume.pii_log_shipper import pii_log_shipper
+from app.resume.result_cache import resume_result_cache, hash_pdf_file, hash_text
+from app.core.mysql_utils import aupdate_redacted_resume_content
+
+PIPELINE_STAGES = ("download", "extract", "pii", "db", "log")
+
+
+class ResumeProcessingError(Exception):
+    """파이프라인 단계 실패 (HTTP 상태 코드와 실패한 단계 포함)"""
+
+    def __init__(self, status_code: int, detail: str, stage: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.stage = stage
+
+
+def _hash_and_extract(pdf_file) -> Tuple[str, Optional[Dict], Optional[str]]:
+    # PDF 해시로 캐시를 먼저 조회하고, 없을 때만 텍스트 추출 (스레드에서 실행)
+    pdf_hash = hash_pdf_file(pdf_file)
+    cached = resume_result_cache.get_by_pdf(pdf_hash)
+    if cached is not None:
+        return pdf_hash, cached, None
+    return pdf_hash, None, extract_text_from_pdf(pdf_file)
+
+
+async def process_resume_document(request: ResumeProcessRequest,
+                                  on_stage: Optional[Callable[..., None]] = None) -> Optional[str]:
+    """이력서 한 건을 처리 (실패 시 ResumeProcessingError)
+
+    각 단계 시작 시 on_stage(단계명), 캐시 적중으로 생략한 단계는 on_stage(단계명, skipped=True)를 호출하며,
+    캐시 적중 종류("pdf" / "text")를 반환합니다 (미적중 시 None).
+    """
+    def enter(stage: str, skipped: bool = False):
+        if on_stage is None:
+            return
+        if skipped:
+            on_stage(stage, skipped=True)
+        else:
+            on_stage(stage)
+
+    # 1. PDF 다운로드 (이벤트 루프를 막지 않는 스트리밍 다운로드)
+    enter("download")
+    try:
+        pdf_file = await download_pdf(str(request.fileUrl))
+    except PDFDownloadError as e:
+        raise ResumeProcessingError(400, f"PDF 다운로드 실패: {str(e)}", "download")
+
+    # 2~3. 텍스트 추출 (같은 PDF의 결과가 캐시에 있으면 추출과 PII 탐지를 생략)
+    enter("extract")
+    with pdf_file:
+        pdf_hash, pii_result, extracted_text = await asyncio.to_thread(_hash_and_extract, pdf_file)
+
+    if pii_result is not None:
+        cache_hit = "pdf"
+        enter("pii", skipped=True)
+    else:
+        if not extracted_text:
+            raise ResumeProcessingError(400, "PDF에서 텍스트를 추출하지 못했습니다.", "extract")
+
+        # 4. PII 제거 (바이트는 달라도 추출 텍스트가 같으면 이전 결과 재사용)
+        pii_result = resume_result_cache.get_by_text(hash_text(extracted_text))
+        cache_hit = "text" if pii_result is not None else None
+        enter("pii", skipped=cache_hit is not None)
+        if pii_result is None:
+            pii_result = await adetect_pii(extracted_text)
+        resume_result_cache.set(pdf_hash, extracted_text, pii_result)
+    anonymized_text = pii_result["anonymized_text"]
+
+    # 5. DB 업데이트
+    enter("db")
+    success = await aupdate_redacted_resume_content(
+        document_id=request.documentId,
+        redacted_text=anonymized_text
+    )
+
+    if not success:
+        raise ResumeProcessingError(500, "DB 저장 실패", "db")
+
+    # 6. PII 로그 기록 (로컬 스풀에 추가, S3에는 백그라운드에서 배치로 전송)
+    enter("log")
+    pii_payload = create_pii_log_payload(
+        user_id=request.userId,
+        file_id=str(request.documentId),
+        original_filename=f"{request.documentId}.pdf",
+        regex_result=pii_result["regex_result"],
+        ner_result=pii_result["ner_result"]
+    )
+    await asyncio.to_thread(pii_log_shipper.record, pii_payload)
+    return cache_hit
@@ -0,0 +1,61 @@
+"""
+정규식/NER 탐지 결과를 문자 스팬으로 모아 겹침을 정리한 뒤, 한 번의 선형 순회로 마스킹합니다.
+
+겹치는 스팬은 하나의 구간으로 합쳐(부분 노출 방지) 우선순위가 가장 높은 라벨로 치환하며,
+이미 치환된 [REDACTED_*] 토큰 안을 다시 치환하는 일이 없습니다.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+from app.core.regex_utils import PII_SCAN_ORDER
+from app.resume.entity_matcher import build_entity_matcher
+
+# 정규식 항목(PII_SCAN_ORDER 순) 다음에 NER 항목
+REDACTION_PRIORITY = PII_SCAN_ORDER + ("name", "location")
+
+
+@dataclass(frozen=True)
+class RedactionSpan:
+    label: str
+    start: int
+    end: int
+    source: str  # "regex" / "ner"
+
+
+def _rank(label: str) -> int:
+    return REDACTION_PRIORITY.index(label) if label in REDACTION_PRIORITY else len(REDACTION_PRIORITY)
+
+
+def find_word_spans(text: str, words_by_label: Dict[str, Iterable[str]], source: str = "ner") -> List[RedactionSpan]:
+    """탐지된 단어가 텍스트에 나오는 모든 위치를 스팬으로 반환 (Aho-Corasick, 긴 단어 우선, 한 번의 스캔)"""
+    matcher = build_entity_matcher(words_by_label, rank=_rank)
+    if not matcher.size:
+        return []
+    return [RedactionSpan(label, start, end, source) for start, end, label in matcher.find_all(text)]
+
+
+def merge_spans(spans: Sequence[RedactionSpan]) -> List[RedactionSpan]:
+    """겹치는 스팬을 하나로 합치고, 라벨은 우선순위가 가장 높은 것을 사용"""
+    merged: List[RedactionSpan] = []
+    for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+        if span.end <= span.start:
+            continue
+        if merged and span.start < merged[-1].end:
+            last = merged[-1]
+            winner = last if _rank(last.label) <= _rank(span.label) else span
+            merged[-1] = RedactionSpan(winner.label, last.start, max(last.end, span.end), winner.source)
+        else:
+            merged.append(span)
+    return merged
+
+
+def redact(text: str, spans: Sequence[RedactionSpan]) -> Tuple[str, List[RedactionSpan]]:
+    """스팬을 [REDACTED_<LABEL>] 로 치환한 텍스트와 실제 적용된 스팬 목록을 반환"""
+    applied = merge_spans(spans)
+    parts = []
+    position = 0
+    for span in applied:
+        parts.append(text[position:span.start])
+        parts.append(f"[REDACTED_{span.label.upper()}]")
+        position = span.end
+    parts.append(text[position:])
+    return "".join(parts), applied
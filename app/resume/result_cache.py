@@ -0,0 +1,70 @@
+"""
+이력서 처리 결과 캐시 (같은 PDF 재업로드 시 텍스트 추출/NER/마스킹 생략)
+
+- PDF 바이트의 SHA-256 → PII 탐지/마스킹 결과
+- 추출 텍스트의 SHA-256 → PII 탐지/마스킹 결과 (다시 내보낸 PDF처럼 바이트는 달라도 텍스트가 같은 경우)
+캐시 적중 시에도 DB 저장과 PII 로그 기록은 매번 수행합니다.
+"""
+import hashlib
+import json
+from typing import Dict, Optional
+from app.config import RESUME_RESULT_CACHE_MAX_ENTRIES, RESUME_RESULT_CACHE_TTL_SECONDS, RESUME_RESULT_CACHE_MAX_BYTES
+from app.core.ttl_cache import TTLCache
+
+HASH_CHUNK_SIZE = 1024 * 1024
+RESULT_KEYS = ("anonymized_text", "regex_result", "ner_result")
+
+
+def hash_pdf_file(file_obj) -> str:
+    """파일 객체 전체의 SHA-256 (읽은 뒤 처음 위치로 되감음)"""
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _result_size(value: Dict) -> int:
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class ResumeResultCache:
+    def __init__(self, max_entries: int = RESUME_RESULT_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = RESUME_RESULT_CACHE_TTL_SECONDS,
+                 max_bytes: int = RESUME_RESULT_CACHE_MAX_BYTES):
+        self._by_pdf = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds,
+                                max_bytes=max_bytes, sizeof=_result_size)
+        self._by_text = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds,
+                                 max_bytes=max_bytes, sizeof=_result_size)
+
+    def get_by_pdf(self, pdf_hash: str) -> Optional[Dict]:
+        """PDF 해시로 조회"""
+        return self._by_pdf.get(pdf_hash)
+
+    def get_by_text(self, text_hash: str) -> Optional[Dict]:
+        """추출 텍스트 해시로 조회"""
+        return self._by_text.get(text_hash)
+
+    def set(self, pdf_hash: str, extracted_text: str, pii_result: Dict) -> None:
+        result = {key: pii_result[key] for key in RESULT_KEYS}
+        self._by_text.set(hash_text(extracted_text), result)
+        self._by_pdf.set(pdf_hash, result)
+
+    def clear(self) -> None:
+        self._by_pdf.clear()
+        self._by_text.clear()
+
+    def get_stats(self) -> Dict:
+        return {
+            'pdf': self._by_pdf.get_stats(),
+            'text': self._by_text.get_stats()
+        }
+
+
+# 전역 결과 캐시 인스턴스 (싱글톤)
+resume_result_cache = ResumeResultCache()
@@ -1,5 +1,7 @@
+import asyncio
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
+from app.config import INTERVIEW_ONLY
 
 router = APIRouter(
     tags=["Health Check"],
@@ -14,4 +16,56 @@ async def health_check():
         "status": "UP",
         "timestamp": datetime.now().isoformat(),
         "service": "Jemyeonso-AI"
-    })
\ No newline at end of file
+    })
+
+
+@router.get("/health/ready", summary="레디니스 체크", response_description="트래픽 수신 가능 여부 반환")
+async def readiness_check():
+    if INTERVIEW_ONLY:
+        ner_status, ner_backend = "skipped", None
+    else:
+        from app.resume.pii_detector import get_ner_status
+        from app.resume.ner_backend import get_loaded_backend
+        ner_status, ner_backend = get_ner_status(), get_loaded_backend()
+
+    # NER 로드 실패 시에는 정규식 전용 탐지로 동작하므로 준비 완료로 간주
+    ready = ner_status != "loading"
+    return JSONResponse(status_code=200 if ready else 503, content={
+        "status": "READY" if ready else "LOADING",
+        "ner": ner_status,
+        # 실제로 로드된 NER 백엔드 (선택 의존성이 없어 torch로 대체된 경우 fallback_reason 포함)
+        "nerBackend": ner_backend,
+        "service": "Jemyeonso-AI"
+    })
+
+
+@router.get("/health/db", summary="DB 커넥션 풀 상태", response_description="커넥션 풀 크기, 사용률, 대기 시간 지표 반환")
+async def db_pool_stats():
+    from app.core.async_mysql import async_pool
+    return JSONResponse(status_code=200, content=async_pool.get_stats())
+
+
+@router.get("/health/ner", summary="NER 마이크로 배칭 상태", response_description="배치 수, 평균 배치 크기, 대기 시간 설정 반환")
+async def ner_batcher_stats():
+    if INTERVIEW_ONLY:
+        return JSONResponse(status_code=200, content={"status": "skipped"})
+    from app.resume.pii_detector import ner_batcher
+    return JSONResponse(status_code=200, content=ner_batcher.get_stats())
+
+
+@router.get("/health/jobs", summary="이력서 처리 작업 큐 상태", response_description="워커 ID, 대기/실행/완료 작업 수 반환")
+async def resume_job_stats():
+    if INTERVIEW_ONLY:
+        return JSONResponse(status_code=200, content={"status": "skipped"})
+    from app.resume.jobs import resume_job_queue
+    return JSONResponse(status_code=200, content=resume_job_queue.get_stats())
+
+
+@router.get("/health/pii-log", summary="PII 감사 로그 전송 상태", response_description="스풀 크기, 대기 배치 수, 전송/실패 건수 반환")
+async def pii_log_shipper_stats():
+    if INTERVIEW_ONLY:
+        return JSONResponse(status_code=200, content={"status": "skipped"})
+    from app.resume.pii_log_shipper import pii_log_shipper
+    # 대기 배치 수는 스풀 디렉터리를 조회하므로 이벤트 루프 밖에서 실행
+    stats = await asyncio.to_thread(pii_log_shipper.get_stats)
+    return JSONResponse(status_code=200, content=stats)
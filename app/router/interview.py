@@ -3,6 +3,9 @@ from typing import List
 from app.interview.answer_analyzer import analyze_answer
 from app.interview.question_generator import generate_question, fallback_question
 from app.core.question_cache import question_cache
+from app.core.llm_utils import get_llm_cache_stats
+from app.core.mysql_utils import invalidate_resume_text, get_resume_text_cache_stats
+from app.config import INTERVIEW_ONLY
 from app.schemas.interview import (
     AnalyzeAnswerRequest, AnalyzeAnswerResponse,
     GenerateQuestionRequest, GenerateQuestionResponse
@@ -11,9 +14,9 @@ from app.schemas.interview import (
 router = APIRouter(tags=["인터뷰"])
 
 @router.post("/questions", response_model=GenerateQuestionResponse)
-def generate_question_endpoint(request: GenerateQuestionRequest):
+async def generate_question_endpoint(request: GenerateQuestionRequest):
     try:
-        result = generate_question(
+        result = await generate_question(
             job_type=request.jobType,
             question_level=request.questionLevel,
             question_category=request.questionCategory,
@@ -36,8 +39,8 @@ def generate_question_endpoint(request: GenerateQuestionRequest):
 
 
 @router.post("/answers/analyze", response_model=AnalyzeAnswerResponse)
-def analyze(request: AnalyzeAnswerRequest):
-    result = analyze_answer(
+async def analyze(request: AnalyzeAnswerRequest):
+    result = await analyze_answer(
         question=request.question,
         answer=request.answer,
         jobtype=request.jobType,
@@ -61,13 +64,14 @@ def analyze(request: AnalyzeAnswerRequest):
 
 @router.delete("/questions/cache/{document_id}")
 def clear_question_cache(document_id: str):
-    """특정 이력서의 질문 캐시 삭제"""
+    """특정 이력서의 질문 캐시 삭제 (캐시된 이력서 텍스트도 함께 무효화)"""
     try:
         deleted_count = question_cache.clear_cache_by_document(document_id)
+        resume_text_invalidated = invalidate_resume_text(document_id)
         return {
             "code": 200,
             "message": f"문서 {document_id}의 질문 캐시 {deleted_count}개 항목이 삭제되었습니다.",
-            "data": {"deleted_entries": deleted_count}
+            "data": {"deleted_entries": deleted_count, "resume_text_invalidated": resume_text_invalidated}
         }
     except Exception as e:
         return {
@@ -98,6 +102,12 @@ def get_cache_stats():
     """캐시 통계 정보 조회"""
     try:
         stats = question_cache.get_cache_stats()
+        stats['llm_response_cache'] = get_llm_cache_stats()
+        stats['resume_text_cache'] = get_resume_text_cache_stats()
+        if not INTERVIEW_ONLY:
+            # 면접 전용 워커는 이력서 모듈을 import 하지 않음
+            from app.resume.result_cache import resume_result_cache
+            stats['resume_result_cache'] = resume_result_cache.get_stats()
         return {
             "code": 200,
             "message": "캐시 통계 정보를 조회했습니다.",
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Form
-from app.resume.pii_detector import detect_pii
+from app.resume.pii_detector import adetect_pii
 
 router = APIRouter(tags=["개인정보 확인"])
 
 @router.post("/resume/pii-check")
 async def check_pii_in_text(text: str = Form(...)):
-    result = detect_pii(text)
+    result = await adetect_pii(text)
 
     return {
         "code": 200,
@@ -1,15 +1,7 @@
-import os
-import tempfile
-import json
-import requests
-
 from fastapi import APIRouter, HTTPException
-from app.schemas.resume import ResumeProcessRequest, ResumeParseResponse
-from app.resume.parser import extract_text_from_pdf
-from app.resume.pii_detector import detect_pii
-from app.resume.pii_logger import create_pii_log_payload
-from app.core.s3_utils import upload_file_to_s3
-from app.core.mysql_utils import update_redacted_resume_content
+from app.schemas.resume import ResumeProcessRequest, ResumeParseResponse, ResumeJobResponse
+from app.resume.pipeline import process_resume_document, ResumeProcessingError
+from app.resume.jobs import resume_job_queue, JobQueueFullError, JobOnOtherWorkerError
 
 router = APIRouter(tags=["이력서"])
 
@@ -20,58 +12,55 @@ async def process_resume(request: ResumeProcessRequest):
     S3 URL로 업로드된 이력서를 불러와 텍스트를 추출하고,
     PII 제거 후 DB에 저장하는 엔드포인트.
     """
-
-    # 1. PDF 다운로드
     try:
-        pdf_response = requests.get(request.fileUrl)
-        pdf_response.raise_for_status()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"PDF 다운로드 실패: {str(e)}")
+        await process_resume_document(request)
+    except ResumeProcessingError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-    # 2. 임시 파일 저장
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(pdf_response.content)
-        tmp_path = tmp.name
+    return {
+        "code": 200,
+        "message": "파일 처리 및 개인정보 삭제가 완료되었습니다"
+    }
 
-    # 3. 텍스트 추출
-    extracted_text = extract_text_from_pdf(tmp_path)
-    os.unlink(tmp_path)
 
-    if not extracted_text:
-        raise HTTPException(status_code=400, detail="PDF에서 텍스트를 추출하지 못했습니다.")
+@router.post("/file/jobs", response_model=ResumeJobResponse, status_code=202)
+async def submit_resume_job(request: ResumeProcessRequest):
+    """
+    이력서 처리를 백그라운드 작업으로 등록하고 작업 ID를 즉시 반환하는 엔드포인트.
+    진행 상황은 GET /file/jobs/{job_id} 로 조회합니다.
 
-    # 4. PII 제거
-    pii_result = detect_pii(extracted_text)
-    anonymized_text = pii_result["anonymized_text"]
+    작업 상태는 등록한 워커 프로세스에만 있으므로, 여러 워커로 운영할 때는 작업 ID 앞의
+    워커 ID("<워커 ID>-...") 기준으로 같은 워커에 조회 요청을 보내야 합니다(sticky 라우팅).
+    """
+    try:
+        job = await resume_job_queue.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
-    # 5. DB 업데이트
-    success = update_redacted_resume_content(
-        document_id=request.documentId,
-        redacted_text=anonymized_text
-    )
+    return {
+        "code": 202,
+        "message": "이력서 처리 작업이 등록되었습니다",
+        "data": job.to_dict()
+    }
 
-    if not success:
-        raise HTTPException(status_code=500, detail="DB 저장 실패")
 
-    # 6. PII 로그 S3 업로드
-    pii_payload = create_pii_log_payload(
-        user_id=request.userId,
-        file_id=str(request.documentId),
-        original_filename=f"{request.documentId}.pdf",
-        regex_result=pii_result["regex_result"],
-        ner_result=pii_result["ner_result"]
-    )
-    json_bytes = json.dumps(pii_payload, ensure_ascii=False).encode("utf-8")
-    object_key = f"pii-logs/{request.documentId}.json"
+@router.get("/file/jobs/{job_id}", response_model=ResumeJobResponse)
+async def get_resume_job(job_id: str):
+    """
+    이력서 처리 작업 상태와 단계별 진행 상황 조회.
 
-    upload_file_to_s3(
-        file_bytes=json_bytes,
-        object_key=object_key,
-        content_type="application/json"
-    )
+    - 404: 이 워커에서 등록했지만 없거나 보관 시간이 지나 삭제된 작업
+    - 421: 다른 워커 프로세스에서 등록되었거나 재시작으로 사라진 작업 (sticky 라우팅 필요)
+    """
+    try:
+        job = resume_job_queue.get(job_id)
+    except JobOnOtherWorkerError as e:
+        raise HTTPException(status_code=421, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없거나 보관 시간이 지나 삭제되었습니다")
 
-    # 7. 성공 응답
     return {
         "code": 200,
-        "message": "파일 처리 및 개인정보 삭제가 완료되었습니다"
-    }
\ No newline at end of file
+        "message": "작업 상태 조회 성공",
+        "data": job.to_dict()
+    }
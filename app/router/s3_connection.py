@@ -1,5 +1,6 @@
+import asyncio
 from fastapi import APIRouter, UploadFile, File
-from app.core.s3_utils import test_s3_connection, test_bucket_access, upload_file_to_s3
+from app.core.s3_utils import test_s3_connection, test_bucket_access, upload_fileobj_to_s3
 from app.config import S3_BUCKET
 import os
 
@@ -17,14 +18,15 @@ async def s3_connection_test():
 
 @router.post("/s3/upload")
 async def upload_file_to_s3_api(file: UploadFile = File(...)):
-    file_bytes = await file.read()
     content_type = file.content_type  # 예: application/pdf
 
     filename = os.path.basename(file.filename)  # 파일명 추출
     s3_key = f"documents/resumes/{filename}"  # 원하는 S3 object key
 
-    success = upload_file_to_s3(
-        file_bytes=file_bytes,
+    # 전체를 메모리로 읽지 않고 업로드 파일(스풀 임시 파일)을 청크 단위로 멀티파트 전송, 이벤트 루프 밖에서 실행
+    success = await asyncio.to_thread(
+        upload_fileobj_to_s3,
+        file_obj=file.file,
         object_key=s3_key,
         content_type=content_type
     )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from typing import Dict, Optional
 
 class ResumeProcessRequest(BaseModel):
     fileUrl: HttpUrl
@@ -9,4 +9,22 @@ class ResumeProcessRequest(BaseModel):
 
 class ResumeParseResponse(BaseModel):
     code: int
-    message: str
\ No newline at end of file
+    message: str
+
+class ResumeJobData(BaseModel):
+    jobId: str
+    documentId: int
+    status: str
+    stage: Optional[str] = None
+    stages: Dict[str, str]
+    error: Optional[str] = None
+    errorCode: Optional[int] = None
+    cacheHit: Optional[str] = None
+    createdAt: str
+    startedAt: Optional[str] = None
+    finishedAt: Optional[str] = None
+
+class ResumeJobResponse(BaseModel):
+    code: int
+    message: str
+    data: ResumeJobData
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -55,3 +56,77 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert "content-type" in response.headers
         assert "application/json" in response.headers["content-type"]
+
+    @pytest.mark.api
+    def test_readiness_while_ner_loading(self):
+        """Readiness reports 503 until the NER model has finished loading"""
+        with patch('app.resume.pii_detector.get_ner_status', return_value="loading"):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["ner"] == "loading"
+
+    @pytest.mark.api
+    @pytest.mark.parametrize("ner_status", ["ready", "disabled", "failed"])
+    def test_readiness_when_ner_settled(self, ner_status):
+        """Readiness reports 200 once NER is loaded, disabled or has fallen back to regex"""
+        with patch('app.resume.pii_detector.get_ner_status', return_value=ner_status):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "READY"
+
+    @pytest.mark.api
+    def test_readiness_reports_loaded_ner_backend(self):
+        """Readiness shows the NER backend that actually loaded, including a torch fallback"""
+        backend = {"requested": "onnx", "loaded": "torch", "fallback_reason": "No module named 'optimum'"}
+        with patch('app.resume.pii_detector.get_ner_status', return_value="ready"), \
+             patch('app.resume.ner_backend.get_loaded_backend', return_value=backend):
+            response = client.get("/health/ready")
+
+        assert response.json()["nerBackend"] == backend
+
+    @pytest.mark.api
+    def test_readiness_interview_only(self):
+        """Interview-only workers are ready without loading NER"""
+        with patch('app.router.health.INTERVIEW_ONLY', True):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["ner"] == "skipped"
+
+    @pytest.mark.api
+    def test_ner_batcher_stats(self):
+        """NER micro-batching counters are exposed like the DB pool stats"""
+        response = client.get("/health/ner")
+
+        assert response.status_code == 200
+        assert {"batches", "texts", "avg_batch_size", "max_batch_size", "max_wait_ms"} <= set(response.json())
+
+    @pytest.mark.api
+    def test_ner_batcher_stats_interview_only(self):
+        """Interview-only workers do not load the resume modules for stats"""
+        with patch('app.router.health.INTERVIEW_ONLY', True):
+            response = client.get("/health/ner")
+
+        assert response.json() == {"status": "skipped"}
+
+    @pytest.mark.api
+    def test_resume_job_stats(self):
+        """Job queue counters include the worker id used for sticky routing"""
+        from app.resume.jobs import resume_job_queue
+
+        response = client.get("/health/jobs")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["worker_id"] == resume_job_queue.worker_id
+        assert {"pending", "running", "succeeded", "failed"} <= set(data)
+
+    @pytest.mark.api
+    def test_pii_log_shipper_stats(self):
+        """PII log shipping backlog and failures are exposed for monitoring"""
+        response = client.get("/health/pii-log")
+
+        assert response.status_code == 200
+        assert {"spooled_records", "pending_batches", "shipped_batches", "failed_uploads"} <= set(response.json())
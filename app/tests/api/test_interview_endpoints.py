@@ -11,9 +11,9 @@ class TestInterviewEndpoints:
 
     @pytest.mark.api
     @patch('app.interview.question_generator.question_cache')
-    @patch('app.interview.question_generator.call_llm')
+    @patch('app.interview.question_generator.acall_llm')
     @patch('app.interview.question_generator.load_prompt')
-    @patch('app.interview.question_generator.get_resume_text')
+    @patch('app.interview.question_generator.aget_resume_text')
     def test_generate_questions_success(self, mock_get_resume, mock_load_prompt, mock_call_llm, mock_cache):
         """Test successful question generation"""
         # Mock all dependencies with assertion to debug
@@ -55,9 +55,9 @@ class TestInterviewEndpoints:
 
     @pytest.mark.api
     @patch('app.interview.question_generator.question_cache')
-    @patch('app.interview.question_generator.call_llm')
+    @patch('app.interview.question_generator.acall_llm')
     @patch('app.interview.question_generator.load_prompt')
-    @patch('app.interview.question_generator.get_resume_text')
+    @patch('app.interview.question_generator.aget_resume_text')
     def test_generate_questions_empty_resume(self, mock_get_resume, mock_load_prompt, mock_call_llm, mock_cache):
         """Test question generation with empty resume content"""
         # Mock all dependencies
@@ -187,9 +187,9 @@ class TestInterviewEndpoints:
 
     @pytest.mark.api
     @patch('app.interview.question_generator.question_cache')
-    @patch('app.interview.question_generator.call_llm')
+    @patch('app.interview.question_generator.acall_llm')
     @patch('app.interview.question_generator.load_prompt')
-    @patch('app.interview.question_generator.get_resume_text')
+    @patch('app.interview.question_generator.aget_resume_text')
     def test_large_request_handling(self, mock_get_resume, mock_load_prompt, mock_call_llm, mock_cache):
         """Test handling of very large resume content"""
         # Mock all dependencies
@@ -240,3 +240,21 @@ class TestInterviewEndpoints:
         data = response.json()
         assert data["code"] == 200
         assert "data" in data
+
+    @pytest.mark.api
+    def test_cache_stats_include_resume_result_cache(self):
+        """Cache stats report the resume result cache alongside the other caches"""
+        response = client.get("/api/ai/questions/cache/stats")
+
+        assert response.status_code == 200
+        stats = response.json()["data"]
+        assert {"llm_response_cache", "resume_text_cache"} <= set(stats)
+        assert set(stats["resume_result_cache"]) == {"pdf", "text"}
+
+    @pytest.mark.api
+    def test_cache_stats_interview_only(self):
+        """Interview-only workers leave out the resume result cache"""
+        with patch('app.router.interview.INTERVIEW_ONLY', True):
+            response = client.get("/api/ai/questions/cache/stats")
+
+        assert "resume_result_cache" not in response.json()["data"]
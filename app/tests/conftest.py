@@ -4,7 +4,7 @@ Pytest configuration and fixtures
 import pytest
 import os
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from fastapi.testclient import TestClient
 from dotenv import load_dotenv
 from pathlib import Path
@@ -68,20 +68,21 @@ def mock_llm_service():
 @pytest.fixture
 def mock_database():
     """Mock database connections"""
-    with patch('app.core.mysql_database.get_connection') as mock_db:
-        mock_connection = Mock()
-        mock_cursor = Mock()
-        mock_connection.cursor.return_value = mock_cursor
-        mock_db.return_value = mock_connection
+    with patch('app.core.mysql_utils.async_pool') as mock_pool:
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__aenter__.return_value = mock_cursor
+        mock_connection.cursor = AsyncMock(return_value=mock_cursor)
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_connection
         yield mock_connection
 
 
 @pytest.fixture
 def mock_s3_service():
     """Mock S3 service for testing"""
-    with patch('app.core.s3_utils.boto3') as mock_boto3:
+    with patch('app.core.s3_utils.get_s3_client') as mock_get_client:
         mock_s3_client = Mock()
-        mock_boto3.client.return_value = mock_s3_client
+        mock_get_client.return_value = mock_s3_client
         mock_s3_client.upload_fileobj.return_value = None
         yield mock_s3_client
 
@@ -13,7 +13,7 @@ class TestWikipediaIntegrationFlow:
     """Integration tests for complete Wikipedia API workflow"""
 
     @pytest.mark.integration
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     @patch('app.core.llm_utils.call_llm')
     @patch('app.interview.prompt_loader.load_prompt')
     def test_complete_analysis_with_wikipedia_context(self, mock_load_prompt, mock_call_llm, mock_wiki_service):
@@ -89,7 +89,7 @@ class TestWikipediaIntegrationFlow:
         assert mock_wiki_service.called or mock_call_llm.called
 
     @pytest.mark.integration
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     @patch('app.core.llm_utils.call_llm')
     @patch('app.interview.prompt_loader.load_prompt')
     def test_analysis_with_wikipedia_search_fallback(self, mock_load_prompt, mock_call_llm, mock_wiki_service):
@@ -152,7 +152,7 @@ class TestWikipediaIntegrationFlow:
         assert mock_wiki_service.called
 
     @pytest.mark.integration
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     @patch('app.core.llm_utils.call_llm')
     def test_analysis_with_no_wikipedia_results(self, mock_call_llm, mock_wiki_service):
         """Test analysis flow when no Wikipedia results are found"""
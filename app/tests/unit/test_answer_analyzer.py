@@ -16,63 +16,68 @@ from app.interview.answer_analyzer import (
 class TestExtractTechnicalConcepts:
     """Test cases for extract_technical_concepts function"""
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_extract_technical_concepts_success(self, mock_call_llm, mock_load_prompt):
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_extract_technical_concepts_success(self, mock_call_llm, mock_load_prompt):
         """Test successful technical concept extraction"""
         mock_load_prompt.return_value = "Extract concepts from {answer} for {job_type}"
         mock_call_llm.return_value = '["Python", "Django", "REST API"]'
         
-        result = extract_technical_concepts("I use Python and Django for REST APIs", "Backend Developer")
+        result = await extract_technical_concepts("I use Python and Django for REST APIs", "Backend Developer")
         
         assert result == ["Python", "Django", "REST API"]
         mock_load_prompt.assert_called_once_with("concept_extraction.txt")
         mock_call_llm.assert_called_once()
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.load_prompt')
-    def test_extract_technical_concepts_prompt_not_found(self, mock_load_prompt):
+    async def test_extract_technical_concepts_prompt_not_found(self, mock_load_prompt):
         """Test handling when prompt file is not found"""
         mock_load_prompt.side_effect = FileNotFoundError()
         
-        result = extract_technical_concepts("test answer", "Developer")
+        result = await extract_technical_concepts("test answer", "Developer")
         
         assert result == []
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_extract_technical_concepts_invalid_json(self, mock_call_llm, mock_load_prompt):
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_extract_technical_concepts_invalid_json(self, mock_call_llm, mock_load_prompt):
         """Test handling of invalid JSON response"""
         mock_load_prompt.return_value = "template"
         mock_call_llm.return_value = "Invalid JSON response"
         
-        result = extract_technical_concepts("test answer", "Developer")
+        result = await extract_technical_concepts("test answer", "Developer")
         
         assert result == []
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_extract_technical_concepts_non_list_response(self, mock_call_llm, mock_load_prompt):
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_extract_technical_concepts_non_list_response(self, mock_call_llm, mock_load_prompt):
         """Test handling when LLM returns non-list JSON"""
         mock_load_prompt.return_value = "template"
         mock_call_llm.return_value = '{"not": "a list"}'
         
-        result = extract_technical_concepts("test answer", "Developer")
+        result = await extract_technical_concepts("test answer", "Developer")
         
         assert result == []
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_extract_technical_concepts_llm_exception(self, mock_call_llm, mock_load_prompt):
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_extract_technical_concepts_llm_exception(self, mock_call_llm, mock_load_prompt):
         """Test handling of LLM call exceptions"""
         mock_load_prompt.return_value = "template"
         mock_call_llm.side_effect = Exception("LLM error")
         
-        result = extract_technical_concepts("test answer", "Developer")
+        result = await extract_technical_concepts("test answer", "Developer")
         
         assert result == []
 
@@ -88,7 +93,7 @@ class TestGetWikipediaContext:
         assert result == ""
 
     @pytest.mark.unit
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     def test_get_wikipedia_context_success(self, mock_wiki_service_class):
         """Test successful Wikipedia context generation"""
         mock_service = Mock()
@@ -109,7 +114,7 @@ class TestGetWikipediaContext:
         assert len(result) > 100  # Should contain substantial content
 
     @pytest.mark.unit
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     def test_get_wikipedia_context_with_search_fallback(self, mock_wiki_service_class):
         """Test Wikipedia context with search fallback"""
         mock_service = Mock()
@@ -132,7 +137,7 @@ class TestGetWikipediaContext:
         assert mock_service.search_concept.called
 
     @pytest.mark.unit
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     def test_get_wikipedia_context_no_results(self, mock_wiki_service_class):
         """Test when no Wikipedia results are found"""
         mock_service = Mock()
@@ -148,7 +153,7 @@ class TestGetWikipediaContext:
         assert "UnknownConcept" not in result
 
     @pytest.mark.unit
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     def test_get_wikipedia_context_max_concepts_limit(self, mock_wiki_service_class):
         """Test that only MAX_CONCEPTS_TO_PROCESS concepts are processed"""
         mock_service = Mock()
@@ -168,7 +173,7 @@ class TestGetWikipediaContext:
         assert mock_service.get_concept_summary.call_count == MAX_CONCEPTS_TO_PROCESS
 
     @pytest.mark.unit
-    @patch('app.interview.answer_analyzer.WikipediaService')
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
     def test_get_wikipedia_context_extract_truncation(self, mock_wiki_service_class):
         """Test that long extracts are properly truncated"""
         mock_service = Mock()
@@ -187,16 +192,62 @@ class TestGetWikipediaContext:
         assert "A" * WIKIPEDIA_EXTRACT_TRUNCATE_LENGTH in result
         assert len(result) < len(long_extract) + 200  # Much shorter than original
 
+    @pytest.mark.unit
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
+    def test_get_wikipedia_context_runs_lookups_in_parallel(self, mock_wiki_service_class):
+        """Test that concept lookups overlap instead of running back to back"""
+        import threading
+        mock_service = Mock()
+        mock_wiki_service_class.return_value = mock_service
+
+        barrier = threading.Barrier(MAX_CONCEPTS_TO_PROCESS, timeout=2)
+
+        def summary(concept):
+            barrier.wait()  # 모든 조회가 동시에 진행 중이어야 통과
+            return {"title": concept, "extract": f"{concept} extract", "url": "https://test.com"}
+
+        mock_service.get_concept_summary.side_effect = summary
+        concepts = [f"Concept{i}" for i in range(MAX_CONCEPTS_TO_PROCESS)]
+
+        result = get_wikipedia_context(concepts, timeout=5)
+
+        # 병렬 실행 후에도 개념 순서는 유지
+        positions = [result.index(f"**{concept}**") for concept in concepts]
+        assert positions == sorted(positions)
+
+    @pytest.mark.unit
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
+    def test_get_wikipedia_context_deadline_drops_slow_concepts(self, mock_wiki_service_class):
+        """Test that lookups exceeding the per-request deadline are left out"""
+        import threading
+        mock_service = Mock()
+        mock_wiki_service_class.return_value = mock_service
+        release = threading.Event()
+
+        def summary(concept):
+            if concept == "Slow":
+                release.wait(timeout=2)
+            return {"title": concept, "extract": f"{concept} extract", "url": "https://test.com"}
+
+        mock_service.get_concept_summary.side_effect = summary
+
+        result = get_wikipedia_context(["Fast", "Slow"], timeout=0.2)
+        release.set()
+
+        assert "**Fast**" in result
+        assert "**Slow**" not in result
+
 
 class TestAnalyzeAnswer:
     """Test cases for analyze_answer function"""
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.extract_technical_concepts')
     @patch('app.interview.answer_analyzer.get_wikipedia_context')
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_analyze_answer_success(self, mock_call_llm, mock_load_prompt, 
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_success(self, mock_call_llm, mock_load_prompt, 
                                   mock_get_wiki_context, mock_extract_concepts):
         """Test successful answer analysis"""
         mock_extract_concepts.return_value = ["Python", "Django"]
@@ -211,7 +262,7 @@ class TestAnalyzeAnswer:
         }
         mock_call_llm.return_value = json.dumps(mock_analysis_result)
         
-        result = analyze_answer(
+        result = await analyze_answer(
             question="What is Python?",
             answer="Python is a programming language...",
             jobtype="Backend Developer",
@@ -224,12 +275,13 @@ class TestAnalyzeAnswer:
         mock_get_wiki_context.assert_called_once()
         mock_call_llm.assert_called_once()
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.extract_technical_concepts')
     @patch('app.interview.answer_analyzer.get_wikipedia_context')
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_analyze_answer_llm_exception(self, mock_call_llm, mock_load_prompt,
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_llm_exception(self, mock_call_llm, mock_load_prompt,
                                         mock_get_wiki_context, mock_extract_concepts):
         """Test handling of LLM exceptions"""
         mock_extract_concepts.return_value = ["Python"]
@@ -237,16 +289,17 @@ class TestAnalyzeAnswer:
         mock_load_prompt.return_value = "template"
         mock_call_llm.side_effect = ConnectionError("Network error")
         
-        result = analyze_answer("Q", "A", "Dev", "Junior", "Tech")
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech")
         
         assert result is None
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.extract_technical_concepts')
     @patch('app.interview.answer_analyzer.get_wikipedia_context')
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_analyze_answer_invalid_json_response(self, mock_call_llm, mock_load_prompt,
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_invalid_json_response(self, mock_call_llm, mock_load_prompt,
                                                 mock_get_wiki_context, mock_extract_concepts):
         """Test handling of invalid JSON response from LLM"""
         mock_extract_concepts.return_value = ["Python"]
@@ -254,16 +307,17 @@ class TestAnalyzeAnswer:
         mock_load_prompt.return_value = "template"
         mock_call_llm.return_value = "Not a JSON response"
         
-        result = analyze_answer("Q", "A", "Dev", "Junior", "Tech")
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech")
         
         assert result is None
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.extract_technical_concepts')
     @patch('app.interview.answer_analyzer.get_wikipedia_context')
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_analyze_answer_partial_json_response(self, mock_call_llm, mock_load_prompt,
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_partial_json_response(self, mock_call_llm, mock_load_prompt,
                                                  mock_get_wiki_context, mock_extract_concepts):
         """Test handling of response with JSON embedded in text"""
         mock_extract_concepts.return_value = ["Python"]
@@ -274,17 +328,18 @@ class TestAnalyzeAnswer:
         json_response = '{"score": 75, "feedback": "Good answer"}'
         mock_call_llm.return_value = f"Here is the analysis: {json_response} End of analysis."
         
-        result = analyze_answer("Q", "A", "Dev", "Junior", "Tech")
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech")
         
         expected = {"score": 75, "feedback": "Good answer"}
         assert result == expected
 
+    @pytest.mark.asyncio
     @pytest.mark.unit
     @patch('app.interview.answer_analyzer.extract_technical_concepts')
     @patch('app.interview.answer_analyzer.get_wikipedia_context')
     @patch('app.interview.answer_analyzer.load_prompt')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_analyze_answer_no_json_in_response(self, mock_call_llm, mock_load_prompt,
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_no_json_in_response(self, mock_call_llm, mock_load_prompt,
                                               mock_get_wiki_context, mock_extract_concepts):
         """Test handling of response with no JSON content"""
         mock_extract_concepts.return_value = ["Python"]
@@ -292,13 +347,14 @@ class TestAnalyzeAnswer:
         mock_load_prompt.return_value = "template"
         mock_call_llm.return_value = "This is just text with no JSON content"
         
-        result = analyze_answer("Q", "A", "Dev", "Junior", "Tech")
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech")
         
         assert result is None
 
+    @pytest.mark.asyncio
     @pytest.mark.integration
-    @patch('app.interview.answer_analyzer.WikipediaService')
-    def test_analyze_answer_integration_flow(self, mock_wiki_service_class):
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
+    async def test_analyze_answer_integration_flow(self, mock_wiki_service_class):
         """Integration test for the complete analysis flow"""
         # Mock Wikipedia service
         mock_service = Mock()
@@ -310,7 +366,7 @@ class TestAnalyzeAnswer:
         }
         
         # Mock LLM calls
-        with patch('app.interview.answer_analyzer.call_llm') as mock_call_llm:
+        with patch('app.interview.answer_analyzer.acall_llm') as mock_call_llm:
             with patch('app.interview.answer_analyzer.load_prompt') as mock_load_prompt:
                 # Mock concept extraction
                 mock_load_prompt.side_effect = [
@@ -322,7 +378,7 @@ class TestAnalyzeAnswer:
                     '{"score": 90, "feedback": "Excellent"}'  # Analysis
                 ]
                 
-                result = analyze_answer(
+                result = await analyze_answer(
                     "What is Python?",
                     "Python is a great programming language for web development",
                     "Backend Developer",
@@ -334,3 +390,74 @@ class TestAnalyzeAnswer:
                 assert result["feedback"] == "Excellent"
                 # Verify Wikipedia service was used
                 mock_service.get_concept_summary.assert_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.interview.answer_analyzer.ANALYSIS_SPECULATIVE_DELAY_SECONDS', 0.01)
+    @patch('app.interview.answer_analyzer.extract_technical_concepts')
+    @patch('app.interview.answer_analyzer.get_wikipedia_context')
+    @patch('app.interview.answer_analyzer.load_prompt')
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_speculative_uses_early_result(self, mock_call_llm, mock_load_prompt,
+                                                               mock_get_wiki_context, mock_extract_concepts):
+        """Test that slow fact context is skipped when the speculative analysis finishes first"""
+        import threading
+        release = threading.Event()
+        mock_extract_concepts.return_value = ["Python"]
+        mock_get_wiki_context.side_effect = lambda concepts: release.wait(timeout=2) and "Wiki context"
+        mock_load_prompt.return_value = "Analyze: {question} {text} {jobtype} {level} {category}"
+        mock_call_llm.return_value = '{"analysis": []}'
+
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech", speculative=True)
+        release.set()
+
+        assert result == {"analysis": []}
+        mock_call_llm.assert_called_once()
+        assert "Wiki context" not in mock_call_llm.call_args.kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.interview.answer_analyzer.ANALYSIS_SPECULATIVE_DELAY_SECONDS', 0.01)
+    @patch('app.interview.answer_analyzer.load_prompt')
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_speculative_win_cancels_context_task(self, mock_call_llm, mock_load_prompt):
+        """The unused fact-context task is cancelled when the speculative analysis wins"""
+        import asyncio
+        from app.interview.answer_analyzer import _analyze_speculatively
+
+        mock_call_llm.return_value = '{"analysis": []}'
+        context_started = asyncio.Event()
+
+        async def slow_context():
+            context_started.set()
+            await asyncio.sleep(10)
+            return "Wiki context"
+
+        context_task = asyncio.create_task(slow_context())
+        result = await _analyze_speculatively("Analyze", context_task)
+        await asyncio.sleep(0)
+
+        assert result == {"analysis": []}
+        assert context_started.is_set()
+        assert context_task.cancelled()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.interview.answer_analyzer.ANALYSIS_SPECULATIVE_DELAY_SECONDS', 1)
+    @patch('app.interview.answer_analyzer.extract_technical_concepts')
+    @patch('app.interview.answer_analyzer.get_wikipedia_context')
+    @patch('app.interview.answer_analyzer.load_prompt')
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_analyze_answer_speculative_fast_context(self, mock_call_llm, mock_load_prompt,
+                                                          mock_get_wiki_context, mock_extract_concepts):
+        """Test that fast fact context is used without a speculative call"""
+        mock_extract_concepts.return_value = ["Python"]
+        mock_get_wiki_context.return_value = "Wiki context"
+        mock_load_prompt.return_value = "Analyze: {question} {text} {jobtype} {level} {category}"
+        mock_call_llm.return_value = '{"analysis": []}'
+
+        result = await analyze_answer("Q", "A", "Dev", "Junior", "Tech", speculative=True)
+
+        assert result == {"analysis": []}
+        mock_call_llm.assert_called_once()
+        assert mock_call_llm.call_args.kwargs["prompt"].endswith("Wiki context")
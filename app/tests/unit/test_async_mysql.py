@@ -0,0 +1,370 @@
+"""
+Tests for the async MySQL connection pool and async DB helpers
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from app.core import mysql_utils
+from app.core.async_mysql import AsyncMySQLPool, PoolTimeoutError
+from app.core.ttl_cache import TTLCache
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params):
+        if self.conn.fail_execute:
+            raise RuntimeError("query failed")
+        self.conn.executed.append((query, params))
+
+    async def fetchone(self):
+        # updated_at만 조회하는 쿼리는 (content, updated_at) 행의 updated_at만 반환
+        if self.conn.row is not None and self.conn.executed[-1][0] == mysql_utils.RESUME_UPDATED_AT_QUERY:
+            return self.conn.row[1:]
+        return self.conn.row
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+        self.fail_execute = False
+        self.row = None
+        self.executed = []
+        self.pings = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def ping(self):
+        self.pings += 1
+        if not self.healthy:
+            raise ConnectionError("gone away")
+
+    async def cursor(self):
+        return FakeCursor(self)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections():
+    return []
+
+
+@pytest.fixture
+def make_pool(connections):
+    def factory(**kwargs):
+        async def connect(**config):
+            conn = FakeConnection()
+            connections.append(conn)
+            return conn
+
+        options = dict(min_size=0, max_size=2, acquire_timeout=1, health_check_idle_seconds=30)
+        options.update(kwargs)
+        return AsyncMySQLPool({}, connect=connect, **options)
+    return factory
+
+
+class TestAsyncMySQLPool:
+    """Test cases for AsyncMySQLPool"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connection_reused(self, make_pool, connections):
+        """A released connection is handed out again instead of opening a new one"""
+        pool = make_pool()
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            assert second is first
+
+        stats = pool.get_stats()
+        assert len(connections) == 1
+        assert stats['acquisitions'] == 2
+        assert stats['idle'] == 1
+        assert stats['in_use'] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_start_prefills_min_size(self, make_pool, connections):
+        """start() opens min_size connections up front"""
+        pool = make_pool(min_size=2)
+        await pool.start()
+        assert len(connections) == 2
+        assert pool.get_stats()['idle'] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_waits_for_release_at_max_size(self, make_pool):
+        """At max size a caller waits in the queue until a connection is released"""
+        pool = make_pool(max_size=1)
+        released = asyncio.Event()
+
+        async def holder():
+            async with pool.acquire():
+                await released.wait()
+
+        task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        async def waiter():
+            async with pool.acquire() as conn:
+                return conn
+
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01)
+        stats = pool.get_stats()
+        assert stats['waiting'] == 1
+        assert stats['utilization'] == 1.0
+
+        released.set()
+        assert await waiting is not None
+        await task
+        assert pool.get_stats()['peak_in_use'] == 1
+        assert pool.get_stats()['max_wait_ms'] > 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self, make_pool):
+        """A caller that cannot get a connection in time gets PoolTimeoutError"""
+        pool = make_pool(max_size=1, acquire_timeout=0.05)
+        async with pool.acquire():
+            with pytest.raises(PoolTimeoutError):
+                async with pool.acquire():
+                    pass
+        assert pool.get_stats()['timeouts'] == 1
+        assert pool.get_stats()['waiting'] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unhealthy_idle_connection_replaced(self, make_pool, connections):
+        """An idle connection that fails its ping is discarded and replaced"""
+        pool = make_pool(health_check_idle_seconds=0)
+        async with pool.acquire() as stale:
+            pass
+        stale.healthy = False
+
+        async with pool.acquire() as fresh:
+            assert fresh is not stale
+        assert stale.closed
+        assert len(connections) == 2
+        assert pool.get_stats()['connections_discarded'] == 1
+        assert pool.get_stats()['size'] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_recently_used_connection_not_pinged(self, make_pool):
+        """Connections used within the idle threshold skip the health check"""
+        pool = make_pool(health_check_idle_seconds=30)
+        async with pool.acquire() as conn:
+            pass
+        async with pool.acquire():
+            pass
+        assert conn.pings == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connection_discarded_after_error(self, make_pool):
+        """A connection whose caller raised is closed rather than returned to the pool"""
+        pool = make_pool()
+        with pytest.raises(RuntimeError):
+            async with pool.acquire() as conn:
+                raise RuntimeError("boom")
+        assert conn.closed
+        assert pool.get_stats()['size'] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connection_discarded_after_cancellation(self, make_pool):
+        """A connection whose request was cancelled mid-query is not handed to the next caller"""
+        pool = make_pool()
+        acquired = asyncio.Event()
+        held = []
+
+        async def query():
+            async with pool.acquire() as conn:
+                held.append(conn)
+                acquired.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(query())
+        await acquired.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert held[0].closed
+        assert pool.get_stats()['size'] == 0
+        async with pool.acquire() as conn:
+            assert conn is not held[0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_during_connect_releases_slot(self, connections):
+        """Cancelling an acquire while the connection is being opened does not leak a pool slot"""
+        connecting = asyncio.Event()
+        hang = True
+
+        async def connect(**config):
+            if hang:
+                connecting.set()
+                await asyncio.sleep(10)
+            conn = FakeConnection()
+            connections.append(conn)
+            return conn
+
+        pool = AsyncMySQLPool({}, min_size=0, max_size=1, acquire_timeout=0.5, connect=connect)
+
+        async def query():
+            async with pool.acquire():
+                pass
+
+        task = asyncio.create_task(query())
+        await connecting.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = pool.get_stats()
+        assert stats['size'] == 0
+        assert stats['in_use'] == 0
+
+        hang = False
+        async with pool.acquire() as conn:
+            assert conn is connections[0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_during_health_check_releases_slot(self, make_pool):
+        """Cancelling an acquire during the ping discards that connection and frees its slot"""
+        pool = make_pool(max_size=1, health_check_idle_seconds=0)
+        async with pool.acquire() as stale:
+            pass
+        pinging = asyncio.Event()
+
+        async def slow_ping():
+            pinging.set()
+            await asyncio.sleep(10)
+
+        stale.ping = slow_ping
+        task = asyncio.create_task(pool._get())
+        await pinging.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert stale.closed
+        assert pool.get_stats()['size'] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close(self, make_pool):
+        """close() closes idle connections and rejects new acquisitions"""
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            pass
+        await pool.close()
+        assert conn.closed
+        with pytest.raises(PoolTimeoutError):
+            async with pool.acquire():
+                pass
+
+
+class TestAsyncMySQLUtils:
+    """Test cases for the async helpers in mysql_utils"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_resume_text_cache(self):
+        with patch.object(mysql_utils, 'resume_text_cache', TTLCache(max_entries=8, ttl_seconds=60)):
+            yield
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aget_resume_text(self, make_pool, connections):
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            conn.row = ("resume body", datetime(2025, 1, 1))
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text("1") == "resume body"
+        assert connections[0].executed[0][1] == ("1",)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aget_resume_text_pool_timeout(self):
+        pool = Mock()
+        pool.acquire.side_effect = PoolTimeoutError("timeout")
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text("1") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aupdate_redacted_resume_content(self, make_pool, connections):
+        pool = make_pool()
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aupdate_redacted_resume_content(3, "masked") is True
+        assert connections[0].executed[0][1] == ("masked", 3)
+        assert connections[0].commits == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aupdate_redacted_resume_content_failure(self, make_pool, connections):
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            conn.fail_execute = True
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aupdate_redacted_resume_content(3, "masked") is False
+        assert conn.rollbacks == 1
+        assert conn.closed
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aget_resume_text_read_through(self, make_pool, connections):
+        """Only the first lookup per document reaches the database until it is updated"""
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            conn.row = ("resume body", datetime(2025, 1, 1))
+        with patch.object(mysql_utils, 'async_pool', pool):
+            for _ in range(5):
+                assert await mysql_utils.aget_resume_text("1") == "resume body"
+            assert len(conn.executed) == 1
+
+            conn.row = ("redacted body", datetime(2025, 1, 2))
+            assert await mysql_utils.aupdate_redacted_resume_content(1, "redacted body") is True
+            assert await mysql_utils.aget_resume_text("1") == "redacted body"
+        assert len(conn.executed) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aget_resume_text_revalidates_after_window(self, make_pool, connections):
+        """An update made by another worker is picked up once the entry is revalidated"""
+        pool = make_pool()
+        async with pool.acquire() as conn:
+            conn.row = ("resume body", datetime(2025, 1, 1))
+        with patch.object(mysql_utils, 'async_pool', pool), \
+             patch.object(mysql_utils, 'RESUME_TEXT_CACHE_REVALIDATE_SECONDS', 0):
+            assert await mysql_utils.aget_resume_text("1") == "resume body"
+            assert await mysql_utils.aget_resume_text("1") == "resume body"
+
+            # 이 프로세스의 무효화 없이 DB 본문만 바뀜
+            conn.row = ("reuploaded body", datetime(2025, 1, 2))
+            assert await mysql_utils.aget_resume_text("1") == "reuploaded body"
+
+        assert [query for query, _ in conn.executed] == [
+            mysql_utils.RESUME_TEXT_QUERY, mysql_utils.RESUME_UPDATED_AT_QUERY,
+            mysql_utils.RESUME_UPDATED_AT_QUERY, mysql_utils.RESUME_TEXT_QUERY
+        ]
@@ -0,0 +1,127 @@
+"""
+Tests for token-aware NER chunking
+"""
+import re
+import pytest
+from unittest.mock import Mock, patch
+from app.resume.chunker import TextChunk, chunk_text, merge_chunk_entities
+
+
+class WordTokenizer:
+    """Minimal fast-tokenizer stand-in: one token per word or symbol"""
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False):
+        return {"offset_mapping": [m.span() for m in re.finditer(r"\w+|[^\w\s]", text)]}
+
+
+def _token_count(text):
+    return len(WordTokenizer()(text)["offset_mapping"])
+
+
+class TestChunkText:
+    """Test cases for chunk_text"""
+
+    @pytest.mark.unit
+    def test_short_text_single_chunk(self):
+        """Text within the window is not split"""
+        chunks = chunk_text("이름 김철수", WordTokenizer(), max_tokens=10, overlap_tokens=2)
+        assert chunks == [TextChunk(text="이름 김철수", start=0)]
+        assert chunk_text("   ", WordTokenizer()) == []
+
+    @pytest.mark.unit
+    def test_chunks_respect_window_and_cover_text(self):
+        """Every chunk fits the window, offsets map back to the source and no region is skipped"""
+        text = "\n".join(f"line {i} has some words here" for i in range(40))
+        chunks = chunk_text(text, WordTokenizer(), max_tokens=20, overlap_tokens=5)
+
+        assert len(chunks) > 1
+        covered_until = 0
+        for chunk in chunks:
+            assert _token_count(chunk.text) <= 20
+            assert text[chunk.start:chunk.start + len(chunk.text)] == chunk.text
+            assert chunk.start <= covered_until
+            covered_until = max(covered_until, chunk.start + len(chunk.text))
+        assert text[covered_until:].strip() == ""
+
+    @pytest.mark.unit
+    def test_chunks_split_on_line_boundaries(self):
+        """Chunks start and end on line boundaries when one is available"""
+        text = "\n".join(f"line {i} has some words here" for i in range(40))
+        chunks = chunk_text(text, WordTokenizer(), max_tokens=20, overlap_tokens=7)
+
+        for chunk in chunks:
+            assert chunk.start == 0 or text[chunk.start - 1] == "\n"
+            assert chunk.text.startswith("line ")
+
+    @pytest.mark.unit
+    def test_consecutive_chunks_overlap(self):
+        """Adjacent chunks share an overlap region"""
+        text = " ".join(f"w{i}" for i in range(100))
+        chunks = chunk_text(text, WordTokenizer(), max_tokens=30, overlap_tokens=5)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start < previous.start + len(previous.text)
+
+    @pytest.mark.unit
+    def test_approximate_tokens_without_tokenizer(self):
+        """Without a tokenizer chunking falls back to word-level tokens"""
+        text = " ".join(f"w{i}" for i in range(50))
+        chunks = chunk_text(text, None, max_tokens=20, overlap_tokens=4)
+        assert len(chunks) >= 3
+
+
+class TestMergeChunkEntities:
+    """Test cases for merging entities across overlapping chunks"""
+
+    @pytest.mark.unit
+    def test_offsets_shifted_and_duplicates_removed(self):
+        """Entities seen in two overlapping chunks are reported once in source coordinates"""
+        chunks = [TextChunk(text="abc 김철수 def", start=0), TextChunk(text="김철수 def 서울", start=4)]
+        entities = [
+            [{"entity_group": "PER", "word": "김철수", "start": 4, "end": 7, "score": 0.9}],
+            [{"entity_group": "PER", "word": "김철수", "start": 0, "end": 3, "score": 0.95},
+             {"entity_group": "LOC", "word": "서울", "start": 8, "end": 10, "score": 0.8}],
+        ]
+        merged = merge_chunk_entities(chunks, entities)
+
+        assert [(e["entity_group"], e["start"], e["end"]) for e in merged] == [("PER", 4, 7), ("LOC", 12, 14)]
+
+    @pytest.mark.unit
+    def test_truncated_entity_replaced_by_full_span(self):
+        """An entity cut at a chunk edge yields to the complete span from the next chunk"""
+        chunks = [TextChunk(text="Contact John", start=0), TextChunk(text="John Smith today", start=8)]
+        entities = [
+            [{"entity_group": "PER", "word": "John", "start": 8, "end": 12, "score": 0.99}],
+            [{"entity_group": "PER", "word": "John Smith", "start": 0, "end": 10, "score": 0.97}],
+        ]
+        merged = merge_chunk_entities(chunks, entities)
+
+        assert len(merged) == 1
+        assert merged[0]["word"] == "John Smith"
+        assert (merged[0]["start"], merged[0]["end"]) == (8, 18)
+
+
+class TestChunkedDetection:
+    """Test cases for chunked NER inside detect_pii"""
+
+    @pytest.mark.unit
+    def test_long_text_batched_through_model(self):
+        """Long text is sent to the model as one batch of chunks"""
+        from app.resume import pii_detector
+
+        text = "\n".join(f"line {i} has some words here" for i in range(40)) + "\n홍길동"
+        fake_ner = Mock(side_effect=lambda texts, batch_size=None: [
+            [{"entity_group": "PER", "word": "홍길동", "start": t.index("홍길동"), "end": t.index("홍길동") + 3, "score": 0.9}]
+            if "홍길동" in t else [] for t in texts
+        ])
+        fake_ner.tokenizer = WordTokenizer()
+
+        with patch.object(pii_detector, 'get_ner', return_value=fake_ner), \
+             patch.object(pii_detector, 'NER_STRATEGY', "transformer"), \
+             patch.object(pii_detector, 'chunk_text',
+                          lambda text, tokenizer: chunk_text(text, tokenizer, max_tokens=20, overlap_tokens=5)):
+            result = pii_detector.detect_pii(text)
+
+        fake_ner.assert_called_once()
+        assert len(fake_ner.call_args[0][0]) > 1
+        assert result["ner_result"] == {"name": ["홍길동"]}
@@ -2,9 +2,13 @@
 Tests for Core Services and Utilities
 """
 import pytest
-from unittest.mock import patch, Mock, MagicMock
+from datetime import datetime
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 import json
 
+UPDATED_AT = datetime(2025, 1, 1, 9, 0, 0)
+REUPLOADED_AT = datetime(2025, 1, 2, 9, 0, 0)
+
 
 class TestLLMUtils:
     """Test cases for LLM utility functions"""
@@ -43,6 +47,139 @@ class TestLLMUtils:
         result = call_llm("Test prompt")
         assert result == "질문 생성 중 오류가 발생했습니다."
 
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.async_client')
+    async def test_acall_llm_success(self, mock_async_client):
+        """Test successful async LLM call"""
+        from app.core.llm_utils import acall_llm
+
+        mock_completion = Mock()
+        mock_completion.choices = [Mock()]
+        mock_completion.choices[0].message.content = "  Async response  "
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        result = await acall_llm("Test prompt", temperature=0.2, max_tokens=50, system_role="Test role")
+
+        assert result == "Async response"
+        kwargs = mock_async_client.chat.completions.create.call_args.kwargs
+        assert kwargs["temperature"] == 0.2
+        assert kwargs["messages"][0] == {"role": "system", "content": "Test role"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.async_client')
+    async def test_acall_llm_exception(self, mock_async_client):
+        """Test async LLM call with exception"""
+        from app.core.llm_utils import acall_llm
+
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+
+        result = await acall_llm("Test prompt")
+        assert result == "질문 생성 중 오류가 발생했습니다."
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.async_client')
+    async def test_acall_llm_response_cache(self, mock_async_client):
+        """Test that low-temperature cached calls hit OpenAI only once"""
+        from app.core.llm_utils import acall_llm, llm_response_cache
+
+        llm_response_cache.clear()
+        mock_completion = Mock()
+        mock_completion.choices = [Mock()]
+        mock_completion.choices[0].message.content = "Cached response"
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_completion)
+
+        first = await acall_llm("Same prompt", temperature=0.1, use_cache=True)
+        second = await acall_llm("Same prompt", temperature=0.1, use_cache=True)
+        await acall_llm("Same prompt", temperature=0.1, max_tokens=100, use_cache=True)
+
+        assert first == second == "Cached response"
+        assert mock_async_client.chat.completions.create.call_count == 2
+
+        # 고온도 호출은 use_cache=True여도 캐싱하지 않음
+        await acall_llm("Same prompt", temperature=0.8, use_cache=True)
+        await acall_llm("Same prompt", temperature=0.8, use_cache=True)
+        assert mock_async_client.chat.completions.create.call_count == 4
+        llm_response_cache.clear()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.async_client')
+    async def test_acall_llm_coalesces_concurrent_requests(self, mock_async_client):
+        """Test that identical concurrent calls share one upstream request"""
+        import asyncio
+        from app.core.llm_utils import acall_llm
+
+        release = asyncio.Event()
+        mock_completion = Mock()
+        mock_completion.choices = [Mock()]
+        mock_completion.choices[0].message.content = "Shared response"
+
+        async def slow_create(**kwargs):
+            await release.wait()
+            return mock_completion
+
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=slow_create)
+
+        calls = [asyncio.create_task(acall_llm("Burst prompt", temperature=0.8)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == ["Shared response"] * 5
+        assert mock_async_client.chat.completions.create.call_count == 1
+
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.client')
+    def test_call_llm_coalesces_concurrent_requests(self, mock_client):
+        """Test that identical concurrent sync calls share one upstream request"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from app.core.llm_utils import call_llm, llm_single_flight
+
+        started = threading.Event()
+        release = threading.Event()
+        mock_completion = Mock()
+        mock_completion.choices = [Mock()]
+        mock_completion.choices[0].message.content = "Shared response"
+
+        def slow_create(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return mock_completion
+
+        mock_client.chat.completions.create.side_effect = slow_create
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(call_llm, "Sync burst prompt")
+            started.wait(timeout=5)
+            coalesced_before = llm_single_flight.get_stats()["coalesced_requests"]
+            followers = [executor.submit(call_llm, "Sync burst prompt") for _ in range(3)]
+            deadline = time.monotonic() + 5
+            while (llm_single_flight.get_stats()["coalesced_requests"] < coalesced_before + 3
+                   and time.monotonic() < deadline):
+                time.sleep(0.01)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["Shared response"] * 4
+        assert mock_client.chat.completions.create.call_count == 1
+
+    @pytest.mark.unit
+    @patch('app.core.llm_utils.client')
+    def test_call_llm_does_not_cache_errors(self, mock_client):
+        """Test that failed calls are not stored in the response cache"""
+        from app.core.llm_utils import call_llm, llm_response_cache
+
+        llm_response_cache.clear()
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        call_llm("Error prompt", temperature=0.1, use_cache=True)
+
+        assert llm_response_cache.get_stats()["entries"] == 0
+
 
 class TestQuestionCache:
     """Test cases for Question Cache functionality"""
@@ -149,17 +286,59 @@ class TestRegexUtils:
         except ImportError:
             pytest.skip("regex_utils module not available")
 
+    @pytest.mark.unit
+    def test_scan_pii_returns_typed_spans(self):
+        """Single-pass scan returns labelled spans with source offsets"""
+        from app.core.regex_utils import scan_pii
+
+        text = "연락처 010-1234-5678 생년월일: 1999.01.02 이메일 kim@example.com"
+        spans = scan_pii(text)
+
+        assert [span.label for span in spans] == ["phone", "birth", "email"]
+        for span in spans:
+            assert text[span.start:span.end] == span.value
+        # 생년월일은 접두어를 제외한 날짜만 값으로 사용
+        assert spans[1].value == "1999.01.02"
+
+    @pytest.mark.unit
+    def test_scan_pii_priority(self):
+        """Overlapping categories resolve to the higher-priority label"""
+        from app.core.regex_utils import scan_pii, PII_PATTERNS, PII_SCAN_ORDER
+
+        assert sorted(PII_SCAN_ORDER) == sorted(PII_PATTERNS)
+        labels = [span.label for span in scan_pii("주민번호 900101-1234567 휴대폰 01012345678")]
+        assert labels == ["ssn", "phone"]
+
+        # 숫자로 시작하는 이메일은 휴대폰/건강보험번호로 잘리지 않고 도메인까지 이메일로 탐지
+        for local in ("01012345678", "9001011234567"):
+            text = f"이메일 {local}@naver.com 연락처 010-1234-5678"
+            spans = scan_pii(text)
+            assert [(span.label, span.value) for span in spans] == [
+                ("email", f"{local}@naver.com"), ("phone", "010-1234-5678")
+            ]
+
+    @pytest.mark.unit
+    def test_detect_regex_pii_full_matches(self):
+        """Patterns with inner groups report the full match, not the captured group"""
+        from app.core.regex_utils import detect_regex_pii
+
+        result = detect_regex_pii("주소: 서울 테헤란로 123, 이름: 김철수, 이메일 a@b.com, a@b.com")
+        assert result["road_address"] == ["서울 테헤란로 123"]
+        assert result["name"] == ["이름: 김철수"]
+        assert result["email"] == ["a@b.com"]
+
 
 class TestS3Utils:
     """Test cases for S3 utility functions"""
 
     @pytest.mark.unit
-    @patch('app.core.s3_utils.s3')
-    def test_s3_upload_success(self, mock_s3_client):
+    @patch('app.core.s3_utils.get_s3_client')
+    def test_s3_upload_success(self, mock_get_client):
         """Test successful S3 file upload"""
         try:
             from app.core.s3_utils import upload_file_to_s3
             
+            mock_s3_client = mock_get_client.return_value
             mock_s3_client.put_object.return_value = None
             
             # Test file bytes
@@ -174,13 +353,13 @@ class TestS3Utils:
             pytest.skip("s3_utils module not available")
 
     @pytest.mark.unit
-    @patch('app.core.s3_utils.s3')
-    def test_s3_upload_failure(self, mock_s3_client):
+    @patch('app.core.s3_utils.get_s3_client')
+    def test_s3_upload_failure(self, mock_get_client):
         """Test S3 upload failure handling"""
         try:
             from app.core.s3_utils import upload_file_to_s3
             
-            mock_s3_client.put_object.side_effect = Exception("S3 Error")
+            mock_get_client.return_value.put_object.side_effect = Exception("S3 Error")
             
             test_content = b"test content"
             
@@ -191,47 +370,221 @@ class TestS3Utils:
         except ImportError:
             pytest.skip("s3_utils module not available")
 
+    @pytest.mark.unit
+    @patch('app.core.s3_utils.get_s3_client')
+    def test_s3_upload_fileobj_uses_transfer_config(self, mock_get_client):
+        """File objects are streamed with the multipart transfer config"""
+        from io import BytesIO
+        from app.core import s3_utils
+
+        file_obj = BytesIO(b"%PDF-1.4 content")
+        assert s3_utils.upload_fileobj_to_s3(file_obj, "documents/resumes/a.pdf") is True
+
+        mock_s3_client = mock_get_client.return_value
+        kwargs = mock_s3_client.upload_fileobj.call_args.kwargs
+        assert kwargs["Fileobj"] is file_obj
+        assert kwargs["Key"] == "documents/resumes/a.pdf"
+        assert kwargs["ExtraArgs"] == {"ContentType": "application/pdf"}
+        assert kwargs["Config"] is s3_utils.get_transfer_config()
+        mock_s3_client.put_object.assert_not_called()
+
+    @pytest.mark.unit
+    @patch('app.core.s3_utils.get_s3_client')
+    def test_s3_upload_fileobj_failure(self, mock_get_client):
+        """Streaming upload errors are reported as failure"""
+        from io import BytesIO
+        from app.core.s3_utils import upload_fileobj_to_s3
+
+        mock_get_client.return_value.upload_fileobj.side_effect = Exception("S3 Error")
+        assert upload_fileobj_to_s3(BytesIO(b"x"), "test-key") is False
+
+    @pytest.mark.unit
+    def test_shared_s3_client_created_once(self):
+        """All callers share one lazily created client with the tuned botocore config"""
+        from app.core import s3_utils
+
+        with patch.object(s3_utils, '_s3_client', None), patch('boto3.session.Session') as mock_session:
+            first = s3_utils.get_s3_client()
+            second = s3_utils.get_s3_client()
+
+        assert first is second
+        mock_session.return_value.client.assert_called_once()
+        config = mock_session.return_value.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == s3_utils.S3_MAX_POOL_CONNECTIONS
+        assert config.retries == {"max_attempts": s3_utils.S3_MAX_ATTEMPTS, "mode": "standard"}
+        assert config.tcp_keepalive == s3_utils.S3_TCP_KEEPALIVE
+
+    @pytest.mark.unit
+    def test_prompt_loader_uses_shared_client(self):
+        """PromptLoader reads prompts through the shared client instead of its own"""
+        from app.interview import prompt_loader
+
+        loader = prompt_loader.PromptLoader()
+        loader._s3_enabled = True
+        with patch.object(prompt_loader, 'get_s3_client') as mock_get_client:
+            mock_get_client.return_value.get_object.return_value = {"Body": Mock(read=lambda: b"prompt")}
+            assert loader._load_from_s3("question.txt") == "prompt"
+        mock_get_client.assert_called_once_with()
+
+    @pytest.mark.api
+    @patch('app.core.s3_utils.get_s3_client')
+    def test_upload_endpoint_streams_file(self, mock_get_client):
+        """/s3/upload passes the spooled upload file to S3 without reading it into memory"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        uploaded = {}
+
+        def fake_upload_fileobj(Fileobj, Bucket, Key, ExtraArgs, Config):
+            uploaded["body"] = Fileobj.read()
+            uploaded["key"] = Key
+            uploaded["content_type"] = ExtraArgs["ContentType"]
+
+        mock_get_client.return_value.upload_fileobj.side_effect = fake_upload_fileobj
+        response = TestClient(app).post(
+            "/s3/upload", files={"file": ("resume.pdf", b"%PDF-1.4 body", "application/pdf")}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "success"
+        assert uploaded == {"body": b"%PDF-1.4 body", "key": "documents/resumes/resume.pdf",
+                            "content_type": "application/pdf"}
+
+
+def _fake_async_pool(rows):
+    """async_pool 대체: fetchone이 rows(값 또는 호출 가능 객체)를 차례로 반환"""
+    cursor = MagicMock()
+    cursor.__aenter__.return_value = cursor
+    cursor.execute = AsyncMock()
+    cursor.fetchone = AsyncMock()
+    rows = iter(rows)
+
+    async def fetchone():
+        row = next(rows)
+        return row() if callable(row) else row
+
+    cursor.fetchone.side_effect = fetchone
+    conn = MagicMock()
+    conn.cursor = AsyncMock(return_value=cursor)
+    conn.commit = AsyncMock()
+    conn.rollback = AsyncMock()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool, cursor
+
 
 class TestMySQLUtils:
     """Test cases for MySQL utility functions"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_resume_text_cache(self):
+        from app.core import mysql_utils
+        from app.core.ttl_cache import TTLCache
+        with patch.object(mysql_utils, 'resume_text_cache', TTLCache(max_entries=8, ttl_seconds=60)):
+            yield
+
     @pytest.mark.unit
-    @patch('app.core.mysql_utils.get_connection')
-    def test_database_connection(self, mock_get_connection):
-        """Test MySQL database connection"""
-        try:
-            from app.core.mysql_utils import get_resume_text
-            
-            mock_connection = Mock()
-            mock_cursor = Mock()
-            mock_cursor.fetchone.return_value = ("Test content",)
-            mock_cursor.__enter__ = Mock(return_value=mock_cursor)
-            mock_cursor.__exit__ = Mock(return_value=None)
-            mock_connection.cursor.return_value = mock_cursor
-            mock_get_connection.return_value = mock_connection
-            
-            result = get_resume_text("test-doc-id")
-            
-            assert result == "Test content"
-            mock_get_connection.assert_called_once()
-            
-        except ImportError:
-            pytest.skip("mysql_utils module not available")
+    @pytest.mark.asyncio
+    async def test_database_connection(self):
+        """Test MySQL resume lookup through the async pool"""
+        from app.core import mysql_utils
+
+        pool, cursor = _fake_async_pool([("Test content", UPDATED_AT)])
+        with patch.object(mysql_utils, 'async_pool', pool):
+            result = await mysql_utils.aget_resume_text("test-doc-id")
+
+        assert result == "Test content"
+        pool.acquire.assert_called_once()
 
     @pytest.mark.unit
-    @patch('app.core.mysql_utils.get_connection')
-    def test_database_connection_failure(self, mock_get_connection):
+    @pytest.mark.asyncio
+    async def test_database_connection_failure(self):
         """Test MySQL connection failure handling"""
-        try:
-            from app.core.mysql_utils import get_resume_text
-            
-            mock_get_connection.return_value = None
-            
-            result = get_resume_text("test-doc-id")
-            assert result is None
-            
-        except ImportError:
-            pytest.skip("mysql_utils module not available")
+        from app.core import mysql_utils
+
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.side_effect = ConnectionError("Can't connect to MySQL server")
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text("test-doc-id") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_resume_text_cached_until_update(self):
+        """Repeated lookups hit the cache; updating the redacted content invalidates it"""
+        from app.core import mysql_utils
+
+        pool, cursor = _fake_async_pool([("old content", UPDATED_AT), ("new content", REUPLOADED_AT)])
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text(7) == "old content"
+            assert await mysql_utils.aget_resume_text("7") == "old content"
+            assert cursor.fetchone.call_count == 1
+
+            assert await mysql_utils.aupdate_redacted_resume_content(7, "new content") is True
+            assert await mysql_utils.aget_resume_text("7") == "new content"
+        assert cursor.fetchone.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_missing_resume_not_cached(self):
+        """A resume that does not exist yet is looked up again next time"""
+        from app.core import mysql_utils
+
+        pool, _ = _fake_async_pool([None, ("uploaded", UPDATED_AT)])
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text("9") is None
+            assert await mysql_utils.aget_resume_text("9") == "uploaded"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_not_overwritten(self):
+        """A read that started before an update does not put the old text back into the cache"""
+        from app.core import mysql_utils
+
+        def read_then_update():
+            # 조회 결과가 돌아오기 전에 다른 요청이 본문을 갱신하고 캐시를 무효화
+            mysql_utils.invalidate_resume_text("7")
+            return ("old content", UPDATED_AT)
+
+        pool, _ = _fake_async_pool([read_then_update, ("new content", REUPLOADED_AT)])
+        with patch.object(mysql_utils, 'async_pool', pool):
+            assert await mysql_utils.aget_resume_text("7") == "old content"
+            assert mysql_utils.resume_text_cache.get("7") is None
+            assert await mysql_utils.aget_resume_text("7") == "new content"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_by_updated_at(self):
+        """Entries past the revalidation window are checked with a cheap updated_at query"""
+        from app.core import mysql_utils
+
+        pool, cursor = _fake_async_pool([
+            ("old content", UPDATED_AT),
+            (UPDATED_AT,),                          # 변경 없음 → 캐시 재사용
+            (REUPLOADED_AT,),                       # 다른 워커에서 재업로드됨 → 본문 다시 조회
+            ("new content", REUPLOADED_AT),
+        ])
+        with patch.object(mysql_utils, 'async_pool', pool), \
+             patch.object(mysql_utils, 'RESUME_TEXT_CACHE_REVALIDATE_SECONDS', 0):
+            assert await mysql_utils.aget_resume_text("7") == "old content"
+            assert await mysql_utils.aget_resume_text("7") == "old content"
+            assert await mysql_utils.aget_resume_text("7") == "new content"
+
+        queries = [call.args[0] for call in cursor.execute.call_args_list]
+        assert queries == [mysql_utils.RESUME_TEXT_QUERY, mysql_utils.RESUME_UPDATED_AT_QUERY,
+                           mysql_utils.RESUME_UPDATED_AT_QUERY, mysql_utils.RESUME_TEXT_QUERY]
+
+    @pytest.mark.api
+    def test_cache_delete_endpoint_invalidates_resume_text(self):
+        """DELETE /questions/cache/{document_id} also drops the cached resume text"""
+        from fastapi.testclient import TestClient
+        from app.core import mysql_utils
+        from app.main import app
+
+        mysql_utils._store_resume_text("11", "resume", UPDATED_AT, mysql_utils._resume_text_generation)
+        response = TestClient(app).delete("/api/ai/questions/cache/11")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["resume_text_invalidated"] is True
+        assert mysql_utils.resume_text_cache.get("11") is None
 
 
 class TestPromptLoader:
@@ -282,10 +635,11 @@ class TestPromptLoader:
 class TestIntegrationWithWikipedia:
     """Integration tests combining multiple services including Wikipedia"""
 
+    @pytest.mark.asyncio
     @pytest.mark.integration
-    @patch('app.interview.answer_analyzer.WikipediaService')
-    @patch('app.interview.answer_analyzer.call_llm')
-    def test_complete_analysis_flow_with_wikipedia(self, mock_call_llm, mock_wiki_service):
+    @patch('app.interview.answer_analyzer.get_wikipedia_service')
+    @patch('app.interview.answer_analyzer.acall_llm')
+    async def test_complete_analysis_flow_with_wikipedia(self, mock_call_llm, mock_wiki_service):
         """Test complete answer analysis flow including Wikipedia integration"""
         from app.interview.answer_analyzer import analyze_answer
         
@@ -317,7 +671,7 @@ class TestIntegrationWithWikipedia:
                 "Analyze: {question} {text} {jobtype} {level} {category}"  # Analysis prompt
             ]
             
-            result = analyze_answer(
+            result = await analyze_answer(
                 "What is Python?",
                 "Python is a great language for web development",
                 "Backend Developer", 
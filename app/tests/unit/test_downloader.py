@@ -0,0 +1,130 @@
+"""
+Tests for the streaming PDF downloader
+"""
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.resume import downloader
+from app.resume.downloader import download_pdf, PDFDownloadError
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 4096 + b"\n%%EOF"
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestDownloadPDF:
+    """Test cases for download_pdf"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_download_success(self):
+        """PDF bodies are streamed and returned as bytes"""
+        client = _client(lambda request: httpx.Response(200, content=PDF_BYTES,
+                                                        headers={"content-type": "binary/octet-stream"}))
+        with patch.object(downloader, 'download_client', client):
+            with await download_pdf("https://bucket.s3.amazonaws.com/resume.pdf") as pdf_file:
+                assert pdf_file.read() == PDF_BYTES
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_large_download_spills_to_disk(self):
+        """Only downloads above the spool threshold are written to disk"""
+        client = _client(lambda request: httpx.Response(200, content=PDF_BYTES))
+        with patch.object(downloader, 'download_client', client):
+            small = await download_pdf("https://example.com/resume.pdf", spool_max_memory=len(PDF_BYTES))
+            large = await download_pdf("https://example.com/resume.pdf", spool_max_memory=1024)
+
+        with small, large:
+            assert not small._rolled
+            assert large._rolled
+            assert large.read() == PDF_BYTES
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_http_error_status(self):
+        """Error statuses raise PDFDownloadError"""
+        client = _client(lambda request: httpx.Response(403, content=b"AccessDenied"))
+        with patch.object(downloader, 'download_client', client):
+            with pytest.raises(PDFDownloadError, match="403"):
+                await download_pdf("https://bucket.s3.amazonaws.com/resume.pdf")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_content_length_over_limit(self):
+        """Declared sizes above the limit are rejected before reading the body"""
+        client = _client(lambda request: httpx.Response(200, content=PDF_BYTES))
+        with patch.object(downloader, 'download_client', client):
+            with pytest.raises(PDFDownloadError, match="크기"):
+                await download_pdf("https://example.com/resume.pdf", max_bytes=100)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_streamed_size_over_limit(self):
+        """Bodies without Content-Length are cut off once they exceed the limit"""
+        async def body():
+            yield b"%PDF-1.4\n"
+            for _ in range(100):
+                yield b"0" * 1024
+
+        client = _client(lambda request: httpx.Response(200, content=body()))
+        with patch.object(downloader, 'download_client', client):
+            with pytest.raises(PDFDownloadError, match="크기"):
+                await download_pdf("https://example.com/resume.pdf", max_bytes=10 * 1024)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content,content_type", [
+        (b"<html>" + b" " * 2048, "application/octet-stream"),
+        (PDF_BYTES, "text/html; charset=utf-8"),
+    ])
+    async def test_not_a_pdf(self, content, content_type):
+        """Non-PDF responses are rejected by signature or content type"""
+        client = _client(lambda request: httpx.Response(200, content=content, headers={"content-type": content_type}))
+        with patch.object(downloader, 'download_client', client):
+            with pytest.raises(PDFDownloadError):
+                await download_pdf("https://example.com/resume.pdf")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_total_timeout(self):
+        """Slow bodies are aborted at the overall deadline"""
+        async def slow_body():
+            yield b"%PDF-1.4\n"
+            await asyncio.sleep(5)
+            yield b"never"
+
+        client = _client(lambda request: httpx.Response(200, content=slow_body()))
+        with patch.object(downloader, 'download_client', client):
+            with pytest.raises(PDFDownloadError, match="시간 초과"):
+                await download_pdf("https://example.com/resume.pdf", timeout=0.1)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connection_error(self):
+        """Transport errors are wrapped"""
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        with patch.object(downloader, 'download_client', _client(handler)):
+            with pytest.raises(PDFDownloadError, match="connection refused"):
+                await download_pdf("https://example.com/resume.pdf")
+
+
+class TestProcessResumeDownload:
+    """Test cases for download failures in the resume endpoint"""
+
+    @pytest.mark.api
+    def test_download_failure_returns_400(self):
+        """Download errors map to 400"""
+        with patch('app.resume.pipeline.download_pdf', side_effect=PDFDownloadError("PDF 파일 형식이 아닙니다")):
+            response = TestClient(app).post("/api/ai/file", json={
+                "fileUrl": "https://example.com/resume.pdf", "userId": 1, "documentId": 1, "fileType": "pdf"
+            })
+
+        assert response.status_code == 400
+        assert "PDF 파일 형식이 아닙니다" in response.json()["detail"]
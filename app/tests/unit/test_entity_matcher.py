@@ -0,0 +1,133 @@
+"""
+Tests for the Aho-Corasick entity matcher
+"""
+import pytest
+from unittest.mock import patch
+from app.resume.entity_matcher import EntityMatcher, build_entity_matcher, get_dictionary_matcher, load_dictionaries
+
+
+class TestEntityMatcher:
+    """Test cases for EntityMatcher"""
+
+    @pytest.mark.unit
+    def test_all_overlapping_matches(self):
+        """Classic he/she/his/hers example reports every match"""
+        matcher = EntityMatcher()
+        for word in ["he", "she", "his", "hers"]:
+            matcher.add(word, word)
+        matches = sorted(matcher.iter_matches("ushers"))
+
+        assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    @pytest.mark.unit
+    def test_find_all_leftmost_longest(self):
+        """Non-overlapping matches prefer the leftmost, then the longest"""
+        matcher = build_entity_matcher({"name": ["김철", "김철수", "철수"], "location": ["서울"]})
+        text = "김철수와 철수는 서울에서 김철을 만났다"
+
+        assert matcher.find_all(text) == [(0, 3, "name"), (5, 7, "name"), (9, 11, "location"), (14, 16, "name")]
+
+    @pytest.mark.unit
+    def test_label_rank(self):
+        """A string detected under two labels takes the higher-ranked one"""
+        ranks = {"name": 0, "location": 1}
+        matcher = build_entity_matcher({"location": ["서울"], "name": ["서울"]}, rank=ranks.get)
+
+        assert matcher.find_all("서울") == [(0, 2, "name")]
+
+    @pytest.mark.unit
+    def test_word_boundary(self):
+        """Boundary mode skips ASCII terms embedded in longer words"""
+        matcher = EntityMatcher(word_boundary=True)
+        matcher.add("GIST", "school")
+        matcher.add("DGIST", "school")
+
+        assert matcher.find_all("LOGISTICS") == []
+        assert matcher.find_all("DGIST, GIST") == [(0, 5, "school"), (7, 11, "school")]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("text,expected", [
+        ("세종대로 110", []),
+        ("세종대왕 연구", []),
+        ("고려대장경 답사", []),
+        ("세종대도로", []),
+        ("세종대 졸업", ["세종대"]),
+        ("세종대, 고려대.", ["세종대", "고려대"]),
+        ("세종대에서 석사", ["세종대"]),
+        ("고려대의 연구실", ["고려대"]),
+        ("세종대학교 졸업", ["세종대"]),
+        ("(세종대)", ["세종대"]),
+    ])
+    def test_hangul_word_boundary(self, text, expected):
+        """Boundary mode accepts a Hangul entry only before a space, punctuation, a particle or 학교"""
+        matcher = EntityMatcher(word_boundary=True)
+        matcher.add("세종대", "school")
+        matcher.add("고려대", "school")
+
+        assert [text[start:end] for start, end, _ in matcher.find_all(text)] == expected
+
+    @pytest.mark.unit
+    def test_many_patterns_single_scan(self):
+        """Hundreds of entities are matched in one pass"""
+        words = [f"지원자{i:03d}" for i in range(500)]
+        matcher = build_entity_matcher({"name": words})
+        text = " ".join(words[::7])
+
+        assert len(matcher.find_all(text)) == len(words[::7])
+
+
+class TestDictionaries:
+    """Test cases for curated dictionaries"""
+
+    @pytest.mark.unit
+    def test_load_dictionaries(self, tmp_path):
+        """Each <label>.txt file becomes one dictionary, comments skipped"""
+        (tmp_path / "school.txt").write_text("# 주석\nKAIST\n\n카이스트\n", encoding="utf-8")
+        (tmp_path / "README.md").write_text("ignored", encoding="utf-8")
+
+        assert load_dictionaries(str(tmp_path)) == {"school": ["KAIST", "카이스트"]}
+        assert load_dictionaries(str(tmp_path / "missing")) == {}
+
+    @pytest.mark.unit
+    def test_bundled_school_dictionary(self):
+        """The bundled school dictionary tags abbreviations"""
+        matches = get_dictionary_matcher().find_all("2018 KAIST 전산학부 졸업, 포스텍 석사")
+        assert [label for _, _, label in matches] == ["school", "school"]
+
+    @pytest.mark.unit
+    def test_detect_pii_uses_dictionary(self):
+        """Dictionary hits are reported and masked by detect_pii"""
+        from app.resume import pii_detector
+
+        with patch.object(pii_detector, 'get_ner', return_value=None):
+            result = pii_detector.detect_pii("학력: 카이스트 전산학 학사")
+
+        assert result["regex_result"]["school"] == ["카이스트"]
+        assert result["anonymized_text"] == "학력: [REDACTED_SCHOOL] 전산학 학사"
+
+    @pytest.mark.unit
+    def test_dictionary_hit_inside_regex_span_not_reported(self):
+        """An abbreviation inside a full school name matched by regex is not reported twice"""
+        from app.resume import pii_detector
+
+        with patch.object(pii_detector, 'get_ner', return_value=None), \
+             patch.object(pii_detector, 'NER_STRATEGY', "transformer"):
+            result = pii_detector.detect_pii("학력: 한양대학교 졸업, 카이스트 석사", return_spans=True)
+
+        assert result["regex_result"]["school"] == ["한양대학교", "카이스트"]
+        assert [(span["source"], span["start"], span["end"]) for span in result["redacted_spans"]] == [
+            ("regex", 4, 9), ("dictionary", 14, 18)
+        ]
+
+    @pytest.mark.unit
+    def test_detect_pii_skips_school_inside_longer_words(self):
+        """Road names and words that merely start with a school abbreviation are left alone"""
+        from app.resume import pii_detector
+
+        text = "서울 중구 세종대로 110, 세종대왕 연구, 고려대장경 답사"
+        with patch.object(pii_detector, 'get_ner', return_value=None), \
+             patch.object(pii_detector, 'NER_STRATEGY', "transformer"):
+            result = pii_detector.detect_pii(text)
+
+        assert "school" not in result["regex_result"]
+        assert result["anonymized_text"] == text
@@ -0,0 +1,149 @@
+"""
+Tests for the Kiwi-based Korean name/location pre-filter
+"""
+import pytest
+from unittest.mock import Mock, patch
+from app.resume.kiwi_detector import KiwiDetector, classify_proper_noun, get_kiwi_detector, has_name_context
+
+
+class TestClassifyProperNoun:
+    """Test cases for proper noun classification"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("word,name_context,label", [
+        ("이수민", True, "name"),
+        ("남궁민수", True, "name"),
+        ("김민구", True, "name"),
+        ("이수민", False, "uncertain"),
+        ("김민구", False, "uncertain"),
+        ("서울특별시", False, "location"),
+        ("해운대구", False, "location"),
+        ("부산", False, "location"),
+        ("네이버", False, None),
+        ("한양대학교", False, None),
+        ("Python", False, None),
+    ])
+    def test_classify(self, word, name_context, label):
+        """Surname matches are only certain after a name label; region heuristics label locations"""
+        assert classify_proper_noun(word, name_context) == label
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("word", ["한국", "구글", "서울대", "신한은행", "조선일보"])
+    def test_organizations_are_not_names(self, word):
+        """Common organization and country names that start with a surname are not name candidates"""
+        assert classify_proper_noun(word) is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("text,start,expected", [
+        ("성 명 이수민", 4, True),
+        ("이름: 김민준", 4, True),
+        ("Name 김민준", 5, True),
+        ("팀장 박지훈과 함께", 3, False),
+        ("성명\n박지훈", 3, False),
+    ])
+    def test_has_name_context(self, text, start, expected):
+        assert has_name_context(text, start) is expected
+
+
+class TestKiwiDetector:
+    """Test cases for KiwiDetector"""
+
+    @pytest.fixture(scope="class")
+    def detector(self):
+        detector = get_kiwi_detector()
+        if detector is None:
+            pytest.skip("kiwipiepy not available")
+        return detector
+
+    @pytest.mark.unit
+    def test_detects_korean_names_and_locations(self, detector):
+        """Korean names and locations are tagged with source offsets"""
+        text = "성 명 이수민\n주소: 서울특별시 강남구"
+        detection = detector.detect(text)
+
+        found = {(ent.label, ent.word) for ent in detection.entities}
+        assert ("name", "이수민") in found
+        assert ("location", "서울특별시") in found
+        for ent in detection.entities:
+            assert text[ent.start:ent.end] == ent.word
+
+    @pytest.mark.unit
+    def test_latin_names_are_uncertain(self, detector):
+        """Capitalized Latin word runs are left to the transformer"""
+        text = "Worked with Michael Johnson on the KAIST API"
+        detection = detector.detect(text)
+
+        assert any("Michael Johnson" in text[start:end] for start, end in detection.uncertain)
+
+    @pytest.mark.unit
+    def test_surname_match_without_name_label_is_uncertain(self, detector):
+        """A surname-shaped word outside a name field goes to the transformer instead of being masked"""
+        text = "팀장 박지훈과 함께 프로젝트를 진행했습니다."
+        detection = detector.detect(text)
+
+        assert detection.entities == []
+        assert [text[start:end] for start, end in detection.uncertain] == ["박지훈"]
+
+    @pytest.mark.unit
+    def test_organizations_not_detected(self, detector):
+        """Companies, schools and countries are neither names nor transformer candidates"""
+        detection = detector.detect("구글 코리아 인턴, 서울대 연구실, 신한은행 근무, 한국 거주, 조선일보 기자")
+        assert detection.entities == []
+        assert detection.uncertain == []
+
+    @pytest.mark.unit
+    def test_organizations_kept_without_transformer(self, detector):
+        """With the transformer unavailable, hybrid detection masks the labelled name but not organization names"""
+        from app.resume import pii_detector
+
+        text = "성명: 이수민\n구글 코리아 인턴, 한국전력공사, 신한은행 근무, 한국 거주"
+        with patch.object(pii_detector, 'get_kiwi_detector', return_value=detector), \
+             patch.object(pii_detector, 'get_ner', return_value=None), \
+             patch.object(pii_detector, 'NER_STRATEGY', "hybrid"):
+            result = pii_detector.detect_pii(text)
+
+        assert result["ner_result"] == {"name": ["이수민"]}
+        assert result["anonymized_text"] == \
+            "성명: [REDACTED_NAME]\n구글 코리아 인턴, 한국전력공사, 신한은행 근무, 한국 거주"
+
+
+class TestHybridDetection:
+    """Test cases for the Kiwi-first detection strategy"""
+
+    @pytest.mark.unit
+    def test_transformer_runs_only_on_uncertain_chunks(self):
+        """Only chunks with uncertain spans are sent to the transformer"""
+        from app.resume import pii_detector
+        from app.resume.chunker import TextChunk
+        from app.resume.kiwi_detector import KiwiDetection, KiwiEntity
+
+        text = "홍길동 지원자\nContact Jane Doe"
+        chunks = [TextChunk(text="홍길동 지원자\n", start=0), TextChunk(text="Contact Jane Doe", start=8)]
+        detection = KiwiDetection(entities=[KiwiEntity("name", "홍길동", 0, 3)], uncertain=[(8, 24)])
+        fake_ner = Mock(return_value=[{"entity_group": "PER", "word": "Jane Doe", "start": 8, "end": 16, "score": 0.9}])
+        kiwi = Mock()
+        kiwi.detect.return_value = detection
+
+        with patch.object(pii_detector, 'get_ner', return_value=fake_ner), \
+             patch.object(pii_detector, '_chunk_for_ner', return_value=chunks), \
+             patch.object(pii_detector, 'get_kiwi_detector', return_value=kiwi), \
+             patch.object(pii_detector, 'NER_STRATEGY', "hybrid"):
+            result = pii_detector.detect_pii(text, return_spans=True)
+
+        assert fake_ner.call_args[0][0] == ["Contact Jane Doe"]
+        assert result["ner_result"] == {"name": ["홍길동", "Jane Doe"]}
+        assert result["anonymized_text"] == "[REDACTED_NAME] 지원자\nContact [REDACTED_NAME]"
+        assert [span["source"] for span in result["redacted_spans"]] == ["kiwi", "ner"]
+
+    @pytest.mark.unit
+    def test_kiwi_unavailable_falls_back_to_transformer(self):
+        """Without Kiwi every chunk goes to the transformer"""
+        from app.resume import pii_detector
+
+        with patch.object(pii_detector, 'get_kiwi_detector', return_value=None), \
+             patch.object(pii_detector, 'get_ner', return_value=None), \
+             patch.object(pii_detector, 'NER_STRATEGY', "hybrid"):
+            entities, chunks = pii_detector._plan_ner("홍길동 지원자")
+
+        assert entities == []
+        assert [chunk.text for chunk in chunks] == ["홍길동 지원자"]
@@ -0,0 +1,72 @@
+"""
+Tests for the pluggable NER inference backends
+"""
+import pytest
+from unittest.mock import patch, Mock
+from app.resume import ner_backend
+from app.resume.ner_backend import load_ner_pipeline, onnx_cache_path
+
+
+class TestNERBackend:
+    """Test cases for NER backend selection"""
+
+    @pytest.mark.unit
+    def test_unknown_backend(self):
+        """Unknown backend names are rejected"""
+        with pytest.raises(ValueError):
+            load_ner_pipeline("tensorrt", "some/model")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["torch", "torch-int8", "onnx"])
+    def test_backend_dispatch(self, backend):
+        """Each backend name dispatches to its loader"""
+        loader = Mock(return_value="pipeline")
+        with patch.dict(ner_backend._LOADERS, {backend: loader}):
+            assert load_ner_pipeline(backend, "some/model") == "pipeline"
+        loader.assert_called_once_with("some/model")
+        assert ner_backend.get_loaded_backend()["loaded"] == backend
+
+    @pytest.mark.unit
+    def test_missing_optional_dependency_falls_back_to_torch(self):
+        """A backend whose dependencies are missing falls back to the torch pipeline"""
+        onnx_loader = Mock(side_effect=ImportError("No module named 'optimum'"))
+        with patch.dict(ner_backend._LOADERS, {"onnx": onnx_loader}), \
+             patch.object(ner_backend, '_load_torch', return_value="torch-pipeline") as mock_torch:
+            assert load_ner_pipeline("onnx", "some/model", fallback=True) == "torch-pipeline"
+        mock_torch.assert_called_once_with("some/model")
+        assert ner_backend.get_loaded_backend() == {
+            "requested": "onnx", "loaded": "torch", "fallback_reason": "No module named 'optimum'"
+        }
+
+    @pytest.mark.unit
+    def test_missing_optional_dependency_without_fallback(self):
+        """With fallback disabled a missing dependency fails instead of silently loading torch"""
+        onnx_loader = Mock(side_effect=ImportError("No module named 'optimum'"))
+        with patch.dict(ner_backend._LOADERS, {"onnx": onnx_loader}), \
+             patch.object(ner_backend, '_load_torch') as mock_torch:
+            with pytest.raises(ImportError, match="optimum"):
+                load_ner_pipeline("onnx", "some/model", fallback=False)
+        mock_torch.assert_not_called()
+
+    @pytest.mark.unit
+    def test_onnx_cache_path(self, tmp_path):
+        """Exported models are cached per model name"""
+        path = onnx_cache_path("FacebookAI/xlm-roberta-large", str(tmp_path))
+        assert path == str(tmp_path / "FacebookAI--xlm-roberta-large")
+
+
+class TestEntityAgreement:
+    """Test cases for the benchmark agreement metric"""
+
+    @pytest.mark.unit
+    def test_entity_agreement(self):
+        """Entities match on label and character span"""
+        from benchmarks.ner_backends import entity_agreement
+
+        reference = [[("PER", 0, 4), ("LOC", 10, 15)], []]
+        candidate = [[("PER", 0, 4), ("LOC", 10, 14)], [("ORG", 0, 3)]]
+        agreement = entity_agreement(reference, candidate)
+
+        assert agreement["precision"] == pytest.approx(1 / 3)
+        assert agreement["recall"] == pytest.approx(1 / 2)
+        assert agreement["f1"] == pytest.approx(0.4)
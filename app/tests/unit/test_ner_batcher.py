@@ -0,0 +1,148 @@
+"""
+Tests for the NER micro-batching worker
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.resume.ner_batcher import NERBatcher
+
+
+class FakeNER:
+    """Records batch calls and tags each text with a PER entity"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        outputs = [[{"entity_group": "PER", "word": text, "start": 0, "end": len(text)}] for text in texts]
+        return outputs[0] if len(texts) == 1 else outputs
+
+
+class TestNERBatcher:
+    """Test cases for NERBatcher"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Concurrent submissions are run as a single batch and scattered back in order"""
+        ner = FakeNER()
+        batcher = NERBatcher(lambda: ner, max_batch_size=8, max_wait_ms=50)
+        try:
+            results = await asyncio.gather(*(batcher.submit(f"text-{i}") for i in range(5)))
+        finally:
+            await batcher.stop()
+
+        assert len(ner.calls) == 1
+        assert sorted(ner.calls[0]) == [f"text-{i}" for i in range(5)]
+        assert [result[0]["word"] for result in results] == [f"text-{i}" for i in range(5)]
+        assert batcher.get_stats()["batches"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_max_size(self):
+        """Batches never exceed the configured size"""
+        ner = FakeNER()
+        batcher = NERBatcher(lambda: ner, max_batch_size=2, max_wait_ms=50)
+        try:
+            results = await batcher.submit_many(["a", "b", "c", "d", "e"])
+        finally:
+            await batcher.stop()
+
+        assert [len(call) for call in ner.calls] == [2, 2, 1]
+        assert [result[0]["word"] for result in results] == ["a", "b", "c", "d", "e"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_single_text_batch(self):
+        """A lone request is flushed after the wait time"""
+        ner = FakeNER()
+        batcher = NERBatcher(lambda: ner, max_batch_size=8, max_wait_ms=1)
+        try:
+            result = await batcher.submit("only")
+        finally:
+            await batcher.stop()
+
+        assert result == [{"entity_group": "PER", "word": "only", "start": 0, "end": 4}]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_model_unavailable(self):
+        """Without a model every request gets an empty entity list"""
+        batcher = NERBatcher(lambda: None, max_wait_ms=1)
+        try:
+            assert await batcher.submit_many(["a", "b"]) == [[], []]
+        finally:
+            await batcher.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_inference_error_propagates(self):
+        """Inference errors are raised to every caller in the batch and the worker keeps running"""
+        calls = []
+
+        def failing_ner(texts, batch_size=None):
+            calls.append(texts)
+            if len(calls) == 1:
+                raise RuntimeError("inference failed")
+            return [[] for _ in texts]
+
+        batcher = NERBatcher(lambda: failing_ner, max_wait_ms=1)
+        try:
+            with pytest.raises(RuntimeError):
+                await batcher.submit_many(["a", "b"])
+            assert await batcher.submit_many(["c", "d"]) == [[], []]
+        finally:
+            await batcher.stop()
+
+
+class TestBatchedPIIDetection:
+    """Test cases for the async PII detection path"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_adetect_pii_uses_batcher(self):
+        """adetect_pii merges batched NER entities with regex results"""
+        from app.resume import pii_detector
+
+        entities = [{"entity_group": "PER", "word": "김철수", "start": 3, "end": 6}]
+        with patch.object(pii_detector.ner_batcher, 'submit_many', return_value=[entities]) as mock_submit:
+            result = await pii_detector.adetect_pii("이름 김철수 kim@example.com")
+
+        mock_submit.assert_called_once()
+        assert result["ner_result"] == {"name": ["김철수"]}
+        assert "email" in result["detected_pii_fields"]
+        assert "김철수" not in result["anonymized_text"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_adetect_pii_builds_result_off_event_loop(self):
+        """Regex/dictionary scanning and redaction run in a worker thread, not on the event loop"""
+        import threading
+        from app.resume import pii_detector
+
+        loop_thread = threading.get_ident()
+        build = pii_detector._build_pii_result
+        threads = []
+
+        def recording_build(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return build(*args, **kwargs)
+
+        with patch.object(pii_detector.ner_batcher, 'submit_many', return_value=[[]]), \
+             patch.object(pii_detector, '_build_pii_result', side_effect=recording_build):
+            result = await pii_detector.adetect_pii("Call 010-1234-5678")
+
+        assert "phone" in result["regex_result"]
+        assert threads and threads[0] != loop_thread
+
+    @pytest.mark.api
+    def test_pii_check_endpoint(self):
+        """The PII check endpoint goes through the batched path"""
+        with patch('app.resume.pii_detector.ner_batcher.submit_many', return_value=[[]]):
+            response = TestClient(app).post("/api/ai/resume/pii-check", data={"text": "Call 010-1234-5678"})
+
+        assert response.status_code == 200
+        assert "phone" in response.json()["pii_found"]["regex_result"]
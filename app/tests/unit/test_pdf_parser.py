@@ -0,0 +1,260 @@
+"""
+Tests for PDF text extraction from paths and in-memory buffers
+"""
+import io
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from unittest.mock import patch, MagicMock
+from fastapi.testclient import TestClient
+from app.main import app
+from app.resume import parser
+from app.resume.parser import extract_text_from_pdf
+from app.resume.result_cache import ResumeResultCache
+
+
+def make_pdf(pages):
+    """Build a minimal text-layer PDF with one Helvetica text line per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+@pytest.fixture
+def pdf_bytes():
+    return make_pdf(["Hong Gildong Backend Engineer", "Python FastAPI Kubernetes"])
+
+
+class TestExtractTextFromPDF:
+    """Test cases for extract_text_from_pdf input types"""
+
+    @pytest.mark.unit
+    def test_from_path(self, tmp_path, pdf_bytes):
+        """File paths are still supported"""
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(pdf_bytes)
+
+        text = extract_text_from_pdf(str(path))
+        assert text == "Hong Gildong Backend Engineer\nPython FastAPI Kubernetes"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("wrap", [bytes, memoryview, bytearray, io.BytesIO])
+    def test_from_buffer(self, pdf_bytes, wrap):
+        """bytes, memoryview and file-like buffers are parsed without touching disk"""
+        assert extract_text_from_pdf(wrap(pdf_bytes)) == "Hong Gildong Backend Engineer\nPython FastAPI Kubernetes"
+
+    @pytest.mark.unit
+    def test_buffer_rewound(self, pdf_bytes):
+        """A buffer left at its end after writing is rewound before parsing"""
+        buffer = io.BytesIO()
+        buffer.write(pdf_bytes)
+        assert "Hong Gildong" in extract_text_from_pdf(buffer)
+
+    @pytest.mark.unit
+    def test_empty_text_layer(self):
+        """PDFs without text return None"""
+        assert extract_text_from_pdf(make_pdf([""])) is None
+
+
+class TestProcessResumeInMemory:
+    """Test cases for passing the downloaded buffer straight to the parser"""
+
+    @pytest.mark.api
+    def test_downloaded_buffer_parsed_without_tempfile(self, pdf_bytes):
+        """The endpoint parses the spooled download and continues the pipeline"""
+        async def fake_download(url):
+            return io.BytesIO(pdf_bytes)
+
+        with patch('app.resume.pipeline.download_pdf', side_effect=fake_download), \
+             patch('app.resume.pipeline.adetect_pii') as mock_detect, \
+             patch('app.resume.pipeline.aupdate_redacted_resume_content', return_value=True) as mock_update, \
+             patch('app.resume.pipeline.pii_log_shipper'), \
+             patch('app.resume.pipeline.resume_result_cache', ResumeResultCache()), \
+             patch('tempfile.NamedTemporaryFile') as mock_tempfile:
+            mock_detect.return_value = {"anonymized_text": "masked", "regex_result": {}, "ner_result": {}}
+            response = TestClient(app).post("/api/ai/file", json={
+                "fileUrl": "https://example.com/resume.pdf", "userId": 1, "documentId": 7, "fileType": "pdf"
+            })
+
+        assert response.status_code == 200
+        assert "Hong Gildong" in mock_detect.call_args[0][0]
+        mock_update.assert_awaited_once_with(document_id=7, redacted_text="masked")
+        mock_tempfile.assert_not_called()
+
+
+class TestParallelExtraction:
+    """Test cases for process-pool page extraction"""
+
+    @pytest.fixture
+    def pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+        # 프로세스 생성 비용 없이 분할/재조립 경로만 검증
+        executor = ThreadPoolExecutor(max_workers=3)
+        with patch.object(parser, 'get_pdf_pool', return_value=executor):
+            yield executor
+        executor.shutdown()
+
+    @pytest.mark.unit
+    def test_page_ranges(self):
+        """Pages are split into contiguous ranges covering every page"""
+        assert parser._page_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+        assert parser._page_ranges(0, 4) == []
+
+    @pytest.mark.unit
+    def test_pages_reassembled_in_order(self, pool):
+        """Page ranges finishing out of order are joined in page order"""
+        pages = [f"Page {i}" for i in range(11)]
+        with patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 4), patch.object(parser, 'PDF_PAGES_PER_TASK', 2), \
+             patch.object(parser, '_extract_page_range', wraps=parser._extract_page_range) as mock_range:
+            text = extract_text_from_pdf(make_pdf(pages))
+
+        assert text == "\n".join(pages)
+        assert mock_range.call_count == 6
+
+    @pytest.mark.unit
+    def test_workers_receive_shared_path(self, pool):
+        """Workers get one shared file path instead of a pickled copy of the PDF per task"""
+        pages = [f"Page {i}" for i in range(6)]
+        with patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 4), patch.object(parser, 'PDF_PAGES_PER_TASK', 2), \
+             patch.object(parser, '_extract_page_range', wraps=parser._extract_page_range) as mock_range:
+            assert extract_text_from_pdf(io.BytesIO(make_pdf(pages))) == "\n".join(pages)
+
+        paths = {call.args[0] for call in mock_range.call_args_list}
+        assert len(paths) == 1
+        path = paths.pop()
+        assert isinstance(path, str)
+        assert not os.path.exists(path)
+
+    @pytest.mark.unit
+    def test_path_source_not_copied(self, pool, tmp_path):
+        """A PDF already on disk is handed to the workers by its own path"""
+        pdf_path = tmp_path / "resume.pdf"
+        pdf_path.write_bytes(make_pdf([f"Page {i}" for i in range(4)]))
+        with patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 4), \
+             patch.object(parser, '_extract_page_range', wraps=parser._extract_page_range) as mock_range:
+            extract_text_from_pdf(str(pdf_path))
+
+        assert mock_range.call_args.args[0] == str(pdf_path)
+        assert pdf_path.exists()
+
+    @pytest.mark.unit
+    def test_small_pdf_stays_in_process(self, pool, pdf_bytes):
+        """PDFs below the page threshold are not sent to workers"""
+        with patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 8), \
+             patch.object(parser, '_extract_page_range') as mock_range:
+            assert "Hong Gildong" in extract_text_from_pdf(pdf_bytes)
+        mock_range.assert_not_called()
+
+    @pytest.mark.unit
+    def test_broken_pool_falls_back(self, pdf_bytes):
+        """A crashed worker pool falls back to sequential extraction and is discarded"""
+        from concurrent.futures.process import BrokenProcessPool
+        broken = MagicMock()
+        broken.submit.side_effect = BrokenProcessPool("worker died")
+        with patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 1), \
+             patch.object(parser, 'get_pdf_pool', return_value=broken), \
+             patch.object(parser, 'shutdown_pdf_pool') as mock_shutdown:
+            assert "Hong Gildong" in extract_text_from_pdf(pdf_bytes)
+        mock_shutdown.assert_called_once()
+
+    @pytest.mark.unit
+    def test_process_pool_end_to_end(self, pdf_bytes):
+        """Real spawn workers extract pages and the pool is reused across calls"""
+        pages = [f"Section {i}" for i in range(6)]
+        try:
+            with patch.object(parser, 'PDF_PARSE_WORKERS', 2), patch.object(parser, 'PDF_PARALLEL_MIN_PAGES', 2):
+                assert extract_text_from_pdf(make_pdf(pages)) == "\n".join(pages)
+                pool = parser._pdf_pool
+                assert pool is not None
+                assert "Hong Gildong" in extract_text_from_pdf(pdf_bytes)
+                assert parser._pdf_pool is pool
+        finally:
+            parser.shutdown_pdf_pool()
+        assert parser._pdf_pool is None
+
+
+class TestPDFExtractors:
+    """Test cases for the fast extractor and per-page pdfplumber fallback"""
+
+    @pytest.mark.unit
+    def test_extractors_agree(self, pdf_bytes):
+        """pdfium and pdfplumber produce the same text for a simple text layer"""
+        assert extract_text_from_pdf(pdf_bytes, extractor="pdfium") == \
+            extract_text_from_pdf(pdf_bytes, extractor="pdfplumber")
+
+    @pytest.mark.unit
+    def test_unknown_extractor(self):
+        """Unknown extractor names are rejected"""
+        with pytest.raises(ValueError, match="PDF_EXTRACTOR"):
+            parser.get_extractor("ocr")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("text,expected", [
+        ("Hong Gildong Backend Engineer", False),
+        ("   \n ", True),
+        ("��� name ��", True),
+        ("\n".join(["H", "o", "n", "g", "G", "il", "d", "o", "n", "g"]), True),
+        ("\n".join(["Python FastAPI"] * 10), False),
+    ])
+    def test_is_low_quality_page(self, text, expected):
+        """Empty, garbled and fragmented pages are flagged"""
+        assert parser.is_low_quality_page(text) is expected
+
+    @pytest.mark.unit
+    def test_low_quality_pages_fall_back(self):
+        """Only low-quality pages are re-extracted with pdfplumber"""
+        pdf = make_pdf(["First page", "Second page", "Third page"])
+        fast = parser.PDF_EXTRACTORS["pdfium"]
+        with patch.object(fast, 'extract_pages', return_value=["First page", "���", "Third page"]), \
+             patch.object(parser.FALLBACK_EXTRACTOR, 'extract_pages',
+                          wraps=parser.FALLBACK_EXTRACTOR.extract_pages) as mock_fallback:
+            text = extract_text_from_pdf(pdf, extractor="pdfium")
+
+        assert text == "First page\nSecond page\nThird page"
+        mock_fallback.assert_called_once()
+        assert list(mock_fallback.call_args[0][1]) == [1]
+
+    @pytest.mark.unit
+    def test_unreadable_by_fast_extractor(self, pdf_bytes):
+        """Documents pdfium cannot open are handled entirely by pdfplumber"""
+        fast = parser.PDF_EXTRACTORS["pdfium"]
+        with patch.object(fast, 'page_count', side_effect=Exception("Failed to load document")):
+            assert "Hong Gildong" in extract_text_from_pdf(pdf_bytes, extractor="pdfium")
+
+    @pytest.mark.unit
+    def test_concurrent_pdfium_extraction(self, tmp_path):
+        """Many threads extracting in-process at once do not crash PDFium (runs in a subprocess to catch SIGSEGV)"""
+        pdf_path = tmp_path / "resume.pdf"
+        pdf_path.write_bytes(make_pdf([f"Page {i} text" for i in range(6)]))
+        script = textwrap.dedent(f"""
+            from concurrent.futures import ThreadPoolExecutor
+            from app.resume.parser import extract_text_from_pdf
+            pdf = open({str(pdf_path)!r}, "rb").read()
+            with ThreadPoolExecutor(16) as pool:
+                results = list(pool.map(lambda _: extract_text_from_pdf(pdf, extractor="pdfium"), range(400)))
+            assert all(text and text.startswith("Page 0 text") for text in results)
+        """)
+        env = dict(os.environ, PDF_PARSE_WORKERS="0")
+        result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300)
+        assert result.returncode == 0, result.stderr[-2000:]
@@ -0,0 +1,148 @@
+"""
+Tests for the batched PII audit-log shipper
+"""
+import asyncio
+import gzip
+import json
+import os
+import pytest
+from unittest.mock import Mock, patch
+from app.resume.pii_log_shipper import PIILogShipper
+
+
+def _payload(file_id):
+    return {"code": "200", "data": {"file_id": str(file_id), "detected_pii_fields": ["email"]}}
+
+
+def _shipped_records(upload):
+    records = []
+    for call in upload.call_args_list:
+        body = gzip.decompress(call.kwargs["file_bytes"]).decode("utf-8")
+        records.extend(json.loads(line) for line in body.splitlines())
+    return records
+
+
+@pytest.fixture
+def upload():
+    return Mock(return_value=True)
+
+
+@pytest.fixture
+def shipper(tmp_path, upload):
+    return PIILogShipper(spool_dir=str(tmp_path), flush_interval_seconds=3600, max_batch_records=100,
+                         max_batch_bytes=1024 * 1024, fsync=False, key_prefix="pii-logs/batches/", upload=upload)
+
+
+class TestPIILogShipper:
+    """Test cases for PIILogShipper"""
+
+    @pytest.mark.unit
+    def test_records_shipped_as_one_gzip_object(self, shipper, upload):
+        """Buffered records go out together as a single gzip JSON Lines object"""
+        for i in range(3):
+            shipper.record(_payload(i))
+        upload.assert_not_called()
+
+        assert shipper.flush() == 1
+        upload.assert_called_once()
+        assert upload.call_args.kwargs["object_key"].startswith("pii-logs/batches/")
+        assert upload.call_args.kwargs["object_key"].endswith(".jsonl.gz")
+        assert [record["data"]["file_id"] for record in _shipped_records(upload)] == ["0", "1", "2"]
+        assert shipper.get_stats()["shipped_records"] == 3
+
+    @pytest.mark.unit
+    def test_flush_without_records(self, shipper, upload):
+        """Flushing an empty spool uploads nothing"""
+        assert shipper.flush() == 0
+        upload.assert_not_called()
+
+    @pytest.mark.unit
+    def test_batch_rotated_by_size(self, shipper, upload, tmp_path):
+        """Reaching max_batch_records cuts a batch file without waiting for the interval"""
+        shipper.max_batch_records = 2
+        for i in range(5):
+            shipper.record(_payload(i))
+
+        assert len(list(tmp_path.glob("batch-*.jsonl"))) == 2
+        assert shipper.flush(rotate=False) == 2
+        assert len(_shipped_records(upload)) == 4
+        assert shipper.get_stats()["spooled_records"] == 1
+
+    @pytest.mark.unit
+    def test_failed_upload_retried(self, shipper, upload, tmp_path):
+        """Batches that fail to upload stay on disk and are retried on the next flush"""
+        shipper.record(_payload(1))
+        upload.return_value = False
+        assert shipper.flush() == 0
+        assert len(list(tmp_path.glob("batch-*.jsonl"))) == 1
+
+        upload.return_value = True
+        assert shipper.flush() == 1
+        assert list(tmp_path.glob("batch-*.jsonl")) == []
+        assert shipper.get_stats()["failed_uploads"] == 1
+
+    @pytest.mark.unit
+    def test_orphaned_spool_recovered(self, tmp_path, upload):
+        """Spool files left by a dead process are shipped by the next one"""
+        dead_pid = 2 ** 22 + 1
+        (tmp_path / f"current-{dead_pid}.jsonl").write_text(json.dumps(_payload("lost")) + "\n")
+        (tmp_path / f"batch-{dead_pid}-1-1.jsonl").write_text(json.dumps(_payload("pending")) + "\n")
+
+        async def restart():
+            shipper = PIILogShipper(spool_dir=str(tmp_path), flush_interval_seconds=3600, fsync=False, upload=upload)
+            await shipper.start()
+            await shipper.stop()
+
+        asyncio.run(restart())
+        assert sorted(record["data"]["file_id"] for record in _shipped_records(upload)) == ["lost", "pending"]
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.unit
+    def test_orphan_adopted_by_another_worker(self, tmp_path, upload):
+        """A dead worker's file taken by a sibling worker first is skipped instead of failing startup"""
+        dead_pid = 2 ** 22 + 1
+        orphan = tmp_path / f"current-{dead_pid}.jsonl"
+        orphan.write_text(json.dumps(_payload("lost")) + "\n")
+        real_replace = os.replace
+
+        def sibling_wins(src, dst):
+            if src == str(orphan):
+                real_replace(src, tmp_path / "adopted-by-sibling.jsonl")
+            return real_replace(src, dst)
+
+        async def restart():
+            shipper = PIILogShipper(spool_dir=str(tmp_path), flush_interval_seconds=3600, fsync=False, upload=upload)
+            await shipper.start()
+            await shipper.stop()
+
+        with patch("app.resume.pii_log_shipper.os.replace", side_effect=sibling_wins):
+            asyncio.run(restart())
+        upload.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_size_trigger_wakes_background_flush(self, shipper, upload):
+        """A full batch is shipped by the background task before the interval elapses"""
+        shipper.max_batch_records = 2
+        await shipper.start()
+        try:
+            await asyncio.to_thread(shipper.record, _payload(1))
+            await asyncio.to_thread(shipper.record, _payload(2))
+            for _ in range(100):
+                if upload.called:
+                    break
+                await asyncio.sleep(0.01)
+            assert upload.call_count == 1
+        finally:
+            await shipper.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self, shipper, upload, tmp_path):
+        """Shutdown ships whatever is still in the spool"""
+        await shipper.start()
+        shipper.record(_payload(1))
+        await shipper.stop()
+
+        assert len(_shipped_records(upload)) == 1
+        assert not os.listdir(tmp_path)
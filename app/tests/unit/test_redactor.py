@@ -0,0 +1,87 @@
+"""
+Tests for span-based PII redaction
+"""
+import pytest
+from unittest.mock import patch
+from app.resume.redactor import RedactionSpan, find_word_spans, merge_spans, redact
+
+
+class TestRedactor:
+    """Test cases for span merging and single-pass masking"""
+
+    @pytest.mark.unit
+    def test_redact_non_overlapping(self):
+        """Each span is replaced by its label token"""
+        text = "call 010-1234-5678 or mail a@b.com"
+        spans = [RedactionSpan("phone", 5, 18, "regex"), RedactionSpan("email", 27, 34, "regex")]
+        masked, applied = redact(text, spans)
+
+        assert masked == "call [REDACTED_PHONE] or mail [REDACTED_EMAIL]"
+        assert applied == sorted(spans, key=lambda s: s.start)
+
+    @pytest.mark.unit
+    def test_overlaps_merged_with_priority_label(self):
+        """Overlapping spans become one region labelled by the higher-priority category"""
+        text = "이름: 김철수입니다"
+        spans = [RedactionSpan("location", 4, 7, "ner"), RedactionSpan("school", 0, 6, "regex")]
+        masked, applied = redact(text, spans)
+
+        # 두 스팬을 합친 구간 전체를 마스킹 (부분 노출 없음)
+        assert applied == [RedactionSpan("school", 0, 7, "regex")]
+        assert masked == "[REDACTED_SCHOOL]입니다"
+
+    @pytest.mark.unit
+    def test_no_remasking_inside_tokens(self):
+        """Words that appear in a redaction token are not masked again"""
+        text = "Contact EMAIL a@b.com"
+        spans = [RedactionSpan("email", 14, 21, "regex")] + find_word_spans(text, {"name": ["EMAIL"]})
+        masked, _ = redact(text, spans)
+
+        assert masked == "Contact [REDACTED_NAME] [REDACTED_EMAIL]"
+
+    @pytest.mark.unit
+    def test_find_word_spans_all_occurrences_longest_first(self):
+        """Every occurrence is found and longer words win over their substrings"""
+        text = "김철수 and 김철 met 김철수"
+        spans = find_word_spans(text, {"name": ["김철", "김철수"]})
+
+        assert [(s.start, s.end) for s in spans] == [(0, 3), (8, 10), (15, 18)]
+
+    @pytest.mark.unit
+    def test_merge_spans_ignores_empty(self):
+        """Empty spans are dropped"""
+        assert merge_spans([RedactionSpan("name", 3, 3, "ner")]) == []
+
+
+class TestDetectPIISpans:
+    """Test cases for detect_pii span output"""
+
+    @pytest.mark.unit
+    def test_return_spans(self):
+        """detect_pii can return the applied span map for auditing"""
+        from app.resume import pii_detector
+
+        text = "김철수 010-1234-5678, 김철수"
+        with patch.object(pii_detector, 'get_ner', return_value=None), \
+             patch.object(pii_detector, 'NER_STRATEGY', "transformer"):
+            plain = pii_detector.detect_pii(text)
+            result = pii_detector.detect_pii(text, return_spans=True)
+
+        assert "redacted_spans" not in plain
+        assert result["redacted_spans"] == [{"label": "phone", "start": 4, "end": 17, "source": "regex"}]
+        assert result["anonymized_text"] == "김철수 [REDACTED_PHONE], 김철수"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ner_word_masked_everywhere(self):
+        """A name tagged once by NER is masked at every occurrence"""
+        from app.resume import pii_detector
+
+        text = "김철수 지원자. 추천인: 김철수"
+        entities = [{"entity_group": "PER", "word": "김철수", "start": 0, "end": 3, "score": 0.9}]
+        with patch.object(pii_detector.ner_batcher, 'submit_many', return_value=[entities]), \
+             patch.object(pii_detector, 'NER_STRATEGY', "transformer"):
+            result = await pii_detector.adetect_pii(text, return_spans=True)
+
+        assert result["anonymized_text"] == "[REDACTED_NAME] 지원자. 추천인: [REDACTED_NAME]"
+        assert [span["source"] for span in result["redacted_spans"]] == ["ner", "ner"]
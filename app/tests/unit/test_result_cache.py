@@ -0,0 +1,111 @@
+"""
+Tests for content-hash deduplication of resume processing results
+"""
+import io
+import pytest
+from unittest.mock import patch
+from app.resume import pipeline
+from app.resume.pipeline import process_resume_document
+from app.resume.result_cache import ResumeResultCache, hash_pdf_file, hash_text
+from app.schemas.resume import ResumeProcessRequest
+
+PII_RESULT = {
+    "anonymized_text": "[NAME] Backend Engineer",
+    "regex_result": {"email": ["hong@example.com"]},
+    "ner_result": {"name": ["홍길동"]},
+    "redacted_spans": [],
+}
+
+
+def _request(document_id=7):
+    return ResumeProcessRequest(fileUrl="https://example.com/resume.pdf", userId=1,
+                                documentId=document_id, fileType="pdf")
+
+
+class TestResumeResultCache:
+    """Test cases for ResumeResultCache"""
+
+    @pytest.mark.unit
+    def test_hash_pdf_file_rewinds(self):
+        """Hashing reads the whole buffer and rewinds it for parsing"""
+        buffer = io.BytesIO(b"%PDF-1.4 resume")
+        buffer.seek(5)
+        assert hash_pdf_file(buffer) == hash_pdf_file(io.BytesIO(b"%PDF-1.4 resume"))
+        assert buffer.tell() == 0
+
+    @pytest.mark.unit
+    def test_set_indexes_pdf_and_text(self):
+        """A stored result is reachable by PDF hash and by text hash, without extra keys"""
+        cache = ResumeResultCache()
+        cache.set("pdf-hash", "홍길동 Backend Engineer", PII_RESULT)
+
+        expected = {key: PII_RESULT[key] for key in ("anonymized_text", "regex_result", "ner_result")}
+        assert cache.get_by_pdf("pdf-hash") == expected
+        assert cache.get_by_text(hash_text("홍길동 Backend Engineer")) == expected
+        assert cache.get_by_pdf("other") is None
+
+    @pytest.mark.unit
+    def test_oversized_results_not_cached(self):
+        """Results larger than the byte budget are skipped"""
+        cache = ResumeResultCache(max_bytes=64)
+        cache.set("pdf-hash", "text", {**PII_RESULT, "anonymized_text": "x" * 1000})
+        assert cache.get_by_pdf("pdf-hash") is None
+
+
+class TestPipelineDeduplication:
+    """Test cases for cache hits in process_resume_document"""
+
+    @pytest.fixture
+    def mocks(self):
+        downloads = {"body": b"%PDF-1.4 first"}
+
+        async def fake_download(url):
+            return io.BytesIO(downloads["body"])
+
+        with patch.object(pipeline, 'resume_result_cache', ResumeResultCache()), \
+             patch.object(pipeline, 'download_pdf', side_effect=fake_download), \
+             patch.object(pipeline, 'extract_text_from_pdf', return_value="홍길동 Backend Engineer") as extract, \
+             patch.object(pipeline, 'adetect_pii', return_value=PII_RESULT) as detect, \
+             patch.object(pipeline, 'aupdate_redacted_resume_content', return_value=True) as update, \
+             patch.object(pipeline, 'pii_log_shipper') as shipper:
+            yield {"downloads": downloads, "extract": extract, "detect": detect, "update": update, "shipper": shipper}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_same_pdf_skips_extraction_and_ner(self, mocks):
+        """Re-uploading identical bytes reuses the result but still writes DB and log"""
+        assert await process_resume_document(_request(7)) is None
+        assert await process_resume_document(_request(8)) == "pdf"
+
+        mocks["extract"].assert_called_once()
+        mocks["detect"].assert_called_once()
+        assert mocks["update"].call_count == 2
+        mocks["update"].assert_called_with(document_id=8, redacted_text="[NAME] Backend Engineer")
+        assert mocks["shipper"].record.call_count == 2
+        assert mocks["shipper"].record.call_args[0][0]["data"]["file_id"] == "8"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_same_text_skips_ner(self, mocks):
+        """Different bytes with identical extracted text skip only NER"""
+        await process_resume_document(_request())
+        mocks["downloads"]["body"] = b"%PDF-1.4 re-exported"
+        stages = []
+        cache_hit = await process_resume_document(
+            _request(), on_stage=lambda stage, skipped=False: stages.append((stage, skipped))
+        )
+
+        assert cache_hit == "text"
+        assert mocks["extract"].call_count == 2
+        mocks["detect"].assert_called_once()
+        assert ("pii", True) in stages
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_extraction_not_cached(self, mocks):
+        """Empty extractions are not cached and still fail"""
+        mocks["extract"].return_value = None
+        for _ in range(2):
+            with pytest.raises(pipeline.ResumeProcessingError):
+                await process_resume_document(_request())
+        assert mocks["extract"].call_count == 2
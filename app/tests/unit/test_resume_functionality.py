@@ -154,6 +154,71 @@ class TestPIIDetection:
             pytest.skip("pii_detector module not available")
 
 
+class TestNERLoading:
+    """Test cases for lazy NER model loading"""
+
+    @pytest.fixture(autouse=True)
+    def reset_ner_state(self):
+        from app.resume import pii_detector
+        original = (pii_detector._ner, pii_detector._ner_status)
+        pii_detector._ner, pii_detector._ner_status = None, "not_loaded"
+        yield pii_detector
+        pii_detector._ner, pii_detector._ner_status = original
+
+    @pytest.mark.unit
+    def test_ner_loaded_once_on_first_use(self, reset_ner_state):
+        """The model is loaded on first detection and reused afterwards"""
+        pii_detector = reset_ner_state
+        fake_ner = Mock(return_value=[{"entity_group": "PER", "word": "김철수", "start": 11, "end": 14}], tokenizer=None)
+
+        with patch.object(pii_detector, '_load_ner', return_value=fake_ner) as mock_load:
+            assert pii_detector.get_ner_status() == "not_loaded"
+            first = pii_detector.detect_pii("My name is 김철수")
+            pii_detector.detect_pii("Another text")
+
+        mock_load.assert_called_once()
+        assert pii_detector.get_ner_status() == "ready"
+        assert first["ner_result"]["name"] == ["김철수"]
+
+    @pytest.mark.unit
+    def test_ner_load_failure_falls_back_to_regex(self, reset_ner_state):
+        """A failed load is not retried and detection continues with regex only"""
+        pii_detector = reset_ner_state
+
+        with patch.object(pii_detector, '_load_ner', side_effect=OSError("model not found")) as mock_load:
+            result = pii_detector.detect_pii("Contact: john.doe@example.com")
+            pii_detector.detect_pii("Another text")
+
+        mock_load.assert_called_once()
+        assert pii_detector.get_ner_status() == "failed"
+        assert "email" in result["detected_pii_fields"]
+
+    @pytest.mark.unit
+    def test_background_warmup(self, reset_ner_state):
+        """Warmup loads the model in a background thread only once"""
+        pii_detector = reset_ner_state
+
+        with patch.object(pii_detector, '_load_ner', return_value=Mock()) as mock_load:
+            thread = pii_detector.start_ner_warmup()
+            thread.join(timeout=5)
+            assert pii_detector.start_ner_warmup() is None
+
+        mock_load.assert_called_once()
+        assert pii_detector.get_ner_status() == "ready"
+
+    @pytest.mark.unit
+    def test_disabled_ner_skips_loading(self, reset_ner_state):
+        """With NER disabled the model is never loaded"""
+        pii_detector = reset_ner_state
+        pii_detector._ner_status = "disabled"
+
+        with patch.object(pii_detector, '_load_ner') as mock_load:
+            assert pii_detector.start_ner_warmup() is None
+            assert pii_detector.get_ner() is None
+
+        mock_load.assert_not_called()
+
+
 class TestPIILogger:
     """Test cases for PII logging functionality"""
 
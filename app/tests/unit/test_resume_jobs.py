@@ -0,0 +1,213 @@
+"""
+Tests for the resume processing pipeline and background job queue
+"""
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.resume import jobs
+from app.resume.jobs import ResumeJobQueue, JobQueueFullError, JobOnOtherWorkerError
+from app.resume.pipeline import PIPELINE_STAGES, ResumeProcessingError
+from app.schemas.resume import ResumeProcessRequest
+
+REQUEST_BODY = {"fileUrl": "https://example.com/resume.pdf", "userId": 1, "documentId": 7, "fileType": "pdf"}
+
+
+def _request(document_id=7):
+    return ResumeProcessRequest(**{**REQUEST_BODY, "documentId": document_id})
+
+
+async def _fake_pipeline(request, on_stage=None):
+    for stage in PIPELINE_STAGES:
+        on_stage(stage)
+        await asyncio.sleep(0)
+
+
+class TestResumeJobQueue:
+    """Test cases for ResumeJobQueue"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_job_succeeds_with_stage_progress(self):
+        """Completed jobs report every stage as done"""
+        queue = ResumeJobQueue(concurrency=1)
+        with patch.object(jobs, 'process_resume_document', side_effect=_fake_pipeline):
+            job = await queue.submit(_request())
+            assert job.status == "queued"
+            await queue.join()
+
+        assert job.status == "succeeded"
+        assert job.stages == {stage: "done" for stage in PIPELINE_STAGES}
+        assert queue.get(job.job_id) is job
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_stage_recorded(self):
+        """Pipeline errors mark the failing stage and keep the status code"""
+        async def failing(request, on_stage=None):
+            on_stage("download")
+            on_stage("extract")
+            raise ResumeProcessingError(400, "PDF에서 텍스트를 추출하지 못했습니다.", "extract")
+
+        queue = ResumeJobQueue(concurrency=1)
+        with patch.object(jobs, 'process_resume_document', side_effect=failing):
+            job = await queue.submit(_request())
+            await queue.join()
+
+        assert job.status == "failed"
+        assert job.error_code == 400
+        assert job.stages["download"] == "done"
+        assert job.stages["extract"] == "failed"
+        assert job.stages["pii"] == "pending"
+        assert queue.get_stats()["failed"] == 1
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_hit_marks_skipped_stage(self):
+        """Stages skipped on a cache hit are reported as skipped"""
+        async def cached(request, on_stage=None):
+            on_stage("download")
+            on_stage("extract")
+            on_stage("pii", skipped=True)
+            on_stage("db")
+            on_stage("log")
+            return "pdf"
+
+        queue = ResumeJobQueue(concurrency=1)
+        with patch.object(jobs, 'process_resume_document', side_effect=cached):
+            job = await queue.submit(_request())
+            await queue.join()
+
+        assert job.cache_hit == "pdf"
+        assert job.stages == {"download": "done", "extract": "done", "pii": "skipped", "db": "done", "log": "done"}
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """No more than `concurrency` jobs run at the same time"""
+        running = 0
+        peak = 0
+
+        async def slow(request, on_stage=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queue = ResumeJobQueue(concurrency=2)
+        with patch.object(jobs, 'process_resume_document', side_effect=slow):
+            submitted = [await queue.submit(_request(i)) for i in range(6)]
+            await queue.join()
+
+        assert peak == 2
+        assert all(job.status == "succeeded" for job in submitted)
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_queue_full(self):
+        """Submissions beyond max_pending are rejected"""
+        queue = ResumeJobQueue(concurrency=1, max_pending=2)
+        blocker = asyncio.Event()
+
+        async def blocked(request, on_stage=None):
+            await blocker.wait()
+
+        with patch.object(jobs, 'process_resume_document', side_effect=blocked):
+            await queue.submit(_request(1))
+            await asyncio.sleep(0)  # 첫 작업이 실행 상태로 전환
+            await queue.submit(_request(2))
+            await queue.submit(_request(3))
+            with pytest.raises(JobQueueFullError):
+                await queue.submit(_request(4))
+            blocker.set()
+            await queue.join()
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire(self):
+        """Finished job records are dropped after the result TTL"""
+        queue = ResumeJobQueue(concurrency=1, result_ttl_seconds=60)
+        with patch.object(jobs, 'process_resume_document', side_effect=_fake_pipeline):
+            job = await queue.submit(_request())
+            await queue.join()
+
+        job.finished_monotonic = time.monotonic() - 61
+        assert queue.get(job.job_id) is None
+        await queue.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_job_from_other_worker(self):
+        """A job id issued by another worker process is reported as such, not as missing"""
+        issuing, other = ResumeJobQueue(concurrency=1), ResumeJobQueue(concurrency=1)
+        with patch.object(jobs, 'process_resume_document', side_effect=_fake_pipeline):
+            job = await issuing.submit(_request())
+            await issuing.join()
+
+        assert job.job_id.startswith(f"{issuing.worker_id}-")
+        assert issuing.get(job.job_id) is job
+        with pytest.raises(JobOnOtherWorkerError):
+            other.get(job.job_id)
+        await issuing.stop()
+
+
+class TestResumeJobEndpoints:
+    """Test cases for /api/ai/file/jobs"""
+
+    @pytest.mark.api
+    def test_submit_and_poll(self):
+        """Submitting returns 202 with a job id that can be polled to completion"""
+        with patch.object(jobs, 'resume_job_queue', ResumeJobQueue(concurrency=1)) as queue, \
+             patch('app.router.resume.resume_job_queue', queue), \
+             patch.object(jobs, 'process_resume_document', side_effect=_fake_pipeline), \
+             TestClient(app) as client:
+            response = client.post("/api/ai/file/jobs", json=REQUEST_BODY)
+            assert response.status_code == 202
+            job_id = response.json()["data"]["jobId"]
+
+            for _ in range(50):
+                status = client.get(f"/api/ai/file/jobs/{job_id}").json()["data"]
+                if status["status"] == "succeeded":
+                    break
+                time.sleep(0.01)
+
+        assert status["status"] == "succeeded"
+        assert status["documentId"] == 7
+        assert status["stages"] == {stage: "done" for stage in PIPELINE_STAGES}
+
+    @pytest.mark.api
+    def test_unknown_job(self):
+        """Unknown job ids return 404"""
+        response = TestClient(app).get("/api/ai/file/jobs/does-not-exist")
+        assert response.status_code == 404
+
+    @pytest.mark.api
+    def test_job_on_other_worker_returns_421(self):
+        """Polling a job registered on another worker explains the routing problem instead of a bare 404"""
+        response = TestClient(app).get(f"/api/ai/file/jobs/{'0' * 8}-{'a' * 32}")
+        assert response.status_code == 421
+        assert "다른 워커" in response.json()["detail"]
+
+    @pytest.mark.api
+    def test_queue_full_returns_503(self):
+        """A full queue rejects new jobs with 503"""
+        with patch('app.router.resume.resume_job_queue.submit', side_effect=JobQueueFullError("full")):
+            response = TestClient(app).post("/api/ai/file/jobs", json=REQUEST_BODY)
+        assert response.status_code == 503
+
+    @pytest.mark.api
+    def test_sync_endpoint_maps_pipeline_errors(self):
+        """The synchronous endpoint still returns the pipeline's status code"""
+        with patch('app.router.resume.process_resume_document',
+                   side_effect=ResumeProcessingError(500, "DB 저장 실패", "db")):
+            response = TestClient(app).post("/api/ai/file", json=REQUEST_BODY)
+        assert response.status_code == 500
+        assert response.json()["detail"] == "DB 저장 실패"
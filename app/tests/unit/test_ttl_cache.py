@@ -0,0 +1,82 @@
+"""
+Tests for the shared LRU + TTL cache
+"""
+import pytest
+from unittest.mock import patch
+from app.core.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache"""
+
+    @pytest.mark.unit
+    def test_set_and_get(self):
+        """Stored values are returned and counted as hits"""
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.unit
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted when max_entries is exceeded"""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_ttl_expiration(self):
+        """Entries expire after ttl_seconds"""
+        cache = TTLCache(max_entries=10, ttl_seconds=10)
+        with patch('app.core.ttl_cache.time.monotonic', return_value=100.0):
+            cache.set("a", 1)
+        with patch('app.core.ttl_cache.time.monotonic', return_value=111.0):
+            assert cache.get("a") is None
+            assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_per_entry_ttl_and_cleanup(self):
+        """Per-entry TTL overrides the default and cleanup removes expired entries"""
+        cache = TTLCache(max_entries=10, ttl_seconds=100)
+        with patch('app.core.ttl_cache.time.monotonic', return_value=0.0):
+            cache.set("short", 1, ttl_seconds=5)
+            cache.set("long", 2)
+        with patch('app.core.ttl_cache.time.monotonic', return_value=50.0):
+            assert cache.cleanup_expired() == 1
+            assert "long" in cache
+
+    @pytest.mark.unit
+    def test_memory_cap(self):
+        """Total size stays under max_bytes"""
+        cache = TTLCache(max_entries=100, ttl_seconds=60, max_bytes=10, sizeof=len)
+        cache.set("a", "12345")
+        cache.set("b", "12345")
+        cache.set("c", "123")
+
+        assert "a" not in cache
+        assert cache.get_stats()["total_bytes"] <= 10
+
+        # 상한보다 큰 단일 값은 저장하지 않음
+        cache.set("big", "x" * 11)
+        assert "big" not in cache
+
+    @pytest.mark.unit
+    def test_cached_none_is_distinguishable(self):
+        """None values can be cached and told apart from misses with a sentinel"""
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        sentinel = object()
+        cache.set("neg", None)
+
+        assert cache.get("neg", sentinel) is None
+        assert cache.get("other", sentinel) is sentinel
@@ -0,0 +1,141 @@
+"""
+Tests for the offline Wikipedia summary index
+"""
+import gzip
+import pytest
+from unittest.mock import patch
+from app.core.wikipedia_index import WikipediaIndex, build_index, normalize_title, main
+from app.core.wikipedia_service import WikipediaService
+
+SAMPLE_DUMP = """<feed>
+<doc>
+<title>위키백과: 파이썬</title>
+<url>https://ko.wikipedia.org/wiki/%ED%8C%8C%EC%9D%B4%EC%8D%AC</url>
+<abstract>파이썬은 1991년 귀도 반 로섬이 발표한 고급 프로그래밍 언어이다.</abstract>
+</doc>
+<doc>
+<title>위키백과: REST</title>
+<url>https://ko.wikipedia.org/wiki/REST</url>
+<abstract>REST는 월드 와이드 웹과 같은 분산 하이퍼미디어 시스템을 위한 소프트웨어 아키텍처의 한 형식이다.</abstract>
+</doc>
+<doc>
+<title>위키백과: 가비지 컬렉션</title>
+<url>https://ko.wikipedia.org/wiki/%EA%B0%80%EB%B9%84%EC%A7%80_%EC%BB%AC%EB%A0%89%EC%85%98</url>
+<abstract>가비지 컬렉션은 메모리 관리 기법 중의 하나이다.</abstract>
+</doc>
+<doc>
+<title>위키백과: 빈 문서</title>
+<url>https://ko.wikipedia.org/wiki/Empty</url>
+<abstract></abstract>
+</doc>
+</feed>
+"""
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    dump_path = tmp_path / "kowiki-abstract.xml.gz"
+    with gzip.open(dump_path, "wt", encoding="utf-8") as f:
+        f.write(SAMPLE_DUMP)
+
+    redirects_path = tmp_path / "redirects.tsv"
+    redirects_path.write_text("Python\t파이썬\nGC\t가비지 컬렉션\nBroken\t없는 문서\n", encoding="utf-8")
+
+    path = tmp_path / "wikipedia.idx"
+    build_index(str(dump_path), str(path), str(redirects_path))
+    return str(path)
+
+
+class TestWikipediaIndex:
+    """Test cases for building and querying the index"""
+
+    @pytest.mark.unit
+    def test_normalize_title(self):
+        """Case, spacing and underscores are ignored"""
+        assert normalize_title("Garbage_Collection") == normalize_title("garbage collection")
+        assert normalize_title("REST API") == "restapi"
+
+    @pytest.mark.unit
+    def test_exact_and_redirect_lookup(self, index_path):
+        """Titles and redirects resolve to the article summary"""
+        index = WikipediaIndex(index_path)
+        try:
+            # 문서 3개 + 유효한 리다이렉트 2개 (빈 요약/깨진 리다이렉트는 제외)
+            assert len(index) == 5
+
+            result = index.lookup("파이썬")
+            assert result["title"] == "파이썬"
+            assert "프로그래밍 언어" in result["extract"]
+            assert result["url"].startswith("https://ko.wikipedia.org/wiki/")
+
+            assert index.lookup("python")["title"] == "파이썬"
+            assert index.lookup("GC")["title"] == "가비지 컬렉션"
+            assert index.lookup("없는 문서") is None
+        finally:
+            index.close()
+
+    @pytest.mark.unit
+    def test_fuzzy_lookup(self, index_path):
+        """Near-miss titles are matched, unrelated ones are not"""
+        index = WikipediaIndex(index_path)
+        try:
+            assert index.fuzzy_lookup("가비지컬랙션")["title"] == "가비지 컬렉션"
+            assert index.fuzzy_lookup("쿠버네티스") is None
+        finally:
+            index.close()
+
+    @pytest.mark.unit
+    def test_invalid_file(self, tmp_path):
+        """Files without the index header are rejected"""
+        bad_path = tmp_path / "bad.idx"
+        bad_path.write_bytes(b"not an index" * 10)
+
+        with pytest.raises(ValueError):
+            WikipediaIndex(str(bad_path))
+
+    @pytest.mark.unit
+    def test_cli_builds_index(self, tmp_path):
+        """The build step is runnable as a module CLI"""
+        dump_path = tmp_path / "dump.xml"
+        dump_path.write_text(SAMPLE_DUMP, encoding="utf-8")
+        out_path = tmp_path / "cli.idx"
+
+        main([str(dump_path), str(out_path)])
+
+        index = WikipediaIndex(str(out_path))
+        try:
+            assert index.lookup("REST") is not None
+        finally:
+            index.close()
+
+
+class TestWikipediaServiceOfflineBackend:
+    """Test cases for WikipediaService backed by the offline index"""
+
+    @pytest.mark.unit
+    def test_index_hit_skips_live_api(self, index_path):
+        """Index hits are served without calling the live API"""
+        service = WikipediaService(index=WikipediaIndex(index_path))
+
+        with patch.object(service.wiki_api, 'page') as mock_page, \
+             patch('wikipedia.search') as mock_search:
+            summary = service.get_concept_summary("Python")
+            title = service.search_concept("가비지 컬렉션")
+
+        assert summary["title"] == "파이썬"
+        assert title == "가비지 컬렉션"
+        mock_page.assert_not_called()
+        mock_search.assert_not_called()
+
+    @pytest.mark.unit
+    def test_index_miss_falls_back_to_live_api(self, index_path):
+        """Index misses fall back to the live API"""
+        service = WikipediaService(index=WikipediaIndex(index_path))
+
+        with patch.object(service.wiki_api, 'page') as mock_page, \
+             patch.object(service, 'search_concept', return_value=None):
+            mock_page.return_value.exists.return_value = False
+            result = service.get_concept_summary("쿠버네티스")
+
+        assert result is None
+        mock_page.assert_called_once_with("쿠버네티스")
@@ -325,6 +325,28 @@ class TestWikipediaService:
             assert result1 is None
             assert result2 is None
 
+    @pytest.mark.unit
+    def test_transient_errors_not_cached(self):
+        """API errors are not cached as negative results, so the next call retries"""
+        page_obj = Mock()
+        page_obj.exists.return_value = True
+        page_obj.title = "Python"
+        page_obj.summary = "Python is a programming language."
+        page_obj.fullurl = "https://ko.wikipedia.org/wiki/Python"
+
+        with patch.object(self.service.wiki_api, 'page') as mock_page, \
+             patch('wikipedia.search') as mock_search:
+            mock_page.side_effect = [Exception("timeout"), page_obj]
+            mock_search.side_effect = [Exception("timeout"), ["Python"]]
+
+            assert self.service.get_concept_summary("Python") is None
+            assert self.service.get_concept_summary("Python")["title"] == "Python"
+            assert self.service.search_concept("Python") is None
+            assert self.service.search_concept("Python") == "Python"
+
+        assert mock_page.call_count == 2
+        assert mock_search.call_count == 2
+
     @pytest.mark.unit
     def test_clear_cache(self):
         """Test cache clearing functionality"""
@@ -473,3 +495,55 @@ class TestWikipediaService:
             content_result = self.service.get_concept_summary("Python")
             assert content_result["title"] == "Python (programming language)"
             mock_page.assert_called_once()
+
+
+class TestWikipediaCache:
+    """Test cases for the bounded / persistent Wikipedia cache"""
+
+    @pytest.mark.unit
+    def test_negative_results_use_short_ttl(self):
+        """Negative (None) results expire after the negative TTL"""
+        from app.core.wikipedia_service import WikipediaCache
+
+        cache = WikipediaCache("concept", "ko", ttl_seconds=1000, negative_ttl_seconds=10)
+        with patch('app.core.ttl_cache.time.monotonic', return_value=0.0):
+            cache["missing"] = None
+            cache["found"] = {"title": "found"}
+        with patch('app.core.ttl_cache.time.monotonic', return_value=20.0):
+            assert "missing" not in cache
+            assert cache.get("found") == {"title": "found"}
+
+    @pytest.mark.unit
+    def test_size_limit(self):
+        """Cache keeps at most max_entries items"""
+        from app.core.wikipedia_service import WikipediaCache
+
+        cache = WikipediaCache("search", "ko", max_entries=2)
+        for i in range(5):
+            cache[f"q{i}"] = f"r{i}"
+
+        assert len(cache) == 2
+        assert "q4" in cache
+
+    @pytest.mark.unit
+    @patch('wikipedia.search')
+    def test_persistent_store_survives_new_instance(self, mock_search, tmp_path):
+        """Results written to SQLite are served by a fresh service without an API call"""
+        db_path = str(tmp_path / "wiki_cache.db")
+        mock_search.return_value = ["Python (programming language)"]
+
+        first = WikipediaService(cache_db_path=db_path)
+        assert first.search_concept("Python") == "Python (programming language)"
+
+        second = WikipediaService(cache_db_path=db_path)
+        second._search_cache.clear(persistent=False)
+        assert second.search_concept("Python") == "Python (programming language)"
+        assert mock_search.call_count == 1
+        assert second.get_cache_stats()["persistent"] is True
+
+    @pytest.mark.unit
+    def test_shared_service_is_reused(self):
+        """get_wikipedia_service returns a single process-wide instance"""
+        from app.core.wikipedia_service import get_wikipedia_service
+
+        assert get_wikipedia_service() is get_wikipedia_service()
@@ -0,0 +1,126 @@
+"""
+NER 백엔드별 처리량 / 메모리(RSS) / 엔티티 일치율 비교
+
+실행 (저장소 루트에서):
+    python -m benchmarks.ner_backends --texts resumes.txt --backends torch torch-int8 onnx
+
+--texts 는 한 줄에 한 문서(빈 줄 제외)인 UTF-8 파일이며, 생략하면 내장 샘플을 사용합니다.
+RSS가 서로 섞이지 않도록 백엔드마다 별도 프로세스에서 로드/추론하며,
+일치율은 첫 번째 백엔드(기본 torch)의 (라벨, 시작, 끝) 엔티티를 기준으로 계산합니다.
+torch 대체 없이 요청한 백엔드 그대로 로드하므로, 선택 의존성이 없는 백엔드(onnx는 optimum[onnxruntime])는
+다른 백엔드 수치로 측정되지 않고 "unavailable"로 표시됩니다.
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+SAMPLE_TEXTS = [
+    "My name is John Smith and I live in Seoul, Korea.",
+    "이름: 김철수\n이메일: kim.cs@example.com\n주소: 서울시 강남구 테헤란로 123",
+    "Jane Doe worked at Samsung Electronics in Suwon from 2019 to 2023.",
+    "홍길동은 KAIST에서 전산학을 전공하고 네이버에서 백엔드 개발자로 근무했습니다.",
+    "Contact Michael Johnson at the Berlin office for the Python backend position.",
+]
+
+Entity = Tuple[str, int, int]
+
+
+def _max_rss_mb() -> float:
+    # Linux는 KB, macOS는 바이트 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run_backend(backend: str, texts: List[str], repeat: int, queue) -> None:
+    from app.resume.ner_backend import load_ner_pipeline
+
+    baseline_rss = _max_rss_mb()
+    start = time.perf_counter()
+    try:
+        ner = load_ner_pipeline(backend, fallback=False)
+    except ImportError as e:
+        queue.put({"backend": backend, "error": str(e)})
+        return
+    load_seconds = time.perf_counter() - start
+
+    ner(texts[0])  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        outputs = [ner(text) for text in texts]
+    elapsed = time.perf_counter() - start
+
+    entities = [
+        [(ent["entity_group"], int(ent["start"]), int(ent["end"])) for ent in output]
+        for output in outputs
+    ]
+    queue.put({
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "texts_per_second": len(texts) * repeat / elapsed,
+        "rss_mb": _max_rss_mb(),
+        "model_rss_mb": _max_rss_mb() - baseline_rss,
+        "entities": entities,
+    })
+
+
+def entity_agreement(reference: List[List[Entity]], candidate: List[List[Entity]]) -> Dict[str, float]:
+    """문서별 (라벨, 시작, 끝) 완전 일치 기준 micro precision / recall / F1"""
+    matched = predicted = expected = 0
+    for ref_entities, cand_entities in zip(reference, candidate):
+        ref_set: Set[Entity] = set(ref_entities)
+        cand_set: Set[Entity] = set(cand_entities)
+        matched += len(ref_set & cand_set)
+        predicted += len(cand_set)
+        expected += len(ref_set)
+
+    precision = matched / predicted if predicted else 1.0
+    recall = matched / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="PII NER 백엔드 벤치마크")
+    parser.add_argument("--texts", help="한 줄에 한 문서인 텍스트 파일")
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch-int8", "onnx"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.texts:
+        with open(args.texts, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = SAMPLE_TEXTS
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in args.backends:
+        queue = ctx.Queue()
+        process = ctx.Process(target=_run_backend, args=(backend, texts, args.repeat, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        if "error" in result:
+            print(f"⚠️ {backend}: unavailable ({result['error']})")
+            continue
+        results.append(result)
+
+    if not results:
+        sys.exit("No NER backend could be loaded")
+    reference = results[0]
+    print(f"{len(texts)} texts x {args.repeat} repeats, reference backend: {reference['backend']}\n")
+    print(f"{'backend':<12}{'load(s)':>9}{'texts/s':>10}{'RSS(MB)':>10}{'model(MB)':>11}{'P':>7}{'R':>7}{'F1':>7}")
+    for result in results:
+        agreement = entity_agreement(reference["entities"], result["entities"])
+        print(
+            f"{result['backend']:<12}{result['load_seconds']:>9.1f}{result['texts_per_second']:>10.2f}"
+            f"{result['rss_mb']:>10.0f}{result['model_rss_mb']:>11.0f}"
+            f"{agreement['precision']:>7.3f}{agreement['recall']:>7.3f}{agreement['f1']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+PDF 텍스트 추출기별 속도 / 텍스트 충실도 비교 (pdfplumber 결과 기준)
+
+실행 (저장소 루트에서):
+    python -m benchmarks.pdf_extractors --corpus ./resume_pdfs --repeat 3
+
+--corpus 디렉터리의 *.pdf 를 사용하며, 생략하면 영문 텍스트 레이어만 있는 합성 PDF(1/5/20 페이지)를 생성합니다.
+충실도는 pdfplumber 전체 추출 결과를 기준으로
+- order: 단어 순서를 고려한 유사도 (difflib, 단 순서가 섞이면 낮아짐)
+- bag_f1: 순서를 무시한 단어 집합 F1
+을 계산하며, fallback 열은 pdfplumber로 재추출된 페이지 수입니다.
+"""
+import argparse
+import difflib
+import io
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+from app.resume import parser
+
+EXTRACTORS = ("pdfplumber", "pdfium")
+SAMPLE_LINES = [
+    "Hong Gildong Backend Engineer hong.gildong@example.com",
+    "2021-2024 Platform team - designed asynchronous API servers for high traffic",
+    "Skills: Python FastAPI Kubernetes PostgreSQL Redis Kafka",
+    "Projects: recommendation system, realtime log pipeline, search quality",
+]
+
+
+def make_pdf(page_count: int, lines_per_page: int = 40) -> bytes:
+    """Helvetica 텍스트 줄만 있는 최소 PDF 생성"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(page_count):
+        lines = [SAMPLE_LINES[(page + i) % len(SAMPLE_LINES)] for i in range(lines_per_page)]
+        stream = "BT /F1 10 Tf 12 TL 50 770 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+def load_corpus(corpus: str) -> List[Tuple[str, bytes]]:
+    if not corpus:
+        return [(f"synthetic-{pages}p", make_pdf(pages)) for pages in (1, 5, 20)]
+    paths = sorted(Path(corpus).glob("*.pdf"))
+    if not paths:
+        raise SystemExit(f"{corpus} 에 PDF 파일이 없습니다")
+    return [(path.name, path.read_bytes()) for path in paths]
+
+
+def order_similarity(reference: str, candidate: str) -> float:
+    return difflib.SequenceMatcher(None, reference.split(), candidate.split(), autojunk=False).ratio()
+
+
+def bag_f1(reference: str, candidate: str) -> float:
+    ref, cand = Counter(reference.split()), Counter(candidate.split())
+    overlap = sum((ref & cand).values())
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / sum(cand.values()), overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def _extract(name: str, pdf_bytes: bytes) -> Tuple[str, int]:
+    retried: List[int] = []
+    original = parser.FALLBACK_EXTRACTOR.extract_pages
+
+    def counting_fallback(source, pages):
+        retried.extend(pages)
+        return original(source, pages)
+
+    # 프로세스 풀 없이 추출기 자체 비용만 측정
+    with patch.object(parser, "get_pdf_pool", return_value=None), \
+         patch.object(parser.FALLBACK_EXTRACTOR, "extract_pages", side_effect=counting_fallback):
+        pages = parser._extract_pages(pdf_bytes, name)
+    fallback_pages = len(retried) if name != parser.FALLBACK_EXTRACTOR.name else 0
+    return "\n".join(pages), fallback_pages
+
+
+def main(argv=None) -> None:
+    arg_parser = argparse.ArgumentParser(description="PDF 텍스트 추출기 벤치마크")
+    arg_parser.add_argument("--corpus", default="", help="PDF 파일 디렉터리")
+    arg_parser.add_argument("--extractors", nargs="+", default=list(EXTRACTORS), choices=list(parser.PDF_EXTRACTORS))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    totals: Dict[str, float] = {name: 0.0 for name in args.extractors}
+    print(f"{'document':<28}{'extractor':<12}{'ms':>10}{'order':>8}{'bag_f1':>8}{'fallback':>10}")
+    for document, pdf_bytes in load_corpus(args.corpus):
+        reference, _ = _extract(parser.FALLBACK_EXTRACTOR.name, pdf_bytes)
+        for name in args.extractors:
+            text, fallback_pages = _extract(name, pdf_bytes)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                _extract(name, pdf_bytes)
+            elapsed_ms = (time.perf_counter() - start) / args.repeat * 1000
+            totals[name] += elapsed_ms
+            print(f"{document[:27]:<28}{name:<12}{elapsed_ms:>10.1f}"
+                  f"{order_similarity(reference, text):>8.3f}{bag_f1(reference, text):>8.3f}{fallback_pages:>10}")
+
+    print()
+    for name, total in totals.items():
+        print(f"{name:<12} total {total:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
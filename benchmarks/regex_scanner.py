@@ -0,0 +1,70 @@
+"""
+정규식 PII 탐지 마이크로 벤치마크: 항목별 re.findall 13회 vs 단일 결합 패턴 스캔
+
+실행 (저장소 루트에서):
+    python -m benchmarks.regex_scanner --pages 1 5 10 20 --repeat 20
+"""
+import argparse
+import random
+import re
+import time
+from app.core.regex_utils import PII_PATTERNS, detect_regex_pii
+
+PAGE_TEMPLATE = """성 명 {name} 영 문 Hong Gildong
+연 락 처 010-{a:04d}-{b:04d} 생년월일 19{yy:02d}.0{m}.1{d}
+이메일: user{a}@example.com 깃허브: https://github.com/user{b}
+주소: 서울 테헤란로 {a} / 경기 분당동 {b}
+학력사항: 2015-2018 서울고등학교 졸업, 2018-2024 한국대학교 컴퓨터공학과 졸업
+경력: 2021-2024 백엔드 개발자 - 대규모 트래픽 처리를 위한 비동기 API 서버 설계 및 운영
+프로젝트: 추천 시스템 개발, 실시간 로그 수집 파이프라인 구축, 검색 품질 개선
+자격증: 정보처리기사 (2023.02.20), 빅데이터분석기사 (2021.10.01)
+"""
+FILLER = "기술 스택: Python, FastAPI, Kubernetes, PostgreSQL, Redis, Kafka 를 활용한 서비스 개발 경험.\n"
+LINES_PER_PAGE = 40
+
+
+def make_resume(pages: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(pages):
+        parts.append(PAGE_TEMPLATE.format(
+            name=rng.choice(["김철수", "이영희", "박민수"]), a=rng.randint(0, 9999), b=rng.randint(0, 9999),
+            yy=rng.randint(70, 99), m=rng.randint(1, 9), d=rng.randint(0, 9)
+        ))
+        parts.append(FILLER * (LINES_PER_PAGE - PAGE_TEMPLATE.count("\n")))
+    return "".join(parts)
+
+
+def legacy_detect_regex_pii(text: str):
+    detected = {}
+    for label, pattern in PII_PATTERNS.items():
+        matches = re.findall(pattern, text)
+        if matches:
+            detected[label] = list(set(matches))
+    return detected
+
+
+def _time(fn, text: str, repeat: int) -> float:
+    fn(text)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="정규식 PII 탐지 벤치마크")
+    parser.add_argument("--pages", nargs="+", type=int, default=[1, 5, 10, 20])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"{'pages':>5}{'chars':>9}{'findall(ms)':>13}{'scan(ms)':>10}{'speedup':>9}")
+    for pages in args.pages:
+        text = make_resume(pages)
+        legacy_ms = _time(legacy_detect_regex_pii, text, args.repeat)
+        scan_ms = _time(detect_regex_pii, text, args.repeat)
+        print(f"{pages:>5}{len(text):>9}{legacy_ms:>13.2f}{scan_ms:>10.2f}{legacy_ms / scan_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()